@@ -22,7 +22,7 @@ import numpy as np
 import pandas as pd
 from fastapi import FastAPI, File, Form, Header, HTTPException, Query, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
@@ -31,7 +31,7 @@ from src.parsers.csv_parser import DataQuality, ParsedData, load_csv, _assess_qu
 from src.utils.logger import get_logger
 
 logger = get_logger("api")
-from src.analyzers.gap_analyzer import detect_gaps, summarize_gaps
+from src.analyzers.gap_analyzer import detect_gap_table, summarize_gaps
 from src.analyzers.sr_calculator import calculate_levels, summarize_levels
 from src.analyzers.supply_demand import identify_zones, summarize_zones
 from src.orchestrator import TradingAnalysisOrchestrator
@@ -39,7 +39,7 @@ from src.utils.cache import AnalysisCache
 from src.utils.csv_parser import auto_detect_csv
 from src.utils.sanitize import sanitize_ticker
 from src.utils.stock_fetcher import fetch_stock_data
-from src.utils.tier_config import list_tiers, list_tiers_detailed
+from src.utils.tier_config import get_tiers_detailed_json, list_tiers
 
 limiter = Limiter(
     key_func=get_remote_address,
@@ -199,7 +199,7 @@ def _run_full_analysis(parsed: ParsedData, min_gap_pct: float) -> dict:
     df = parsed.df
     current_price = float(df["close"].iloc[-1])
 
-    gaps = detect_gaps(df, min_gap_pct=min_gap_pct)
+    gaps = detect_gap_table(df, min_gap_pct=min_gap_pct)
     levels = calculate_levels(df, current_price=current_price)
     zones = identify_zones(df)
 
@@ -307,7 +307,7 @@ async def analyze_gaps(
     except ValueError as e:
         raise HTTPException(422, f"CSV parse error: {e}")
 
-    gaps = detect_gaps(parsed.df, min_gap_pct=min_gap_pct)
+    gaps = detect_gap_table(parsed.df, min_gap_pct=min_gap_pct)
     return {
         "metadata": _metadata(parsed),
         "gaps": summarize_gaps(gaps),
@@ -371,7 +371,7 @@ async def config_tiers():
     Single source of truth — frontend fetches this on load to populate
     tier selectors, pricing cards, and feature comparisons.
     """
-    return list_tiers_detailed()
+    return Response(get_tiers_detailed_json(), media_type="application/json")
 
 
 @app.post("/analyze/full")
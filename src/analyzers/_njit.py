@@ -0,0 +1,25 @@
+"""Optional Numba JIT shim for analyzer hot loops.
+
+Numba is listed in requirements.txt but stays optional at runtime. When
+it is installed, ``njit`` compiles the decorated function to machine code;
+otherwise it returns the plain Python function unchanged so results are
+identical either way. ``types`` (for eager signatures) is None without
+Numba.
+"""
+
+try:
+    from numba import njit, types
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - depends on environment
+    HAS_NUMBA = False
+    types = None  # type: ignore[assignment]
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """No-op stand-in for ``numba.njit`` (bare or with options)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+__all__ = ["HAS_NUMBA", "njit", "types"]
@@ -0,0 +1,21 @@
+"""Vectorized rounding that agrees with the builtin round()."""
+
+import numpy as np
+
+
+def round2(values: np.ndarray) -> np.ndarray:
+    """Vectorized round(x, 2) that matches the builtin exactly.
+
+    np.round scales by 100 first, which can land an inexact value on a
+    .5 tie and round it the wrong way; those few near-ties defer to round().
+    """
+    scaled = values * 100
+    out = np.round(scaled) / 100
+    with np.errstate(invalid="ignore"):
+        near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_tie).tolist():
+        out[i] = round(float(values[i]), 2)
+    return out
+
+
+__all__ = ["round2"]
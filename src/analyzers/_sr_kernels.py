@@ -0,0 +1,106 @@
+"""Compiled inner loops for the S/R calculator.
+
+Each kernel makes a single pass over plain OHLCV or level arrays. They
+are only called when Numba is available (see ``_njit.HAS_NUMBA``);
+sr_calculator falls back to equivalent NumPy/Python code otherwise. ``nogil`` lets
+several timeframes be analyzed on worker threads at once.
+"""
+
+import numpy as np
+
+from src.analyzers._njit import njit
+
+
+@njit(cache=True, nogil=True)
+def count_touches_kernel(low, high, close, zone_low, zone_high, break_side):
+    """Return (touches, breaks, last_idx) arrays, one entry per zone.
+
+    ``break_side`` is 1 for support (close below the zone breaks it),
+    -1 for resistance (close above breaks it) and 0 when breaks are not
+    counted. ``last_idx`` is -1 when no bar touched the zone.
+    """
+    num_levels = zone_low.shape[0]
+    touches = np.zeros(num_levels, dtype=np.int64)
+    breaks = np.zeros(num_levels, dtype=np.int64)
+    last_idx = np.full(num_levels, -1, dtype=np.int64)
+    for k in range(num_levels):
+        zl = zone_low[k]
+        zh = zone_high[k]
+        side = break_side[k]
+        for i in range(low.shape[0]):
+            # A bar touches the zone if its range overlaps with the zone
+            if low[i] <= zh and high[i] >= zl:
+                touches[k] += 1
+                last_idx[k] = i
+                if side == 1 and close[i] < zl:
+                    breaks[k] += 1
+                elif side == -1 and close[i] > zh:
+                    breaks[k] += 1
+    return touches, breaks, last_idx
+
+
+@njit(cache=True, nogil=True)
+def volume_profile_kernel(lows, highs, volumes, price_min, bin_size, num_bins):
+    """Spread each bar's volume evenly over the price bins it spans."""
+    profile = np.zeros(num_bins)
+    for i in range(lows.shape[0]):
+        if np.isnan(volumes[i]) or np.isnan(lows[i]) or np.isnan(highs[i]):
+            continue
+        low_bin = max(0, int((lows[i] - price_min) / bin_size))
+        high_bin = min(num_bins - 1, int((highs[i] - price_min) / bin_size))
+        bins_spanned = high_bin - low_bin + 1
+        if bins_spanned > 0:
+            vol_per_bin = volumes[i] / bins_spanned
+            for b in range(low_bin, high_bin + 1):
+                profile[b] += vol_per_bin
+    return profile
+
+
+@njit(cache=True, nogil=True)
+def merge_levels_kernel(prices, priorities, strengths, merge_threshold):
+    """Sequentially merge price-sorted levels closer than merge_threshold.
+
+    Each level is compared with the last kept level. The one with the
+    higher source priority is kept and its strength boosted (capped at 10).
+    Returns the kept positions and the updated strengths of every level.
+    """
+    strengths = strengths.copy()
+    keep = np.empty(prices.shape[0], dtype=np.int64)
+    keep[0] = 0
+    num_kept = 1
+    for i in range(1, prices.shape[0]):
+        last = keep[num_kept - 1]
+        if abs(prices[i] - prices[last]) <= merge_threshold:
+            if priorities[i] > priorities[last]:
+                strengths[i] = min(10, strengths[last] + 1)
+                keep[num_kept - 1] = i
+            else:
+                strengths[last] = min(10, strengths[last] + 1)
+        else:
+            keep[num_kept] = i
+            num_kept += 1
+    return keep[:num_kept], strengths
+
+
+@njit(cache=True, nogil=True)
+def swing_flags_kernel(highs, lows, window):
+    """Flag bars whose high/low is the extreme of the centered window.
+
+    Covers centers ``window .. n - window - 1``. The running max/min only
+    replaces on a strict comparison, like builtin max()/min(), so a window
+    that starts with NaN never matches and later NaNs are skipped.
+    """
+    num_centers = highs.shape[0] - 2 * window
+    is_high = np.zeros(num_centers, dtype=np.bool_)
+    is_low = np.zeros(num_centers, dtype=np.bool_)
+    for c in range(num_centers):
+        hi = highs[c]
+        lo = lows[c]
+        for k in range(c + 1, c + 2 * window + 1):
+            if highs[k] > hi:
+                hi = highs[k]
+            if lows[k] < lo:
+                lo = lows[k]
+        is_high[c] = highs[c + window] == hi
+        is_low[c] = lows[c + window] == lo
+    return is_high, is_low
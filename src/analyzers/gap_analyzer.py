@@ -7,19 +7,49 @@ Component 2 per PRD.md specification.
 No LLM cost - pure Python/math.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
+from enum import IntEnum
 from typing import Optional
 
 import numpy as np
 import pandas as pd
 
+from src.analyzers._njit import HAS_NUMBA, njit, types
+from src.analyzers._rounding import round2
 from src.utils.logger import get_logger
 
 logger = get_logger("gap_analyzer")
 
 
-@dataclass
+class Direction(IntEnum):
+    """GapTable.direction codes."""
+
+    UP = 0
+    DOWN = 1
+
+
+class GapType(IntEnum):
+    """GapTable.gap_type codes."""
+
+    COMMON = 0
+    BREAKAWAY = 1
+    RUNAWAY = 2
+    EXHAUSTION = 3
+
+
+# Code → label, used only when rows become Gap objects / JSON
+_DIR_STR = ("up", "down")
+_TYPE_STR = ("common", "breakaway", "runaway", "exhaustion")
+
+_GAP_EXPLANATION = (
+    "Gaps form when price opens significantly above or below "
+    "the previous close. Unfilled gaps often act as magnets — "
+    "price tends to return to fill them."
+)
+
+
+@dataclass(slots=True, frozen=True)
 class Gap:
     """Represents a detected price gap."""
 
@@ -46,16 +76,20 @@ class Gap:
 
     @property
     def days_ago(self) -> Optional[int]:
+        return self._days_before(datetime.now())
+
+    def _days_before(self, now: datetime) -> Optional[int]:
         if self.date is None:
             return None
         try:
-            delta = datetime.now() - self.date
+            delta = now - self.date
             return delta.days
         except Exception:
             return None
 
-    def to_dict(self) -> dict:
-        days = self.days_ago
+    def to_dict(self, now: Optional[datetime] = None) -> dict:
+        """Serialize for output. Pass ``now`` to share one clock read across gaps."""
+        days = self._days_before(now or datetime.now())
         return {
             "date": self.date.isoformat() if isinstance(self.date, datetime) else str(self.date),
             "direction": self.direction,
@@ -74,6 +108,140 @@ class Gap:
         }
 
 
+@dataclass(slots=True)
+class GapTable:
+    """Columnar gap storage: one row-aligned NumPy array per Gap field.
+
+    Sorting, filtering and counting run as array operations; rows are
+    materialized as Gap objects only at the output boundary via to_gaps().
+    """
+
+    date: np.ndarray  # datetime64[ns]
+    direction: np.ndarray  # int8 Direction codes
+    gap_low: np.ndarray  # float64
+    gap_high: np.ndarray  # float64
+    size: np.ndarray  # float64
+    size_pct: np.ndarray  # float64
+    gap_type: np.ndarray  # int8 GapType codes
+    filled: np.ndarray  # bool
+    fill_pct: np.ndarray  # float64
+    fill_date: np.ndarray  # datetime64[ns], NaT when price never re-entered
+    bars_since: np.ndarray  # int32
+    severity: np.ndarray  # int32
+
+    @classmethod
+    def empty(cls) -> "GapTable":
+        no_dates = np.empty(0, dtype="datetime64[ns]")
+        no_floats = np.empty(0, dtype=np.float64)
+        return cls(
+            date=no_dates,
+            direction=np.empty(0, dtype=np.int8),
+            gap_low=no_floats,
+            gap_high=no_floats,
+            size=no_floats,
+            size_pct=no_floats,
+            gap_type=np.empty(0, dtype=np.int8),
+            filled=np.empty(0, dtype=bool),
+            fill_pct=no_floats,
+            fill_date=no_dates,
+            bars_since=np.empty(0, dtype=np.int32),
+            severity=np.empty(0, dtype=np.int32),
+        )
+
+    def __len__(self) -> int:
+        return len(self.severity)
+
+    def __getitem__(self, rows) -> "GapTable":
+        """Select rows by boolean mask or integer index array."""
+        return GapTable(**{f.name: getattr(self, f.name)[rows] for f in fields(self)})
+
+    @property
+    def is_unfilled(self) -> np.ndarray:
+        return ~self.filled
+
+    def to_dicts(self, now: Optional[datetime] = None) -> list[dict]:
+        """Serialize rows exactly like Gap.to_dict(), one column at a time."""
+        now = now or datetime.now()
+        dates = self.date.astype("datetime64[us]").tolist()
+        fill_dates = self.fill_date.astype("datetime64[us]").tolist()
+        return [
+            {
+                "date": date.isoformat(),
+                "direction": _DIR_STR[direction],
+                "gap_low": gap_low,
+                "gap_high": gap_high,
+                "range": f"${raw_low:.2f} - ${raw_high:.2f}",
+                "size": size,
+                "size_pct": size_pct,
+                "gap_type": _TYPE_STR[gap_type],
+                "filled": filled,
+                "fill_pct": fill_pct,
+                "fill_date": fill_date.isoformat() if fill_date else None,
+                "bars_since": bars_since,
+                "days_ago": (now - date).days,
+                "severity": severity,
+            }
+            for (
+                date, direction, gap_low, gap_high, raw_low, raw_high, size,
+                size_pct, gap_type, filled, fill_pct, fill_date, bars_since, severity,
+            ) in zip(
+                dates,
+                self.direction.tolist(),
+                round2(self.gap_low).tolist(),
+                round2(self.gap_high).tolist(),
+                self.gap_low.tolist(),
+                self.gap_high.tolist(),
+                round2(self.size).tolist(),
+                round2(self.size_pct).tolist(),
+                self.gap_type.tolist(),
+                self.filled.tolist(),
+                round2(self.fill_pct).tolist(),
+                fill_dates,
+                self.bars_since.tolist(),
+                self.severity.tolist(),
+            )
+        ]
+
+    def to_gaps(self) -> list[Gap]:
+        """Materialize the rows as Gap objects."""
+        # datetime64[us] converts straight to datetime objects (NaT -> None)
+        dates = self.date.astype("datetime64[us]").tolist()
+        fill_dates = self.fill_date.astype("datetime64[us]").tolist()
+        return [
+            Gap(
+                date=date,
+                direction=_DIR_STR[direction],
+                gap_low=gap_low,
+                gap_high=gap_high,
+                size=size,
+                size_pct=size_pct,
+                gap_type=_TYPE_STR[gap_type],
+                filled=filled,
+                fill_pct=fill_pct,
+                fill_date=fill_date,
+                bars_since=bars_since,
+                severity=severity,
+            )
+            for (
+                date, direction, gap_low, gap_high, size, size_pct,
+                gap_type, filled, fill_pct, fill_date, bars_since, severity,
+            ) in zip(
+                dates,
+                self.direction.tolist(),
+                self.gap_low.tolist(),
+                self.gap_high.tolist(),
+                self.size.tolist(),
+                self.size_pct.tolist(),
+                self.gap_type.tolist(),
+                self.filled.tolist(),
+                self.fill_pct.tolist(),
+                fill_dates,
+                self.bars_since.tolist(),
+                self.severity.tolist(),
+            )
+        ]
+
+
 def detect_gaps(
     df: pd.DataFrame,
     min_gap_pct: float = 0.5,
@@ -96,95 +264,58 @@ def detect_gaps(
     """
     if len(df) < 2:
         return []
+    return detect_gap_table(df, min_gap_pct, include_body_gaps).to_gaps()
 
-    gaps = []
-    seen_dates: set[str] = set()  # Avoid duplicate gaps on same bar
-
-    for i in range(1, len(df)):
-        prev_high = df["high"].iloc[i - 1]
-        prev_low = df["low"].iloc[i - 1]
-        prev_close = df["close"].iloc[i - 1]
-        curr_high = df["high"].iloc[i]
-        curr_low = df["low"].iloc[i]
-        curr_open = df["open"].iloc[i]
-        curr_time = df["time"].iloc[i]
-        date_key = str(curr_time)
-
-        # --- Wick gaps (classic: no overlap between bars) ---
-
-        # Gap up: current low > previous high
-        if curr_low > prev_high:
-            size = curr_low - prev_high
-            size_pct = (size / prev_close) * 100
-            if size_pct >= min_gap_pct:
-                gap = _build_gap(df, i, prev_high, curr_low, size, size_pct, "up")
-                gaps.append(gap)
-                seen_dates.add(date_key)
-
-        # Gap down: current high < previous low
-        elif curr_high < prev_low:
-            size = prev_low - curr_high
-            size_pct = (size / prev_close) * 100
-            if size_pct >= min_gap_pct:
-                gap = _build_gap(df, i, curr_high, prev_low, size, size_pct, "down")
-                gaps.append(gap)
-                seen_dates.add(date_key)
-
-        # --- Body gaps (open vs prev close) ---
-        elif include_body_gaps and date_key not in seen_dates:
-            body_gap = curr_open - prev_close
-            body_gap_pct = abs(body_gap / prev_close) * 100
-
-            if body_gap_pct >= min_gap_pct:
-                if body_gap > 0:
-                    # Body gap up
-                    gap = _build_gap(
-                        df, i, prev_close, curr_open,
-                        abs(body_gap), body_gap_pct, "up",
-                    )
-                    gaps.append(gap)
-                else:
-                    # Body gap down
-                    gap = _build_gap(
-                        df, i, curr_open, prev_close,
-                        abs(body_gap), body_gap_pct, "down",
-                    )
-                    gaps.append(gap)
 
-    logger.info(
-        f"Detected {len(gaps)} gaps (min {min_gap_pct}%): "
-        f"{sum(1 for g in gaps if g.direction == 'up')} up, "
-        f"{sum(1 for g in gaps if g.direction == 'down')} down, "
-        f"{sum(1 for g in gaps if g.is_unfilled)} unfilled"
-    )
-
-    return gaps
+def detect_gap_table(
+    df: pd.DataFrame,
+    min_gap_pct: float = 0.5,
+    include_body_gaps: bool = True,
+) -> GapTable:
+    """Detect price gaps into columnar storage.
 
+    Same detection as detect_gaps(), without building a Gap object per
+    row. Pass the result straight to prioritize_gaps, get_unfilled_gaps
+    or summarize_gaps.
+    """
+    if len(df) < 2:
+        return GapTable.empty()
 
-def _build_gap(
-    df: pd.DataFrame,
-    bar_idx: int,
-    gap_low: float,
-    gap_high: float,
-    size: float,
-    size_pct: float,
-    direction: str,
-) -> Gap:
-    """Construct a Gap object with fill check, classification, and severity."""
-    curr_time = df["time"].iloc[bar_idx]
-
-    filled, fill_pct, fill_date = _check_fill(
-        df, bar_idx, gap_low, gap_high, direction
+    # Contiguous float64 columns keep the scans below purely sequential
+    times = pd.to_datetime(df["time"]).to_numpy(dtype="datetime64[ns]")
+    open_, high, low, close = (
+        _float_column(df, col) for col in ("open", "high", "low", "close")
+    )
+    bar_idx, is_up, gap_low, gap_high, size, size_pct = _find_gap_candidates(
+        open_, high, low, close, times, min_gap_pct, include_body_gaps
     )
-    gap_type = _classify_gap(df, bar_idx, size_pct, direction)
-    bars_since = len(df) - 1 - bar_idx
-    severity = _calculate_severity(
-        size_pct, gap_type, filled, bars_since, df, bar_idx
+    if len(bar_idx) == 0:
+        # No gap bars (common for smooth data): skip the fill and context passes
+        logger.info(f"Detected 0 gaps (min {min_gap_pct}%): 0 up, 0 down, 0 unfilled")
+        return GapTable.empty()
+
+    # Volume is optional; check it once rather than per gap
+    volume = None
+    if "volume" in df.columns:
+        volume = _float_column(df, "volume")
+        if np.isnan(volume).all():
+            volume = None
+
+    filled, fill_pct, fill_idx = _fill_status(
+        low, high, bar_idx, gap_low, gap_high, is_up
     )
 
-    return Gap(
-        date=pd.Timestamp(curr_time).to_pydatetime(),
-        direction=direction,
+    total_bars = len(df)
+    bars_since = total_bars - 1 - bar_idx
+    gap_type = _classify_gaps(high, low, close, volume, bar_idx, size_pct)
+    severity = _calculate_severity(size_pct, gap_type, filled, bars_since, total_bars)
+
+    fill_date = times[fill_idx]
+    fill_date[fill_idx < 0] = np.datetime64("NaT")
+
+    table = GapTable(
+        date=times[bar_idx],
+        direction=np.where(is_up, Direction.UP, Direction.DOWN).astype(np.int8),
         gap_low=gap_low,
         gap_high=gap_high,
         size=size,
@@ -193,121 +324,306 @@ def _build_gap(
         filled=filled,
         fill_pct=fill_pct,
         fill_date=fill_date,
-        bars_since=bars_since,
+        bars_since=bars_since.astype(np.int32),
         severity=severity,
     )
 
+    up_count = int(np.count_nonzero(is_up))
+    logger.info(
+        f"Detected {len(table)} gaps (min {min_gap_pct}%): "
+        f"{up_count} up, "
+        f"{len(table) - up_count} down, "
+        f"{int(np.count_nonzero(table.is_unfilled))} unfilled"
+    )
+
+    return table
 
-def _check_fill(
-    df: pd.DataFrame,
-    gap_bar_idx: int,
-    gap_low: float,
-    gap_high: float,
-    direction: str,
-) -> tuple[bool, float, Optional[datetime]]:
-    """Check if a gap has been filled by subsequent price action.
+
+def _float_column(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Extract a column as a read-only C-contiguous float64 array (NA -> NaN).
+
+    Always read-only, whether or not pandas had to copy, so the compiled
+    kernels see a single array type.
+    """
+    values = np.ascontiguousarray(df[col].to_numpy(dtype=np.float64, na_value=np.nan))
+    values.flags.writeable = False
+    return values
+
+
+def _find_gap_candidates(
+    o: np.ndarray,
+    h: np.ndarray,
+    l: np.ndarray,
+    c: np.ndarray,
+    times: np.ndarray,
+    min_gap_pct: float,
+    include_body_gaps: bool,
+) -> tuple[np.ndarray, ...]:
+    """Locate gap bars with vectorized comparisons against the prior bar.
+
+    Returns:
+        Parallel arrays (bar_idx, is_up, gap_low, gap_high, size, size_pct),
+        ordered by bar index.
+    """
+    prev_high, prev_low, prev_close = h[:-1], l[:-1], c[:-1]
+    curr_high, curr_low, curr_open = h[1:], l[1:], o[1:]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Wick gaps (classic: no overlap between bars)
+        wick_up = curr_low > prev_high
+        wick_down = ~wick_up & (curr_high < prev_low)
+        wick_size = np.where(wick_up, curr_low - prev_high, prev_low - curr_high)
+        wick_pct = (wick_size / prev_close) * 100
+
+        # Body gaps (open vs prev close) only apply where wicks overlap
+        body_gap = curr_open - prev_close
+        body_pct = np.abs(body_gap / prev_close) * 100
+
+    is_wick = wick_up | wick_down
+    wick_pos = np.flatnonzero(is_wick & (wick_pct >= min_gap_pct))
+    if include_body_gaps:
+        body_pos = np.flatnonzero(~is_wick & (body_pct >= min_gap_pct))
+        body_pos = _drop_seen_timestamps(times[1:], body_pos, wick_pos)
+    else:
+        body_pos = np.empty(0, dtype=np.intp)
+
+    body_up = body_gap[body_pos] > 0
+    pos = np.concatenate([wick_pos, body_pos])
+    is_up = np.concatenate([wick_up[wick_pos], body_up])
+    gap_low = np.concatenate([
+        np.where(wick_up[wick_pos], prev_high[wick_pos], curr_high[wick_pos]),
+        np.where(body_up, prev_close[body_pos], curr_open[body_pos]),
+    ])
+    gap_high = np.concatenate([
+        np.where(wick_up[wick_pos], curr_low[wick_pos], prev_low[wick_pos]),
+        np.where(body_up, curr_open[body_pos], prev_close[body_pos]),
+    ])
+    size = np.concatenate([wick_size[wick_pos], np.abs(body_gap[body_pos])])
+    size_pct = np.concatenate([wick_pct[wick_pos], body_pct[body_pos]])
+
+    order = np.argsort(pos, kind="stable")
+    return (
+        pos[order] + 1,
+        is_up[order],
+        gap_low[order],
+        gap_high[order],
+        size[order],
+        size_pct[order],
+    )
+
+
+def _drop_seen_timestamps(
+    times: np.ndarray, body_pos: np.ndarray, wick_pos: np.ndarray
+) -> np.ndarray:
+    """Skip body gaps on bars whose timestamp already produced an earlier wick gap."""
+    if len(body_pos) == 0 or len(wick_pos) == 0:
+        return body_pos
+
+    wick_times = pd.Index(times[wick_pos])
+    first = ~wick_times.duplicated()
+    seen_at = wick_pos[first]
+    match = wick_times[first].get_indexer(times[body_pos])
+    seen = (match >= 0) & (seen_at[match] < body_pos)
+    return body_pos[~seen]
+
+
+def _fill_status(
+    low: np.ndarray,
+    high: np.ndarray,
+    bar_idx: np.ndarray,
+    gap_low: np.ndarray,
+    gap_high: np.ndarray,
+    is_up: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Check whether gaps have been filled by subsequent price action.
 
     A gap up is filled when price trades down to gap_low.
     A gap down is filled when price trades up to gap_high.
+
+    The deepest retracement after a bar only depends on the lowest low
+    (or highest high) that follows it, so suffix extremes are computed in
+    one reverse pass and every gap is resolved against them at once.
+
+    Returns:
+        Parallel arrays (filled, fill_pct, fill_idx). ``fill_idx`` is the
+        filling bar, or the bar of deepest partial fill, or -1 when price
+        never re-entered the gap.
     """
-    max_fill = 0.0
-    fill_date = None
+    n = len(low)
+    idx = np.arange(n)
+    with np.errstate(invalid="ignore"):
+        # NaN-skipping suffix extremes, padded so bar n means "no later bars"
+        sfx_min = np.append(np.fmin.accumulate(low[::-1])[::-1], np.nan)
+        sfx_max = np.append(np.fmax.accumulate(high[::-1])[::-1], np.nan)
+        # First bar at or after i where the suffix extreme is reached
+        min_at = np.minimum.accumulate(np.where(low == sfx_min[:-1], idx, n)[::-1])[::-1]
+        max_at = np.minimum.accumulate(np.where(high == sfx_max[:-1], idx, n)[::-1])[::-1]
+    min_at = np.append(min_at, n)
+    max_at = np.append(max_at, n)
+
+    start = bar_idx + 1
+    extreme = np.where(is_up, sfx_min[start], sfx_max[start])
+    extreme_at = np.where(is_up, min_at[start], max_at[start])
     gap_size = gap_high - gap_low
 
-    if gap_size == 0:
-        return True, 1.0, None
-
-    for j in range(gap_bar_idx + 1, len(df)):
-        if direction == "up":
-            # Gap up fills when price drops into the gap
-            if df["low"].iloc[j] <= gap_low:
-                return True, 1.0, pd.Timestamp(df["time"].iloc[j]).to_pydatetime()
-            # Partial fill
-            penetration = gap_high - df["low"].iloc[j]
-            if penetration > 0:
-                fill = penetration / gap_size
-                if fill > max_fill:
-                    max_fill = fill
-                    fill_date = pd.Timestamp(df["time"].iloc[j]).to_pydatetime()
-        else:
-            # Gap down fills when price rises into the gap
-            if df["high"].iloc[j] >= gap_high:
-                return True, 1.0, pd.Timestamp(df["time"].iloc[j]).to_pydatetime()
-            penetration = df["high"].iloc[j] - gap_low
-            if penetration > 0:
-                fill = penetration / gap_size
-                if fill > max_fill:
-                    max_fill = fill
-                    fill_date = pd.Timestamp(df["time"].iloc[j]).to_pydatetime()
-
-    return max_fill >= 1.0, min(max_fill, 1.0), fill_date
-
-
-def _classify_gap(
-    df: pd.DataFrame,
-    gap_bar_idx: int,
-    size_pct: float,
-    direction: str,
-) -> str:
-    """Classify gap type based on context.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crossed = np.where(is_up, extreme <= gap_low, extreme >= gap_high)
+        penetration = np.where(is_up, gap_high - extreme, extreme - gap_low)
+        partial = penetration > 0
+        max_fill = np.where(partial, penetration / gap_size, 0.0)
+
+    fill_idx = np.where(partial, extreme_at, -1)
+    if crossed.any():
+        hit = np.flatnonzero(crossed)
+        fill_idx[hit] = _first_fill_idx(
+            low, high, start[hit], gap_low[hit], gap_high[hit], is_up[hit]
+        )
+
+    filled = crossed | (max_fill >= 1.0)
+    fill_pct = np.where(crossed, 1.0, np.minimum(max_fill, 1.0))
+
+    # Zero-width gaps are trivially filled
+    empty = gap_size == 0
+    filled[empty] = True
+    fill_pct[empty] = 1.0
+    fill_idx[empty] = -1
+    return filled, fill_pct, fill_idx
+
+
+def _first_fill_idx(
+    low: np.ndarray,
+    high: np.ndarray,
+    start: np.ndarray,
+    gap_low: np.ndarray,
+    gap_high: np.ndarray,
+    up: np.ndarray,
+) -> np.ndarray:
+    """Return the first bar at or after ``start[k]`` that fills gap ``k``.
+
+    Only called for gaps known to be filled. The first crossing is not
+    monotone in the gap bounds, so it cannot be binary-searched on the
+    suffix extremes; it is an early-exit scan, compiled when Numba is
+    available and an argmax over the remaining bars otherwise.
+    """
+    if HAS_NUMBA:
+        return _first_fill_idx_loop(low, high, start, gap_low, gap_high, up)
+
+    out = np.empty(len(start), dtype=np.int64)
+    for k, (begin, lo, hi, is_up) in enumerate(
+        zip(start.tolist(), gap_low.tolist(), gap_high.tolist(), up.tolist())
+    ):
+        hit = low[begin:] <= lo if is_up else high[begin:] >= hi
+        out[k] = begin + int(np.argmax(hit))
+    return out
+
+
+# Eager signature: compiled (or loaded from the on-disk cache) at import
+# rather than on the first call. No fastmath: NaN bars must keep IEEE
+# comparison semantics so they never count as a fill.
+_FIRST_FILL_SIG = None
+if HAS_NUMBA:
+    _prices = types.Array(types.float64, 1, "C", readonly=True)
+    _FIRST_FILL_SIG = types.int64[::1](
+        _prices, _prices, types.int64[::1], types.float64[::1], types.float64[::1],
+        types.boolean[::1],
+    )
+
 
-    Types:
+@njit([_FIRST_FILL_SIG], cache=True)  # type: ignore[type-var]
+def _first_fill_idx_loop(low, high, start, gap_low, gap_high, up):
+    out = np.empty(start.shape[0], dtype=np.int64)
+    for k in range(start.shape[0]):
+        out[k] = -1
+        for j in range(start[k], low.shape[0]):
+            if up[k]:
+                # Gap up fills when price drops into the gap
+                if low[j] <= gap_low[k]:
+                    out[k] = j
+                    break
+            elif high[j] >= gap_high[k]:
+                # Gap down fills when price rises into the gap
+                out[k] = j
+                break
+    return out
+
+
+def _classify_gaps(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: Optional[np.ndarray],
+    bar_idx: np.ndarray,
+    size_pct: np.ndarray,
+) -> np.ndarray:
+    """Classify gap types based on context.
+
+    Returns GapType codes. Types:
     - common: Small gap in a trading range, often filled quickly
     - breakaway: Gap out of a consolidation/pattern, high volume
     - runaway (continuation): Gap in the middle of a trend
     - exhaustion: Gap near end of a trend, often reversed
+
+    Context is taken from the up-to-20 bars before each gap. The window
+    statistics are trailing rolling aggregates shifted by one bar, so
+    every gap reads them with a single index instead of slicing the frame.
+    ``volume`` is None when the data has no usable volume.
     """
-    lookback = min(20, gap_bar_idx)
-    if lookback < 5:
-        return "common"
+    lookback = np.minimum(20, bar_idx)
 
-    prev_data = df.iloc[gap_bar_idx - lookback : gap_bar_idx]
+    def prior(values: np.ndarray, agg: str) -> np.ndarray:
+        rolled = getattr(pd.Series(values).rolling(20, min_periods=1), agg)()
+        return rolled.shift(1).to_numpy()[bar_idx]
 
     # Check for volume spike (if volume available)
-    has_volume = "volume" in df.columns and not df["volume"].isna().all()
-    volume_spike = False
-    if has_volume:
-        avg_vol = prev_data["volume"].mean()
-        gap_vol = df["volume"].iloc[gap_bar_idx]
-        if avg_vol > 0:
-            volume_spike = gap_vol > avg_vol * 1.5
-
-    # Calculate prior trend
-    price_change = (prev_data["close"].iloc[-1] - prev_data["close"].iloc[0]) / prev_data["close"].iloc[0] * 100
-
-    # Check if price was in a range (consolidation)
-    price_range = (prev_data["high"].max() - prev_data["low"].min()) / prev_data["close"].mean() * 100
+    volume_spike = np.zeros(len(bar_idx), dtype=bool)
+    if volume is not None:
+        avg_vol = prior(volume, "mean")
+        gap_vol = volume[bar_idx]
+        volume_spike = (avg_vol > 0) & (gap_vol > avg_vol * 1.5)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Calculate prior trend
+        start_close = close[bar_idx - lookback]
+        price_change = (close[bar_idx - 1] - start_close) / start_close * 100
+
+        # Check if price was in a range (consolidation)
+        price_range = (prior(high, "max") - prior(low, "min")) / prior(close, "mean") * 100
     in_consolidation = price_range < 15  # Less than 15% range = consolidation
 
     # Check if trend is extended
-    bars_remaining = len(df) - gap_bar_idx - 1
-    trend_extended = abs(price_change) > 20
-
-    # Classification logic
-    if in_consolidation and volume_spike:
-        return "breakaway"
-    elif trend_extended and not volume_spike:
-        return "exhaustion"
-    elif abs(price_change) > 10 and volume_spike:
-        return "runaway"
-    elif size_pct < 3:
-        return "common"
-    else:
-        # Default classification based on gap characteristics
-        if volume_spike and abs(price_change) > 5:
-            return "breakaway"
-        return "common"
+    trend = np.abs(price_change)
+    trend_extended = trend > 20
+
+    # Classification logic, first matching rule wins
+    return np.select(
+        [
+            lookback < 5,
+            in_consolidation & volume_spike,
+            trend_extended & ~volume_spike,
+            (trend > 10) & volume_spike,
+            size_pct < 3,
+            volume_spike & (trend > 5),
+        ],
+        [
+            GapType.COMMON,
+            GapType.BREAKAWAY,
+            GapType.EXHAUSTION,
+            GapType.RUNAWAY,
+            GapType.COMMON,
+            GapType.BREAKAWAY,
+        ],
+        default=GapType.COMMON,
+    ).astype(np.int8)
 
 
 def _calculate_severity(
-    size_pct: float,
-    gap_type: str,
-    filled: bool,
-    bars_since: int,
-    df: pd.DataFrame,
-    gap_bar_idx: int,
-) -> int:
-    """Calculate gap severity score (1-10).
+    size_pct: np.ndarray,
+    gap_type: np.ndarray,
+    filled: np.ndarray,
+    bars_since: np.ndarray,
+    total_bars: int,
+) -> np.ndarray:
+    """Calculate gap severity scores (1-10) for a batch of gaps.
 
     Factors:
     - Gap size (larger = more significant)
@@ -316,53 +632,55 @@ def _calculate_severity(
     - Recency (newer = more significant)
     - Volume context
     """
-    score = 0.0
-
     # Size contribution (0-3 points)
-    if size_pct >= 10:
-        score += 3.0
-    elif size_pct >= 5:
-        score += 2.0
-    elif size_pct >= 3:
-        score += 1.5
-    else:
-        score += 1.0
-
-    # Type contribution (0-3 points)
-    type_scores = {
-        "breakaway": 3.0,
-        "runaway": 2.5,
-        "exhaustion": 1.5,
-        "common": 1.0,
-    }
-    score += type_scores.get(gap_type, 1.0)
+    score = np.select(
+        [size_pct >= 10, size_pct >= 5, size_pct >= 3], [3.0, 2.0, 1.5], default=1.0
+    )
+
+    # Type contribution (0-3 points), indexed by GapType code
+    type_scores = np.array([1.0, 3.0, 2.5, 1.5])
+    score = score + type_scores[gap_type]
 
     # Fill status (0-2 points)
-    if not filled:
-        score += 2.0
-    else:
-        score += 0.5
+    score = score + np.where(filled, 0.5, 2.0)
 
     # Recency (0-2 points)
-    total_bars = len(df)
     if total_bars > 0:
         recency_ratio = 1.0 - (bars_since / total_bars)
-        score += recency_ratio * 2.0
+        score = score + recency_ratio * 2.0
 
-    return max(1, min(10, round(score)))
+    # np.round rounds half to even, like round()
+    return np.clip(np.round(score), 1, 10).astype(np.int32)
 
 
-def prioritize_gaps(gaps: list[Gap]) -> list[Gap]:
+def prioritize_gaps(gaps: list[Gap] | GapTable) -> list[Gap] | GapTable:
     """Sort gaps by significance (highest severity first, then unfilled first)."""
-    return sorted(gaps, key=lambda g: (-int(g.is_unfilled), -g.severity, -g.size_pct))
+    if isinstance(gaps, GapTable):
+        return gaps[_priority_order(gaps.filled, gaps.severity, gaps.size_pct)]
+    order = _priority_order(
+        np.array([g.filled for g in gaps], dtype=bool),
+        np.array([g.severity for g in gaps], dtype=np.int64),
+        np.array([g.size_pct for g in gaps], dtype=np.float64),
+    )
+    return [gaps[i] for i in order.tolist()]
 
 
-def get_unfilled_gaps(gaps: list[Gap]) -> list[Gap]:
+def _priority_order(
+    filled: np.ndarray, severity: np.ndarray, size_pct: np.ndarray
+) -> np.ndarray:
+    """Row order for prioritize_gaps: unfilled, then severity, then size."""
+    # lexsort: last key is primary; stable like sorted()
+    return np.lexsort((-size_pct, -severity, filled))
+
+
+def get_unfilled_gaps(gaps: list[Gap] | GapTable) -> list[Gap] | GapTable:
     """Filter to only unfilled gaps."""
+    if isinstance(gaps, GapTable):
+        return gaps[gaps.is_unfilled]
     return [g for g in gaps if g.is_unfilled]
 
 
-def summarize_gaps(gaps: list[Gap]) -> dict:
+def summarize_gaps(gaps: list[Gap] | GapTable) -> dict:
     """Generate a summary of gap analysis results."""
     if not gaps:
         return {
@@ -370,34 +688,43 @@ def summarize_gaps(gaps: list[Gap]) -> dict:
             "unfilled": 0,
             "gaps": [],
             "message": "No gaps detected with current threshold.",
-            "explanation": (
-                "Gaps form when price opens significantly above or below "
-                "the previous close. Unfilled gaps often act as magnets — "
-                "price tends to return to fill them."
-            ),
+            "explanation": _GAP_EXPLANATION,
         }
 
     unfilled = get_unfilled_gaps(gaps)
     prioritized = prioritize_gaps(gaps)
+    now = datetime.now()
 
     type_counts = {}
-    for g in gaps:
-        type_counts[g.gap_type] = type_counts.get(g.gap_type, 0) + 1
+    if isinstance(gaps, GapTable):
+        codes, first, counts = np.unique(
+            gaps.gap_type, return_index=True, return_counts=True
+        )
+        order = np.argsort(first)  # keep first-seen order, as the list path does
+        for code, count in zip(codes[order].tolist(), counts[order].tolist()):
+            type_counts[_TYPE_STR[code]] = count
+        up_count = int(np.count_nonzero(gaps.direction == Direction.UP))
+    else:
+        # One pass for type and direction counts
+        up_count = 0
+        for g in gaps:
+            type_counts[g.gap_type] = type_counts.get(g.gap_type, 0) + 1
+            up_count += g.direction == "up"
+    if isinstance(prioritized, GapTable):
+        rows = prioritized.to_dicts(now)
+    else:
+        rows = [g.to_dict(now) for g in prioritized]
+    by_direction = {"up": up_count, "down": len(gaps) - up_count}
 
     return {
         "total": len(gaps),
         "unfilled": len(unfilled),
         "by_type": type_counts,
-        "by_direction": {
-            "up": sum(1 for g in gaps if g.direction == "up"),
-            "down": sum(1 for g in gaps if g.direction == "down"),
-        },
-        "largest_unfilled": prioritized[0].to_dict() if unfilled else None,
-        "gaps": [g.to_dict() for g in prioritized],
+        "by_direction": by_direction,
+        "largest_unfilled": dict(rows[0]) if unfilled else None,
+        "gaps": rows,
         "explanation": (
-            "Gaps form when price opens significantly above or below "
-            "the previous close. Unfilled gaps often act as magnets — "
-            "price tends to return to fill them. "
+            f"{_GAP_EXPLANATION} "
             "Breakaway gaps signal new trends. "
             "Common gaps usually fill quickly."
         ),
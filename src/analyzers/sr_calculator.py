@@ -16,13 +16,33 @@ from typing import Optional
 
 import numpy as np
 import pandas as pd
-
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.analyzers._njit import HAS_NUMBA
+from src.analyzers._sr_kernels import (
+    count_touches_kernel,
+    merge_levels_kernel,
+    swing_flags_kernel,
+    volume_profile_kernel,
+)
 from src.utils.logger import get_logger
 
 logger = get_logger("sr_calculator")
 
+# Which side of a zone a close must land on to count as a break
+_BREAK_SIDE = {"support": 1, "resistance": -1}
+
+# Zone width (fraction of price) per sensitivity setting
+_SENSITIVITY_ZONE_PCT = {"low": 0.005, "medium": 0.01, "high": 0.02}
+
+# Which source wins when two nearby levels are merged
+_SOURCE_PRIORITY = {"swing": 3, "volume": 2, "round_number": 1, "ma_cluster": 2}
+
+# Strength contribution (0-3) of each detection method
+_SOURCE_SCORES = {"swing": 3.0, "volume": 2.5, "ma_cluster": 2.0, "round_number": 1.5}
 
-@dataclass
+
+@dataclass(slots=True)
 class SRLevel:
     """A support or resistance level."""
 
@@ -99,6 +119,33 @@ class SRLevel:
         }
 
 
+@dataclass(slots=True)
+class _Bars:
+    """OHLCV columns of the analysis window as flat float64/datetime64 arrays."""
+
+    low: np.ndarray
+    high: np.ndarray
+    close: np.ndarray
+    time: np.ndarray
+    volume: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame, with_volume: bool = True) -> "_Bars":
+        volume = None
+        if with_volume and "volume" in df.columns:
+            volume = df["volume"].to_numpy(dtype=np.float64, na_value=np.nan)
+        return cls(
+            low=df["low"].to_numpy(dtype=np.float64),
+            high=df["high"].to_numpy(dtype=np.float64),
+            close=df["close"].to_numpy(dtype=np.float64),
+            time=df["time"].to_numpy(),
+            volume=volume,
+        )
+
+    def __len__(self) -> int:
+        return len(self.low)
+
+
 def calculate_levels(
     df: pd.DataFrame,
     current_price: Optional[float] = None,
@@ -107,6 +154,7 @@ def calculate_levels(
     sensitivity: str = "medium",
     round_number_interval: float = 10.0,
     timeframe_label: str = "",
+    top_k: Optional[int] = None,
 ) -> list[SRLevel]:
     """Calculate all support and resistance levels.
 
@@ -118,6 +166,7 @@ def calculate_levels(
         sensitivity: "low", "medium", or "high" - affects zone width.
         round_number_interval: Spacing for psychological levels.
         timeframe_label: Source timeframe tag (e.g. "5min", "daily", "weekly").
+        top_k: Keep only the top_k strongest levels. Keeps all if None.
 
     Returns:
         List of S/R levels sorted by strength.
@@ -125,22 +174,24 @@ def calculate_levels(
     if current_price is None:
         current_price = float(df["close"].iloc[-1])
 
-    # Use only the lookback window
-    analysis_df = df.tail(lookback_bars).copy()
+    # Use only the lookback window; helpers read the columns as arrays
+    has_volume = "volume" in df.columns and df["volume"].notna().any()
+    bars = _Bars.from_df(df.tail(lookback_bars), with_volume=has_volume)
 
     # Zone width based on sensitivity
-    sensitivity_multipliers = {"low": 0.005, "medium": 0.01, "high": 0.02}
-    zone_pct = sensitivity_multipliers.get(sensitivity, 0.01)
+    zone_pct = _SENSITIVITY_ZONE_PCT.get(sensitivity, 0.01)
 
     all_levels: list[SRLevel] = []
 
     # Method 1: Swing points (pivot highs/lows)
-    swing_levels = find_swing_points(analysis_df, window=swing_window, zone_pct=zone_pct)
+    swing_levels = _swing_points(
+        bars.high, bars.low, bars.time, window=swing_window, zone_pct=zone_pct
+    )
     all_levels.extend(swing_levels)
 
     # Method 2: Volume-confirmed levels
-    if "volume" in df.columns and not df["volume"].isna().all():
-        volume_levels = calculate_volume_nodes(analysis_df, zone_pct=zone_pct)
+    if bars.volume is not None:
+        volume_levels = _volume_nodes(bars.low, bars.high, bars.volume, zone_pct=zone_pct)
         all_levels.extend(volume_levels)
 
     # Method 3: Psychological round numbers (daily or unspecified only)
@@ -153,32 +204,50 @@ def calculate_levels(
     # Merge nearby levels
     merged = _merge_nearby_levels(all_levels, current_price, zone_pct)
 
-    # Tag each level with its source timeframe
+    # Tag each level with its source timeframe and classify it as support or
+    # resistance based on current price, collecting zone bounds as we go
+    zone_low, zone_high, break_side, sources = [], [], [], []
     for level in merged:
         level.timeframe = timeframe_label
-
-    # Classify as support or resistance based on current price
-    for level in merged:
         if level.price < current_price:
             level.level_type = "support"
         elif level.price > current_price:
             level.level_type = "resistance"
         else:
             level.level_type = "both"
-
-    # Calculate touch counts and breaks
-    for level in merged:
-        level.touches, level.breaks, level.last_test_date = _count_touches(
-            analysis_df, level.zone_low, level.zone_high, level.level_type
-        )
+        zone_low.append(level.zone_low)
+        zone_high.append(level.zone_high)
+        break_side.append(_BREAK_SIDE.get(level.level_type, 0))
+        sources.append(level.source)
+
+    # Calculate touch counts and breaks for every zone at once
+    touches, breaks, last_idx = _count_touches(
+        bars.low,
+        bars.high,
+        bars.close,
+        np.array(zone_low, dtype=np.float64),
+        np.array(zone_high, dtype=np.float64),
+        np.array(break_side, dtype=np.int64),
+    )
+    scores = _calculate_strength_scores(
+        sources, touches, breaks, _days_since(bars.time, last_idx)
+    )
 
     # Recalculate strength with touch data
-    for level in merged:
-        level.strength = _calculate_strength(level, current_price, len(analysis_df))
-        level.strength_score = _calculate_strength_score(level, analysis_df)
-
-    # Sort by strength_score (composite 0-100)
-    merged.sort(key=lambda x: -x.strength_score)
+    for level, n_touch, n_break, last_date, score in zip(
+        merged,
+        touches.tolist(),
+        breaks.tolist(),
+        _to_pydatetimes(bars.time, last_idx),
+        scores.tolist(),
+    ):
+        level.touches, level.breaks, level.last_test_date = n_touch, n_break, last_date
+        level.strength = _calculate_strength(level, current_price, len(bars))
+        level.strength_score = score
+
+    # Sort by strength_score (composite 0-100); stable, so ties keep price order
+    order = np.argsort(-scores, kind="stable")[:top_k]
+    merged = [merged[i] for i in order.tolist()]
 
     logger.info(
         f"Found {len(merged)} S/R levels ({timeframe_label or 'default'}): "
@@ -197,49 +266,85 @@ def find_swing_points(
     A swing high has the highest high within `window` bars on each side.
     A swing low has the lowest low within `window` bars on each side.
     """
-    levels = []
-    highs = df["high"].values
-    lows = df["low"].values
-    times = df["time"].values
-
-    for i in range(window, len(df) - window):
-        # Swing high
-        if highs[i] == max(highs[i - window : i + window + 1]):
-            price = float(highs[i])
-            zone_w = price * zone_pct
-            levels.append(
-                SRLevel(
-                    price=price,
-                    level_type="resistance",
-                    source="swing",
-                    strength=5,  # Will be recalculated
-                    touches=0,
-                    last_test_date=pd.Timestamp(times[i]).to_pydatetime(),
-                    zone_low=price - zone_w,
-                    zone_high=price + zone_w,
-                )
-            )
+    return _swing_points(
+        df["high"].to_numpy(dtype=np.float64),
+        df["low"].to_numpy(dtype=np.float64),
+        df["time"].to_numpy(),
+        window,
+        zone_pct,
+    )
+
+
+def _swing_points(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    times: np.ndarray,
+    window: int = 5,
+    zone_pct: float = 0.01,
+) -> list[SRLevel]:
+    """Array implementation of find_swing_points."""
+    n = len(highs)
+    span = 2 * window + 1
+    if n < span:
+        return []
 
-        # Swing low
-        if lows[i] == min(lows[i - window : i + window + 1]):
-            price = float(lows[i])
-            zone_w = price * zone_pct
-            levels.append(
-                SRLevel(
-                    price=price,
-                    level_type="support",
-                    source="swing",
-                    strength=5,
-                    touches=0,
-                    last_test_date=pd.Timestamp(times[i]).to_pydatetime(),
-                    zone_low=price - zone_w,
-                    zone_high=price + zone_w,
-                )
+    if HAS_NUMBA:
+        is_high, is_low = swing_flags_kernel(highs, lows, window)
+    else:
+        centers = slice(window, n - window)
+        is_high = highs[centers] == _window_extreme(highs, span, np.fmax)
+        is_low = lows[centers] == _window_extreme(lows, span, np.fmin)
+
+    # Swing high before swing low on the same bar, bars in time order
+    idx = np.concatenate([np.flatnonzero(is_high), np.flatnonzero(is_low)]) + window
+    is_resistance = np.arange(len(idx)) < np.count_nonzero(is_high)
+    order = np.lexsort((~is_resistance, idx))
+    idx, is_resistance = idx[order], is_resistance[order]
+
+    prices = np.where(is_resistance, highs[idx], lows[idx])
+    pivot_times = _to_pydatetimes(times, idx)
+
+    levels = []
+    for price, resistance, time in zip(prices.tolist(), is_resistance.tolist(), pivot_times):
+        zone_w = price * zone_pct
+        levels.append(
+            SRLevel(
+                price=price,
+                level_type="resistance" if resistance else "support",
+                source="swing",
+                strength=5,  # Will be recalculated
+                touches=0,
+                last_test_date=time,
+                zone_low=price - zone_w,
+                zone_high=price + zone_w,
             )
+        )
 
     return levels
 
 
+def _to_pydatetimes(times: np.ndarray, idx: np.ndarray) -> list[Optional[datetime]]:
+    """Convert times[idx] to datetimes in one batch; None where idx is -1."""
+    found = idx >= 0
+    dates: list[Optional[datetime]] = [None] * len(idx)
+    converted = pd.DatetimeIndex(times[idx[found]]).to_pydatetime()
+    for pos, date in zip(np.flatnonzero(found).tolist(), converted):
+        dates[pos] = date
+    return dates
+
+
+def _window_extreme(values: np.ndarray, span: int, reduce: np.ufunc) -> np.ndarray:
+    """Max/min of every centered window, with builtin max()/min() NaN handling.
+
+    The builtins skip NaNs after the first element but return NaN when the
+    window starts with one, which np.fmax/np.fmin plus a mask reproduces.
+    """
+    windows = sliding_window_view(values, span)
+    extreme = reduce.reduce(windows, axis=1)
+    extreme[np.isnan(windows[:, 0])] = np.nan
+    return extreme
+
+
 def calculate_volume_nodes(
     df: pd.DataFrame, num_bins: int = 50, zone_pct: float = 0.01
 ) -> list[SRLevel]:
@@ -250,31 +355,40 @@ def calculate_volume_nodes(
     """
     if "volume" not in df.columns:
         return []
+    return _volume_nodes(
+        df["low"].to_numpy(dtype=np.float64),
+        df["high"].to_numpy(dtype=np.float64),
+        df["volume"].to_numpy(dtype=np.float64, na_value=np.nan),
+        num_bins,
+        zone_pct,
+    )
+
+
+def _volume_nodes(
+    lows: np.ndarray,
+    highs: np.ndarray,
+    volumes: np.ndarray,
+    num_bins: int = 50,
+    zone_pct: float = 0.01,
+) -> list[SRLevel]:
+    """Array implementation of calculate_volume_nodes."""
+    if len(lows) == 0:
+        return []
 
-    price_min = df["low"].min()
-    price_max = df["high"].max()
+    # fmin/fmax skip NaN bars like Series.min()/max()
+    price_min = np.fmin.reduce(lows)
+    price_max = np.fmax.reduce(highs)
     if price_min == price_max:
         return []
 
     bin_size = (price_max - price_min) / num_bins
-    volume_profile = np.zeros(num_bins)
-
-    for _, row in df.iterrows():
-        if pd.isna(row.get("volume", np.nan)):
-            continue
-        bar_low = row["low"]
-        bar_high = row["high"]
-        bar_volume = row["volume"]
-
-        low_bin = max(0, int((bar_low - price_min) / bin_size))
-        high_bin = min(num_bins - 1, int((bar_high - price_min) / bin_size))
 
-        # Distribute volume across bins the bar spans
-        bins_spanned = high_bin - low_bin + 1
-        if bins_spanned > 0:
-            vol_per_bin = bar_volume / bins_spanned
-            for b in range(low_bin, high_bin + 1):
-                volume_profile[b] += vol_per_bin
+    if HAS_NUMBA:
+        volume_profile = volume_profile_kernel(
+            lows, highs, volumes, float(price_min), float(bin_size), num_bins
+        )
+    else:
+        volume_profile = _volume_profile(lows, highs, volumes, price_min, bin_size, num_bins)
 
     # Find peaks in volume profile (high volume nodes)
     mean_vol = volume_profile.mean()
@@ -282,26 +396,54 @@ def calculate_volume_nodes(
     threshold = mean_vol + std_vol  # Levels above 1 std dev
 
     levels = []
-    for i, vol in enumerate(volume_profile):
-        if vol > threshold:
-            price = price_min + (i + 0.5) * bin_size
-            zone_w = price * zone_pct
-            levels.append(
-                SRLevel(
-                    price=round(price, 2),
-                    level_type="both",
-                    source="volume",
-                    strength=5,
-                    touches=0,
-                    last_test_date=None,
-                    zone_low=price - zone_w,
-                    zone_high=price + zone_w,
-                )
+    for i in np.flatnonzero(volume_profile > threshold).tolist():
+        price = price_min + (i + 0.5) * bin_size
+        zone_w = price * zone_pct
+        levels.append(
+            SRLevel(
+                price=round(price, 2),
+                level_type="both",
+                source="volume",
+                strength=5,
+                touches=0,
+                last_test_date=None,
+                zone_low=price - zone_w,
+                zone_high=price + zone_w,
             )
+        )
 
     return levels
 
 
+def _volume_profile(
+    lows: np.ndarray,
+    highs: np.ndarray,
+    volumes: np.ndarray,
+    price_min: float,
+    bin_size: float,
+    num_bins: int,
+) -> np.ndarray:
+    """Spread each bar's volume evenly over the price bins it spans."""
+    valid = ~(np.isnan(volumes) | np.isnan(lows) | np.isnan(highs))
+    lows, highs, volumes = lows[valid], highs[valid], volumes[valid]
+
+    low_bin = np.maximum(0, np.trunc((lows - price_min) / bin_size).astype(np.int64))
+    high_bin = np.minimum(num_bins - 1, np.trunc((highs - price_min) / bin_size).astype(np.int64))
+
+    bins_spanned = high_bin - low_bin + 1
+    spans = bins_spanned > 0
+    low_bin, bins_spanned = low_bin[spans], bins_spanned[spans]
+    vol_per_bin = volumes[spans] / bins_spanned
+
+    # Expand to one (bin, volume) entry per bar per spanned bin, in bar order,
+    # so bincount accumulates each bin in the same order as a per-bar loop
+    starts = np.repeat(np.cumsum(bins_spanned) - bins_spanned, bins_spanned)
+    bins = np.repeat(low_bin, bins_spanned) + (np.arange(len(starts)) - starts)
+    return np.bincount(
+        bins, weights=np.repeat(vol_per_bin, bins_spanned), minlength=num_bins
+    )
+
+
 def detect_round_numbers(
     current_price: float, interval: float = 10.0, zone_pct: float = 0.01, count: int = 5
 ) -> list[SRLevel]:
@@ -309,31 +451,27 @@ def detect_round_numbers(
 
     Round numbers ($50, $100, $150) often act as S/R because of human psychology.
     """
-    levels = []
-
     # Find nearest round number below
     base = (current_price // interval) * interval
 
     # Generate levels above and below
-    for i in range(-count, count + 1):
-        price = base + (i * interval)
-        if price <= 0:
-            continue
-        zone_w = price * zone_pct
-        levels.append(
-            SRLevel(
-                price=price,
-                level_type="support" if price < current_price else "resistance",
-                source="round_number",
-                strength=3,  # Lower base strength for round numbers
-                touches=0,
-                last_test_date=None,
-                zone_low=price - zone_w,
-                zone_high=price + zone_w,
-            )
+    prices = base + np.arange(-count, count + 1, dtype=np.float64) * interval
+    prices = prices[prices > 0]
+    zone_ws = prices * zone_pct
+
+    return [
+        SRLevel(
+            price=price,
+            level_type="support" if price < current_price else "resistance",
+            source="round_number",
+            strength=3,  # Lower base strength for round numbers
+            touches=0,
+            last_test_date=None,
+            zone_low=price - zone_w,
+            zone_high=price + zone_w,
         )
-
-    return levels
+        for price, zone_w in zip(prices.tolist(), zone_ws.tolist())
+    ]
 
 
 def _merge_nearby_levels(
@@ -346,24 +484,43 @@ def _merge_nearby_levels(
     if not levels:
         return []
 
-    # Sort by price
-    sorted_levels = sorted(levels, key=lambda x: x.price)
-    merged: list[SRLevel] = [sorted_levels[0]]
+    # Sort by price (stable, so equal prices keep their input order)
+    prices = np.fromiter((l.price for l in levels), dtype=np.float64, count=len(levels))
+    order = np.argsort(prices, kind="stable")
 
     merge_threshold = current_price * zone_pct * 2
 
-    for level in sorted_levels[1:]:
-        last = merged[-1]
-        if abs(level.price - last.price) <= merge_threshold:
-            # Merge: keep the one from a better source, boost strength
-            source_priority = {"swing": 3, "volume": 2, "round_number": 1, "ma_cluster": 2}
-            if source_priority.get(level.source, 0) > source_priority.get(last.source, 0):
-                level.strength = min(10, last.strength + 1)
-                merged[-1] = level
+    if HAS_NUMBA:
+        sorted_levels = [levels[i] for i in order.tolist()]
+        keep, strengths = merge_levels_kernel(
+            prices[order],
+            np.array([_SOURCE_PRIORITY.get(l.source, 0) for l in sorted_levels], dtype=np.int64),
+            np.array([l.strength for l in sorted_levels], dtype=np.int64),
+            float(merge_threshold),
+        )
+        for level, strength in zip(sorted_levels, strengths.tolist()):
+            level.strength = strength
+        return [sorted_levels[i] for i in keep.tolist()]
+
+    # A gap wider than the threshold always starts a new level, so only runs
+    # of closely spaced prices need the sequential merge below
+    starts = np.flatnonzero(np.diff(prices[order]) > merge_threshold) + 1
+
+    merged: list[SRLevel] = []
+    for group in np.split(order, starts):
+        group_levels = [levels[i] for i in group.tolist()]
+        merged.append(group_levels[0])
+        for level in group_levels[1:]:
+            last = merged[-1]
+            if abs(level.price - last.price) <= merge_threshold:
+                # Merge: keep the one from a better source, boost strength
+                if _SOURCE_PRIORITY.get(level.source, 0) > _SOURCE_PRIORITY.get(last.source, 0):
+                    level.strength = min(10, last.strength + 1)
+                    merged[-1] = level
+                else:
+                    last.strength = min(10, last.strength + 1)
             else:
-                last.strength = min(10, last.strength + 1)
-        else:
-            merged.append(level)
+                merged.append(level)
 
     return merged
 
@@ -387,38 +544,49 @@ def detect_confluence(
     if not all_levels:
         return []
 
-    # Sort by price for efficient pairwise comparison
+    # Sort by price so each level's merge candidates form a contiguous run
     sorted_levels = sorted(all_levels, key=lambda x: x.price)
-    merged_indices: set[int] = set()
+    prices = np.fromiter(
+        (l.price for l in sorted_levels), dtype=np.float64, count=len(sorted_levels)
+    )
+    upper = np.searchsorted(prices, prices * (1 + threshold_pct), side="right")
+    # Integer timeframe codes so the cross-timeframe test runs on arrays
+    tf_codes: dict = {}
+    timeframe_ids = np.fromiter(
+        (tf_codes.setdefault(l.timeframe, len(tf_codes)) for l in sorted_levels),
+        dtype=np.int64,
+        count=len(sorted_levels),
+    )
+    merged = np.zeros(len(sorted_levels), dtype=bool)
     result: list[SRLevel] = []
 
     for i, level_a in enumerate(sorted_levels):
-        if i in merged_indices:
+        if merged[i]:
             continue
 
         # Collect all levels within threshold from different timeframes
         cluster = [level_a]
         cluster_indices = [i]
 
-        for j in range(i + 1, len(sorted_levels)):
-            if j in merged_indices:
-                continue
-            level_b = sorted_levels[j]
-
-            # Stop scanning once prices diverge beyond threshold
-            if level_a.price > 0:
-                distance = abs(level_b.price - level_a.price) / level_a.price
-            else:
-                break
-            if distance > threshold_pct * 3:
-                break
+        if level_a.price > 0:
+            # searchsorted uses a rounded bound; settle the edge on exact distance
+            hi = int(upper[i])
+            while (
+                hi < len(prices)
+                and (prices[hi] - level_a.price) / level_a.price <= threshold_pct
+            ):
+                hi += 1
 
+            window = slice(i + 1, hi)
+            distance = np.abs(prices[window] - level_a.price) / level_a.price
             # Only merge across different timeframes
-            if (
-                distance <= threshold_pct
-                and level_b.timeframe != level_a.timeframe
-            ):
-                cluster.append(level_b)
+            candidates = (
+                ~merged[window]
+                & (distance <= threshold_pct)
+                & (timeframe_ids[window] != timeframe_ids[i])
+            )
+            for j in (np.flatnonzero(candidates) + i + 1).tolist():
+                cluster.append(sorted_levels[j])
                 cluster_indices.append(j)
 
         if len(cluster) == 1:
@@ -426,7 +594,7 @@ def detect_confluence(
             result.append(level_a)
         else:
             # Merge into a single confluence level
-            merged_indices.update(cluster_indices)
+            merged[cluster_indices] = True
             avg_price = sum(l.price for l in cluster) / len(cluster)
             total_touches = sum(l.touches for l in cluster)
             total_breaks = sum(l.breaks for l in cluster)
@@ -465,30 +633,40 @@ def detect_confluence(
 
 
 def _count_touches(
-    df: pd.DataFrame, zone_low: float, zone_high: float, level_type: str = "support"
-) -> tuple[int, int, Optional[datetime]]:
-    """Count how many bars touched a price zone and how many broke through.
+    low: np.ndarray,
+    high: np.ndarray,
+    close: np.ndarray,
+    zone_low: np.ndarray,
+    zone_high: np.ndarray,
+    break_side: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Count how many bars touched each price zone and how many broke through.
+
+    ``break_side`` holds 1 for support, -1 for resistance and 0 for levels
+    whose breaks are not counted (see ``_BREAK_SIDE``).
 
     Returns:
-        (touches, breaks, last_touch_date)
+        (touches, breaks, last_touch_idx) arrays with one entry per zone;
+        last_touch_idx is -1 for zones that were never touched.
     """
-    touches = 0
-    breaks = 0
-    last_touch = None
-
-    for _, row in df.iterrows():
-        # A bar touches the zone if its range overlaps with the zone
-        if row["low"] <= zone_high and row["high"] >= zone_low:
-            touches += 1
-            last_touch = pd.Timestamp(row["time"]).to_pydatetime()
-
-            # Check if it broke through
-            if level_type == "support" and row["close"] < zone_low:
-                breaks += 1
-            elif level_type == "resistance" and row["close"] > zone_high:
-                breaks += 1
+    if HAS_NUMBA:
+        return count_touches_kernel(low, high, close, zone_low, zone_high, break_side)
+
+    # A bar touches a zone if its range overlaps with the zone: (levels, bars)
+    touched = (low[None, :] <= zone_high[:, None]) & (high[None, :] >= zone_low[:, None])
+    touches = np.count_nonzero(touched, axis=1)
+
+    # Check if it broke through
+    broke = np.where(
+        (break_side == 1)[:, None],
+        close[None, :] < zone_low[:, None],
+        (break_side == -1)[:, None] & (close[None, :] > zone_high[:, None]),
+    )
+    breaks = np.count_nonzero(touched & broke, axis=1)
 
-    return touches, breaks, last_touch
+    last_idx = touched.shape[1] - 1 - np.argmax(touched[:, ::-1], axis=1)
+    last_idx[touches == 0] = -1
+    return touches, breaks, last_idx
 
 
 def _calculate_strength(
@@ -513,8 +691,7 @@ def _calculate_strength(
         score += 1.0
 
     # Source contribution (0-3)
-    source_scores = {"swing": 3.0, "volume": 2.5, "ma_cluster": 2.0, "round_number": 1.5}
-    score += source_scores.get(level.source, 1.0)
+    score += _SOURCE_SCORES.get(level.source, 1.0)
 
     # Proximity (0-2): levels closer to current price are more actionable
     distance_pct = abs(level.price - current_price) / current_price
@@ -533,44 +710,50 @@ def _calculate_strength(
     return max(1, min(10, round(score)))
 
 
-def _calculate_strength_score(level: SRLevel, df: pd.DataFrame) -> int:
-    """Calculate composite strength score (0-100).
+def _days_since(times: np.ndarray, idx: np.ndarray) -> np.ndarray:
+    """Whole days from times[idx] to now, NaN where idx is -1 (never tested)."""
+    days = np.full(len(idx), np.nan)
+    tested = idx >= 0
+    if tested.any():
+        now = np.datetime64(datetime.now(), "us")
+        tested_at = times[idx[tested]].astype("datetime64[us]")
+        # Floor division matches timedelta.days for past and future dates
+        days[tested] = (now - tested_at) // np.timedelta64(1, "D")
+    return days
+
+
+def _calculate_strength_scores(
+    sources: list[str], touches: np.ndarray, breaks: np.ndarray, days: np.ndarray
+) -> np.ndarray:
+    """Calculate composite strength scores (0-100) for many levels at once.
 
     Components:
     - Touch count (0-40): more touches = stronger
     - Volume (0-20): higher volume at level = stronger
     - Recency (0-20): more recent test = stronger
     - Held vs broken (0-20): fewer breaks = stronger
-    """
-    score = 0
 
+    ``days`` is NaN for levels that were never tested.
+    """
     # Touch count (0-40 points, 4 pts per touch, max 40)
-    score += min(level.touches * 4, 40)
+    touch_pts = np.minimum(touches * 4, 40)
 
     # Volume component (0-20 points)
     # Use volume percentile if available; simplified: source-based proxy
-    if "volume" in level.source:
-        score += 15
-    elif level.source == "swing":
-        score += 10
-    else:
-        score += 5
+    src = np.array(sources, dtype=str)
+    volume_pts = np.where(
+        np.char.find(src, "volume") >= 0, 15, np.where(src == "swing", 10, 5)
+    )
 
-    # Recency (0-20 points): lose 2 pts per day since last test
-    days = level.days_since_test
-    if days is not None:
-        recency = max(0, 20 - (days * 2))
-        score += recency
-    else:
-        score += 5  # Unknown recency gets partial credit
+    # Recency (0-20 points): lose 2 pts per day since last test.
+    # Unknown recency gets partial credit
+    recency_pts = np.where(np.isnan(days), 5, np.maximum(0, 20 - days * 2))
 
     # Held vs broken (0-20 points)
-    if level.breaks == 0:
-        score += 20
-    else:
-        score += max(0, 20 - (level.breaks * 5))
+    held_pts = np.where(breaks == 0, 20, np.maximum(0, 20 - breaks * 5))
 
-    return max(0, min(100, score))
+    scores = touch_pts + volume_pts + recency_pts + held_pts
+    return np.clip(scores, 0, 100).astype(np.int64)
 
 
 def summarize_levels(
@@ -587,21 +770,29 @@ def summarize_levels(
         timeframes_analyzed: List of timeframes used (e.g. ["15min", "daily", "weekly"]).
         lookback_periods: Human-readable lookback descriptions per timeframe.
     """
-    support = [l for l in levels if l.level_type == "support"]
-    resistance = [l for l in levels if l.level_type == "resistance"]
-
-    # Nearest support and resistance
-    nearest_support = min(support, key=lambda l: current_price - l.price) if support else None
-    nearest_resistance = min(
-        resistance, key=lambda l: l.price - current_price
-    ) if resistance else None
+    # One pass: partition support/resistance and key/minor, and track the
+    # nearest support and resistance (first one wins ties, like min())
+    support = []
+    resistance = []
+    nearest_support = nearest_resistance = None
+    support_gap = resistance_gap = 0.0
 
-    # Split into key vs minor levels
     # Key: confluence OR strength >= 8
     # Minor: everything else; round-number-only levels stay minor unless confluence
     key = []
     minor = []
     for level in levels:
+        if level.level_type == "support":
+            support.append(level)
+            gap = current_price - level.price
+            if nearest_support is None or gap < support_gap:
+                nearest_support, support_gap = level, gap
+        elif level.level_type == "resistance":
+            resistance.append(level)
+            gap = level.price - current_price
+            if nearest_resistance is None or gap < resistance_gap:
+                nearest_resistance, resistance_gap = level, gap
+
         is_key = level.is_confluence or level.strength >= 8
         if level.source == "round_number" and not level.is_confluence:
             is_key = False
@@ -20,12 +20,22 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 
+from src.analyzers._njit import HAS_NUMBA, njit
 from src.utils.logger import get_logger
 
 logger = get_logger("supply_demand")
 
+# Zone type and pattern by 2 * (move is up) + (price rallied into the base)
+_ZONE_TYPES = ("supply", "supply", "demand", "demand")
+_PATTERNS = (
+    "DBD",  # Drop-Base-Drop
+    "RBD",  # Rally-Base-Drop
+    "DBR",  # Drop-Base-Rally
+    "RBR",  # Rally-Base-Rally
+)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Zone:
     """A supply or demand zone."""
 
@@ -99,103 +109,130 @@ def identify_zones(
     if len(df) < 5:
         return []
 
-    zones: list[Zone] = []
-
-    # Calculate bar-to-bar moves
-    df = df.copy()
-    df["bar_move_pct"] = ((df["close"] - df["open"]) / df["open"] * 100).abs()
-    df["bar_direction"] = np.where(df["close"] > df["open"], 1, -1)
-
+    # Per-candidate fields, gathered in the scan; zones are built once scored
+    positions: list[int] = []
+    base_starts: list[int] = []
+    base_ends: list[int] = []
+    zone_lows: list[float] = []
+    zone_highs: list[float] = []
+    width_pcts: list[float] = []
+
+    # Pull the columns out once; the loop below only does positional reads
+    opens = df["open"].to_numpy(dtype=np.float64)
+    closes = df["close"].to_numpy(dtype=np.float64)
+    lows = df["low"].to_numpy(dtype=np.float64)
+    highs = df["high"].to_numpy(dtype=np.float64)
+    times = df["time"].to_numpy()
+
+    # Calculate bar-to-bar moves, reusing one buffer for |close - open| / open * 100.
+    # close > open exactly when close - open > 0, so the sign comes from the same diff
+    bar_move_pct = closes - opens
+    bar_direction = np.where(bar_move_pct > 0, np.int8(1), np.int8(-1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(bar_move_pct, opens, out=bar_move_pct)
+    np.multiply(bar_move_pct, 100, out=bar_move_pct)
+    np.abs(bar_move_pct, out=bar_move_pct)
+
+    # Volume spikes against the series average, flagged for every bar at once
     has_volume = "volume" in df.columns and not df["volume"].isna().all()
     avg_volume = df["volume"].mean() if has_volume else 0
+    if has_volume and avg_volume > 0:
+        volumes = df["volume"].to_numpy(dtype=np.float64, na_value=np.nan)
+        volume_spike = volumes > avg_volume * volume_threshold
+    else:
+        volume_spike = np.zeros(len(df), dtype=bool)
 
     # Find explosive moves
-    explosive_indices = df.index[df["bar_move_pct"] >= min_move_pct].tolist()
-
-    for idx in explosive_indices:
-        pos = df.index.get_loc(idx)
+    for pos in np.flatnonzero(bar_move_pct >= min_move_pct).tolist():
         if pos < 2:
             continue
 
-        move_direction = int(df["bar_direction"].iloc[pos])
-        move_size_pct = float(df["bar_move_pct"].iloc[pos])
-
         # Look for base zone before the explosive move
-        base = _find_base_zone(df, pos, consolidation_bars)
+        base = _find_base_zone(highs, lows, bar_move_pct, pos, consolidation_bars)
         if base is None:
             continue
 
         base_start_pos, base_end_pos = base
-        base_start = df.iloc[base_start_pos]
-        base_end = df.iloc[base_end_pos]
-
-        # Determine base range
-        base_slice = df.iloc[base_start_pos : base_end_pos + 1]
-        zone_low = float(base_slice["low"].min())
-        zone_high = float(base_slice["high"].max())
-
-        # Determine zone type and pattern
-        # Check move before the base
-        pre_direction = _get_pre_move_direction(df, base_start_pos)
-
-        if move_direction > 0:  # Explosive move up
-            zone_type = "demand"
-            if pre_direction > 0:
-                pattern = "RBR"  # Rally-Base-Rally
-            else:
-                pattern = "DBR"  # Drop-Base-Rally
-        else:  # Explosive move down
-            zone_type = "supply"
-            if pre_direction < 0:
-                pattern = "DBD"  # Drop-Base-Drop
-            else:
-                pattern = "RBD"  # Rally-Base-Drop
-
-        # Volume confirmation
-        volume_confirmed = False
-        if has_volume and avg_volume > 0:
-            explosive_volume = float(df["volume"].iloc[pos])
-            volume_confirmed = explosive_volume > avg_volume * volume_threshold
-
-        # Check freshness and test count
-        fresh, test_count = _check_zone_freshness(
-            df, pos, zone_low, zone_high, zone_type
-        )
 
-        # Calculate strength
-        strength = _calculate_zone_strength(
-            move_size_pct=move_size_pct,
-            volume_confirmed=volume_confirmed,
-            fresh=fresh,
-            test_count=test_count,
-            pattern=pattern,
-            width_pct=(zone_high - zone_low) / ((zone_high + zone_low) / 2) * 100 if zone_high + zone_low > 0 else 0,
-        )
+        # Determine base range (NaN bars are skipped, like Series.min/max)
+        zone_low = float(np.fmin.reduce(lows[base_start_pos : base_end_pos + 1]))
+        zone_high = float(np.fmax.reduce(highs[base_start_pos : base_end_pos + 1]))
+
+        # Zone width as a percentage of its midpoint
+        zone_sum = zone_high + zone_low
+        width_pct = (zone_high - zone_low) / (zone_sum / 2) * 100 if zone_sum > 0 else 0
+
+        positions.append(pos)
+        base_starts.append(base_start_pos)
+        base_ends.append(base_end_pos)
+        zone_lows.append(zone_low)
+        zone_highs.append(zone_high)
+        width_pcts.append(width_pct)
+
+    explosive_pos = np.array(positions, dtype=np.int64)
+    move_size_pct = bar_move_pct[explosive_pos]
+    volume_confirmed = volume_spike[explosive_pos]
+
+    # Check freshness and test count
+    fresh, test_count = _check_zone_freshness(
+        lows,
+        highs,
+        explosive_pos,
+        np.array(zone_lows, dtype=np.float64),
+        np.array(zone_highs, dtype=np.float64),
+    )
+
+    # Determine zone type and pattern from the move and the direction into the base.
+    # Up moves need a rally into the base for RBR; down moves count a flat
+    # approach as a rally (RBD), so shift the pre-direction before testing
+    move_up = (bar_direction[explosive_pos] > 0).astype(np.int64)
+    pre_direction = _get_pre_move_directions(closes, np.array(base_starts, dtype=np.int64))
+    pattern_keys = 2 * move_up + (pre_direction + 1 - move_up > 0)
+    keys = pattern_keys.tolist()
+
+    # Calculate strength
+    strengths = _calculate_zone_strengths(
+        move_size_pct=move_size_pct,
+        volume_confirmed=volume_confirmed,
+        fresh=fresh,
+        test_count=test_count,
+        pattern_key=pattern_keys,
+        width_pct=np.array(width_pcts, dtype=np.float64),
+    )
 
-        start_dt = pd.Timestamp(base_start["time"]).to_pydatetime()
-        end_dt = pd.Timestamp(base_end["time"]).to_pydatetime()
-
-        zones.append(
-            Zone(
-                zone_type=zone_type,
-                pattern=pattern,
-                price_low=zone_low,
-                price_high=zone_high,
-                start_date=start_dt,
-                end_date=end_dt,
-                strength=strength,
-                fresh=fresh,
-                test_count=test_count,
-                volume_confirmed=volume_confirmed,
-                move_size_pct=move_size_pct,
-            )
+    # Convert base start/end times to datetimes in one batch
+    num_zones = len(positions)
+    bound_pos = np.array(base_starts + base_ends, dtype=np.int64)
+    dates = pd.DatetimeIndex(times[bound_pos]).to_pydatetime()
+
+    strengths = strengths.tolist()
+    volume_confirmed = volume_confirmed.tolist()
+    move_size_pct = move_size_pct.tolist()
+    fresh = fresh.tolist()
+    test_count = test_count.tolist()
+    zones = [
+        Zone(
+            zone_type=_ZONE_TYPES[keys[i]],
+            pattern=_PATTERNS[keys[i]],
+            price_low=zone_lows[i],
+            price_high=zone_highs[i],
+            start_date=dates[i],
+            end_date=dates[num_zones + i],
+            strength=strengths[i],
+            fresh=fresh[i],
+            test_count=test_count[i],
+            volume_confirmed=volume_confirmed[i],
+            move_size_pct=move_size_pct[i],
         )
+        for i in range(num_zones)
+    ]
 
     # Remove duplicate/overlapping zones
     zones = _deduplicate_zones(zones)
 
-    # Sort by strength
-    zones.sort(key=lambda z: -z.strength)
+    # Sort by strength; stable, so ties keep price order
+    strengths = np.fromiter((z.strength for z in zones), dtype=np.int64, count=len(zones))
+    zones = [zones[i] for i in np.argsort(-strengths, kind="stable").tolist()]
 
     logger.info(
         f"Found {len(zones)} zones: "
@@ -208,7 +245,11 @@ def identify_zones(
 
 
 def _find_base_zone(
-    df: pd.DataFrame, explosive_pos: int, max_bars: int
+    highs: np.ndarray,
+    lows: np.ndarray,
+    bar_move_pct: np.ndarray,
+    explosive_pos: int,
+    max_bars: int,
 ) -> Optional[tuple[int, int]]:
     """Find the consolidation base before an explosive move.
 
@@ -219,84 +260,102 @@ def _find_base_zone(
     if base_end_pos < 0:
         return None
 
-    base_start_pos = base_end_pos
+    base_start_pos = _walk_base_start(
+        highs, lows, base_end_pos, max_bars, float(bar_move_pct[explosive_pos])
+    )
 
-    # Walk backward looking for small bars (consolidation)
+    # Must have at least 1 bar in the base
+    if base_start_pos == base_end_pos and base_end_pos > 0:
+        base_start_pos = base_end_pos - 1
+
+    if base_start_pos < 0:
+        return None
+
+    return base_start_pos, base_end_pos
+
+
+@njit(cache=True, nogil=True)
+def _walk_base_start(highs, lows, base_end_pos, max_bars, explosive_range_pct):
+    """Walk backward from base_end_pos while bars stay small (consolidation)."""
+    base_start_pos = base_end_pos
     for i in range(base_end_pos, max(0, base_end_pos - max_bars), -1):
-        bar_range = (df["high"].iloc[i] - df["low"].iloc[i])
-        bar_mid = (df["high"].iloc[i] + df["low"].iloc[i]) / 2
+        bar_range = highs[i] - lows[i]
+        bar_mid = (highs[i] + lows[i]) / 2
         if bar_mid == 0:
             break
         bar_range_pct = (bar_range / bar_mid) * 100
 
         # If bar range is less than half the explosive move, it's part of the base
-        explosive_range_pct = float(df["bar_move_pct"].iloc[explosive_pos])
         if bar_range_pct < explosive_range_pct * 0.7:
             base_start_pos = i
         else:
             break
+    return base_start_pos
 
-    # Must have at least 1 bar in the base
-    if base_start_pos == base_end_pos and base_end_pos > 0:
-        base_start_pos = base_end_pos - 1
-
-    if base_start_pos < 0:
-        return None
-
-    return base_start_pos, base_end_pos
 
+def _get_pre_move_directions(closes: np.ndarray, base_starts: np.ndarray) -> np.ndarray:
+    """Determine the price direction leading into each base zone.
 
-def _get_pre_move_direction(df: pd.DataFrame, base_start_pos: int) -> int:
-    """Determine the price direction leading into the base zone."""
-    lookback = min(5, base_start_pos)
-    if lookback < 1:
-        return 0
-
-    pre_close = float(df["close"].iloc[base_start_pos - lookback])
-    base_close = float(df["close"].iloc[base_start_pos])
-
-    if base_close > pre_close:
-        return 1  # Was rallying into base
-    elif base_close < pre_close:
-        return -1  # Was dropping into base
-    return 0
+    1 if price was rallying into the base, -1 if dropping, 0 if flat (or
+    either close is NaN). A base starting at bar 0 compares the bar with
+    itself, so it also gets 0.
+    """
+    lookback = np.minimum(5, base_starts)
+    pre_close = closes[base_starts - lookback]
+    base_close = closes[base_starts]
+    return (base_close > pre_close).astype(np.int64) - (base_close < pre_close)
 
 
 def _check_zone_freshness(
-    df: pd.DataFrame,
-    explosive_pos: int,
-    zone_low: float,
-    zone_high: float,
-    zone_type: str,
-) -> tuple[bool, int]:
-    """Check if a zone has been revisited since its creation.
+    lows: np.ndarray,
+    highs: np.ndarray,
+    explosive_pos: np.ndarray,
+    zone_lows: np.ndarray,
+    zone_highs: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Check which zones have been revisited since their creation.
 
     A fresh zone has never been tested - price hasn't returned to it.
+    Returns (fresh, test_count) arrays, one entry per zone.
     """
-    test_count = 0
-    fresh = True
-
-    for i in range(explosive_pos + 1, len(df)):
-        bar_low = df["low"].iloc[i]
-        bar_high = df["high"].iloc[i]
-
-        # Check if price entered the zone
-        if bar_low <= zone_high and bar_high >= zone_low:
-            test_count += 1
-            fresh = False
-
-    return fresh, test_count
-
-
-def _calculate_zone_strength(
-    move_size_pct: float,
-    volume_confirmed: bool,
-    fresh: bool,
-    test_count: int,
-    pattern: str,
-    width_pct: float,
-) -> int:
-    """Calculate zone strength (1-10).
+    if HAS_NUMBA:
+        test_count = _count_zone_tests(lows, highs, explosive_pos, zone_lows, zone_highs)
+    else:
+        test_count = np.zeros(len(explosive_pos), dtype=np.int64)
+        for k, pos in enumerate(explosive_pos.tolist()):
+            # Bars after the explosive move that entered the zone
+            hits = (lows[pos + 1 :] <= zone_highs[k]) & (highs[pos + 1 :] >= zone_lows[k])
+            test_count[k] = np.count_nonzero(hits)
+    return test_count == 0, test_count
+
+
+@njit(cache=True, nogil=True)
+def _count_zone_tests(lows, highs, explosive_pos, zone_lows, zone_highs):
+    """Count the bars after each explosive move whose range entered its zone."""
+    test_count = np.zeros(explosive_pos.shape[0], dtype=np.int64)
+    for k in range(explosive_pos.shape[0]):
+        zone_low = zone_lows[k]
+        zone_high = zone_highs[k]
+        for i in range(explosive_pos[k] + 1, lows.shape[0]):
+            if lows[i] <= zone_high and highs[i] >= zone_low:
+                test_count[k] += 1
+    return test_count
+
+
+# Pattern contribution to zone strength, indexed like _PATTERNS
+# (DBD, RBD, DBR, RBR): reversals beat continuations
+_PATTERN_SCORES = np.array([1.5, 2.0, 2.0, 1.5])
+
+
+def _calculate_zone_strengths(
+    move_size_pct: np.ndarray,
+    volume_confirmed: np.ndarray,
+    fresh: np.ndarray,
+    test_count: np.ndarray,
+    pattern_key: np.ndarray,
+    width_pct: np.ndarray,
+) -> np.ndarray:
+    """Calculate zone strengths (1-10) for many zones at once.
 
     Factors:
     - Move size: Bigger explosive move = stronger zone
@@ -305,65 +364,76 @@ def _calculate_zone_strength(
     - Pattern: Reversal patterns (DBR, RBD) stronger than continuation
     - Width: Tighter zones are stronger (more precise institutional orders)
     """
-    score = 0.0
-
     # Move size (0-3)
-    if move_size_pct >= 8:
-        score += 3.0
-    elif move_size_pct >= 5:
-        score += 2.0
-    elif move_size_pct >= 3:
-        score += 1.5
-    else:
-        score += 1.0
+    score = np.select(
+        [move_size_pct >= 8, move_size_pct >= 5, move_size_pct >= 3],
+        [3.0, 2.0, 1.5],
+        default=1.0,
+    )
 
     # Volume (0-2)
-    if volume_confirmed:
-        score += 2.0
+    score += np.where(volume_confirmed, 2.0, 0.0)
 
-    # Freshness (0-2)
-    if fresh:
-        score += 2.0
-    elif test_count <= 1:
-        score += 1.0
-    # Tested 2+ times = less reliable, no points
+    # Freshness (0-2); tested 2+ times = less reliable, no points
+    score += np.where(fresh, 2.0, np.where(test_count <= 1, 1.0, 0.0))
 
     # Pattern (0-2)
-    pattern_scores = {"DBR": 2.0, "RBD": 2.0, "RBR": 1.5, "DBD": 1.5}
-    score += pattern_scores.get(pattern, 1.0)
+    score += _PATTERN_SCORES[pattern_key]
 
     # Width (0-1): tighter is better
-    if width_pct < 2:
-        score += 1.0
-    elif width_pct < 5:
-        score += 0.5
+    score += np.select([width_pct < 2, width_pct < 5], [1.0, 0.5], default=0.0)
 
-    return max(1, min(10, round(score)))
+    # Scores are multiples of 0.5, so np.round's half-to-even matches round()
+    return np.clip(np.round(score), 1, 10).astype(np.int64)
 
 
 def _deduplicate_zones(zones: list[Zone]) -> list[Zone]:
-    """Remove overlapping zones, keeping the stronger one."""
+    """Remove overlapping zones, keeping the stronger one.
+
+    Each zone is compared with the last zone kept so far, so a zone that
+    only overlaps a discarded neighbour still survives.
+    """
     if len(zones) <= 1:
         return zones
 
     # Sort by price
     zones.sort(key=lambda z: z.price_low)
-    result = [zones[0]]
-
-    for zone in zones[1:]:
-        prev = result[-1]
-        # Check overlap
-        overlap = min(prev.price_high, zone.price_high) - max(prev.price_low, zone.price_low)
-        min_width = min(prev.width, zone.width)
+    lows = np.array([z.price_low for z in zones], dtype=np.float64)
+    highs = np.array([z.price_high for z in zones], dtype=np.float64)
+
+    # Overlap ratio of every pair of price-adjacent zones, in one pass.
+    # where() keeps builtin min()/max() argument precedence for NaN prices
+    widths = highs - lows
+    prev_w, next_w = widths[:-1], widths[1:]
+    prev_lo, next_lo, prev_hi, next_hi = lows[:-1], lows[1:], highs[:-1], highs[1:]
+    min_width = np.where(next_w < prev_w, next_w, prev_w)
+    overlap = np.where(next_hi < prev_hi, next_hi, prev_hi) - np.where(
+        next_lo > prev_lo, next_lo, prev_lo
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        adjacent_merge = ((min_width > 0) & (overlap / min_width > 0.5)).tolist()
+    lows, highs, widths = lows.tolist(), highs.tolist(), widths.tolist()
+    strengths = [z.strength for z in zones]
+
+    kept = [0]
+    for i in range(1, len(zones)):
+        prev = kept[-1]
+        if prev == i - 1:
+            merge = adjacent_merge[i - 1]
+        else:
+            # The neighbour was dropped; compare with the zone that absorbed it
+            overlap = min(highs[prev], highs[i]) - max(lows[prev], lows[i])
+            min_width = min(widths[prev], widths[i])
+            merge = min_width > 0 and overlap / min_width > 0.5
 
-        if min_width > 0 and overlap / min_width > 0.5:
+        if merge:
             # Significant overlap - keep the stronger one
-            if zone.strength > prev.strength:
-                result[-1] = zone
+            if strengths[i] > strengths[prev]:
+                kept[-1] = i
         else:
-            result.append(zone)
+            kept.append(i)
 
-    return result
+    return [zones[i] for i in kept]
 
 
 def summarize_zones(zones: list[Zone], current_price: float) -> dict:
@@ -4,24 +4,32 @@ Usage:
     python -m src.main --symbol WHR --csv data/samples/NYSE_WHR__1M.csv
     python -m src.main --symbol WHR --csv data/samples/NYSE_WHR__1M.csv --tier standard --format html
     python -m src.main --symbol WHR --csv data/samples/NYSE_WHR__1M.csv --output data/reports/WHR_report.md
+    python -m src.main --symbols WHR,AAPL --csv WHR.csv AAPL.csv --jobs 2 --output data/reports
 
 Options:
-    --symbol        Stock ticker symbol (required)
-    --csv           Path to TradingView CSV file (required)
+    --symbol        Stock ticker symbol (this or --symbols is required)
+    --symbols       Comma-separated tickers, analyzed in parallel processes
+    --csv           Path to TradingView CSV file, one per symbol (required)
     --tier          Analysis tier: lite, standard, premium (default: standard)
     --format        Output format: markdown, json, html (default: markdown)
-    --output        Save report to file (optional)
+    --output        Save report to file; a directory with --symbols (optional)
     --min-gap-pct   Minimum gap size percentage (default: 2.0)
     --news-days     Days to look back for news (default: 7)
     --budget        Budget override in USD (optional)
+    --jobs          Worker processes for --symbols (default: CPU count)
     --quiet         Suppress progress output
 """
 
 import argparse
+import multiprocessing
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional
 
-from src.orchestrator import TradingAnalysisOrchestrator
+# File extensions for reports written by --symbols into an --output directory
+REPORT_EXTENSIONS = {"markdown": "md", "json": "json", "html": "html"}
 
 
 def parse_args() -> argparse.Namespace:
@@ -40,13 +48,23 @@ Examples:
   %(prog)s --symbol WHR --csv data/samples/NYSE_WHR__1M.csv --tier lite
   %(prog)s --symbol WHR --csv data/samples/NYSE_WHR__1M.csv --format html -o report.html
   %(prog)s --symbol WHR --csv data/samples/NYSE_WHR__1M.csv --tier standard --format json
+  %(prog)s --symbols WHR,AAPL --csv WHR.csv AAPL.csv --jobs 2 -o data/reports
         """,
     )
-    parser.add_argument(
-        "--symbol", required=True, help="Stock ticker symbol (e.g., WHR)"
+    symbol_group = parser.add_mutually_exclusive_group(required=True)
+    symbol_group.add_argument(
+        "--symbol", help="Stock ticker symbol (e.g., WHR)"
+    )
+    symbol_group.add_argument(
+        "--symbols",
+        type=lambda s: [sym.strip() for sym in s.split(",") if sym.strip()],
+        help="Comma-separated ticker symbols to analyze in parallel",
     )
     parser.add_argument(
-        "--csv", required=True, help="Path to TradingView CSV file"
+        "--csv",
+        required=True,
+        nargs="+",
+        help="Path to TradingView CSV file (one per symbol, in --symbols order)",
     )
     parser.add_argument(
         "--tier",
@@ -78,11 +96,36 @@ Examples:
     parser.add_argument(
         "--budget", type=float, default=None, help="Budget override in USD"
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Worker processes for --symbols (default: CPU count)",
+    )
     parser.add_argument(
         "--quiet", "-q", action="store_true", help="Suppress progress output"
     )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.symbols == []:
+        parser.error("--symbols needs at least one symbol")
+    num_symbols = len(args.symbols) if args.symbols else 1
+    if len(args.csv) != num_symbols:
+        parser.error(
+            f"expected {num_symbols} CSV file(s) for {num_symbols} symbol(s), got {len(args.csv)}"
+        )
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.symbols:
+        # A repeated symbol would have two workers writing the same report;
+        # keep the first occurrence and its CSV
+        pairs: dict[str, tuple[str, str]] = {}
+        for symbol, csv_file in zip(args.symbols, args.csv):
+            pairs.setdefault(symbol.upper(), (symbol, csv_file))
+        args.symbols = [symbol for symbol, _ in pairs.values()]
+        args.csv = [csv_file for _, csv_file in pairs.values()]
+    return args
 
 
 def main() -> int:
@@ -94,15 +137,23 @@ def main() -> int:
     args = parse_args()
 
     # Validate CSV exists
-    csv_path = Path(args.csv)
-    if not csv_path.exists():
-        print(f"Error: CSV file not found: {args.csv}", file=sys.stderr)
-        return 1
+    for csv_file in args.csv:
+        if not Path(csv_file).exists():
+            print(f"Error: CSV file not found: {csv_file}", file=sys.stderr)
+            return 1
+
+    if args.symbols:
+        return _main_batch(args)
+
+    csv_path = Path(args.csv[0])
+
+    # Imported here so --help and argument errors don't pay for pandas and the analyzers
+    from src.orchestrator import TradingAnalysisOrchestrator
 
     if not args.quiet:
         print(f"Trading Analyzer")
         print(f"  Symbol: {args.symbol}")
-        print(f"  CSV:    {args.csv}")
+        print(f"  CSV:    {csv_path}")
         print(f"  Tier:   {args.tier}")
         print(f"  Format: {args.format}")
         print()
@@ -166,5 +217,119 @@ def main() -> int:
     return 0
 
 
+def _main_batch(args: argparse.Namespace) -> int:
+    """Analyze several symbols, one worker process per symbol.
+
+    Each symbol runs the full pipeline independently. Reports are printed
+    in --symbols order, or written into the --output directory.
+
+    Returns:
+        Exit code (0 = every symbol succeeded, 1 = any failed).
+    """
+    if args.output:
+        Path(args.output).mkdir(parents=True, exist_ok=True)
+
+    jobs = min(args.jobs or os.cpu_count() or 1, len(args.symbols))
+    if not args.quiet:
+        print(f"Trading Analyzer")
+        print(f"  Symbols: {', '.join(args.symbols)}")
+        print(f"  Tier:    {args.tier}")
+        print(f"  Format:  {args.format}")
+        print(f"  Jobs:    {jobs}")
+        print()
+
+    # spawn gives each worker a clean interpreter; the initializer pays the
+    # pandas/analyzer import cost once per worker instead of per symbol
+    failed = 0
+    total_cost = 0.0
+    total_calls = 0
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _analyze_symbol, symbol, csv_file, args, _batch_output_path(args, symbol)
+                )
+                for symbol, csv_file in zip(args.symbols, args.csv)
+            ]
+
+            for symbol, future in zip(args.symbols, futures):
+                try:
+                    report, cost_summary, errors = future.result()
+                except Exception as e:
+                    failed += 1
+                    print(f"Error ({symbol}): {e}", file=sys.stderr)
+                    continue
+
+                total_cost += cost_summary.get("total_cost", 0)
+                total_calls += cost_summary.get("total_calls", 0)
+                if args.output:
+                    if not args.quiet:
+                        print(f"{symbol}: report saved to {_batch_output_path(args, symbol)}")
+                else:
+                    print(report)
+                if errors and not args.quiet:
+                    print(f"  {symbol} warnings: {len(errors)}")
+                    for err in errors:
+                        print(f"    - {err}")
+    except KeyboardInterrupt:
+        print("\nAborted.", file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        print(f"\n--- Cost Summary ---")
+        print(f"  Total:   ${total_cost:.4f}")
+        print(f"  Calls:   {total_calls}")
+        print(f"  Symbols: {len(args.symbols) - failed}/{len(args.symbols)} succeeded")
+
+    return 1 if failed else 0
+
+
+def _batch_output_path(args: argparse.Namespace, symbol: str) -> Optional[str]:
+    """Report path for one symbol inside the --output directory, if any."""
+    if not args.output:
+        return None
+    return str(Path(args.output) / f"{symbol}_report.{REPORT_EXTENSIONS[args.format]}")
+
+
+def _init_worker() -> None:
+    """Import the pipeline once when a worker process starts."""
+    import src.orchestrator  # noqa: F401
+
+
+def _analyze_symbol(
+    symbol: str,
+    csv_file: str,
+    args: argparse.Namespace,
+    output_path: Optional[str],
+) -> tuple[str, dict, list]:
+    """Run the pipeline for one symbol in a worker process.
+
+    Returns:
+        (report, cost_summary, errors) - plain data that pickles back cheaply.
+    """
+    from src.orchestrator import TradingAnalysisOrchestrator
+
+    orchestrator = TradingAnalysisOrchestrator(
+        tier=args.tier,
+        budget=args.budget,
+    )
+    result = orchestrator.analyze(
+        symbol=symbol,
+        csv_file=csv_file,
+        min_gap_pct=args.min_gap_pct,
+        news_lookback_days=args.news_days,
+    )
+    report = orchestrator.generate_report(
+        result=result,
+        format=args.format,
+        output_path=output_path,
+    )
+    return report, result.get("cost_summary", {}), result.get("errors", [])
+
+
 if __name__ == "__main__":
     sys.exit(main())
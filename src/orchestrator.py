@@ -16,7 +16,7 @@ from typing import Optional
 from src.agents.fundamental_agent import FundamentalAgent
 from src.agents.news_agent import NewsAgent
 from src.agents.synthesis_agent import SynthesisAgent
-from src.analyzers.gap_analyzer import detect_gaps, summarize_gaps
+from src.analyzers.gap_analyzer import detect_gap_table, summarize_gaps
 from src.analyzers.sr_calculator import (
     calculate_levels,
     detect_confluence,
@@ -292,57 +292,58 @@ class TradingAnalysisOrchestrator:
             df = parsed.df
             current_price = float(df["close"].iloc[-1])
 
-            gaps = detect_gaps(df, min_gap_pct=min_gap_pct)
+            gaps = detect_gap_table(df, min_gap_pct=min_gap_pct)
             zones = identify_zones(df)
 
             # ── Multi-timeframe S/R ────────────────────────────────
+            # Timeframes are independent and the compiled S/R kernels release
+            # the GIL, so each one is calculated on its own worker thread.
+            # The user timeframe starts while daily/weekly bars are fetched.
             user_tf = parsed.timeframe or ""
-            all_levels = calculate_levels(
-                df,
-                current_price=current_price,
-                lookback_bars=len(df),
-                timeframe_label=user_tf,
-            )
             timeframes_analyzed = [user_tf] if user_tf else []
             lookback_periods: dict[str, str] = {}
             if user_tf:
                 lookback_periods[user_tf] = f"{len(df)} bars"
 
-            # Fetch daily + weekly data if we have a symbol
-            if symbol:
-                try:
-                    extra = fetch_sr_timeframes(symbol)
-                except Exception as e:
-                    logger.warning(f"Multi-TF fetch failed: {e}")
-                    extra = {}
-
-                daily_df = extra.get("daily")
-                if daily_df is not None and not daily_df.empty:
-                    daily_levels = calculate_levels(
-                        daily_df,
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                sr_jobs = [
+                    executor.submit(
+                        calculate_levels,
+                        df,
                         current_price=current_price,
-                        lookback_bars=63,
-                        timeframe_label="daily",
-                    )
-                    all_levels.extend(daily_levels)
-                    timeframes_analyzed.append("daily")
-                    lookback_periods["daily"] = (
-                        f"3 months ({len(daily_df)} bars)"
-                    )
-
-                weekly_df = extra.get("weekly")
-                if weekly_df is not None and not weekly_df.empty:
-                    weekly_levels = calculate_levels(
-                        weekly_df,
-                        current_price=current_price,
-                        lookback_bars=26,
-                        timeframe_label="weekly",
-                    )
-                    all_levels.extend(weekly_levels)
-                    timeframes_analyzed.append("weekly")
-                    lookback_periods["weekly"] = (
-                        f"6 months ({len(weekly_df)} bars)"
+                        lookback_bars=len(df),
+                        timeframe_label=user_tf,
                     )
+                ]
+
+                # Fetch daily + weekly data if we have a symbol
+                if symbol:
+                    try:
+                        extra = fetch_sr_timeframes(symbol)
+                    except Exception as e:
+                        logger.warning(f"Multi-TF fetch failed: {e}")
+                        extra = {}
+
+                    for label, lookback_bars, period in (
+                        ("daily", 63, "3 months"),
+                        ("weekly", 26, "6 months"),
+                    ):
+                        tf_df = extra.get(label)
+                        if tf_df is not None and not tf_df.empty:
+                            sr_jobs.append(
+                                executor.submit(
+                                    calculate_levels,
+                                    tf_df,
+                                    current_price=current_price,
+                                    lookback_bars=lookback_bars,
+                                    timeframe_label=label,
+                                )
+                            )
+                            timeframes_analyzed.append(label)
+                            lookback_periods[label] = f"{period} ({len(tf_df)} bars)"
+
+                # Collect in submission order: user timeframe, daily, weekly
+                all_levels = [level for job in sr_jobs for level in job.result()]
 
             # Merge confluence across timeframes
             if len(timeframes_analyzed) > 1:
@@ -4,26 +4,38 @@ Converts the orchestrator result dict into a clean, readable Markdown report.
 Uses Evidence Scorecard + Checklist Method (NO fake percentages).
 """
 
+import io
 from datetime import datetime
 from typing import Optional
 
+# (key, default) pairs read from each gap / zone row, in table column order
+_GAP_FIELDS = (
+    ("date", ""), ("type", ""), ("gap_pct", 0), ("gap_low", 0), ("gap_high", 0), ("filled", None)
+)
+_ZONE_FIELDS = (("type", ""), ("low", 0), ("high", 0), ("strength", ""))
+
 
 class MarkdownGenerator:
     """Generate Markdown reports from analysis results.
 
     Args:
         result: Complete analysis result dict from TradingAnalysisOrchestrator.
+            An optional ``generated_at`` string ("YYYY-MM-DD HH:MM:SS") is
+            used as the report timestamp, so a batch can share one.
     """
 
-    def __init__(self, result: dict):
-        self.result = result
-        self.metadata = result.get("metadata", {})
-        self.technical = result.get("technical", {})
-        self.news = result.get("news", {})
-        self.fundamental = result.get("fundamental", {})
-        self.synthesis = result.get("synthesis", {})
-        self.cost_summary = result.get("cost_summary", {})
-        self.errors = result.get("errors", [])
+    def __init__(self, result: dict) -> None:
+        self.result: dict = result
+        self.metadata: dict = result.get("metadata", {})
+        self.technical: dict = result.get("technical", {})
+        self.news: dict = result.get("news", {})
+        self.fundamental: dict = result.get("fundamental", {})
+        self.synthesis: dict = result.get("synthesis", {})
+        self.cost_summary: dict = result.get("cost_summary", {})
+        self.errors: list = result.get("errors", [])
+        self._generated_at: str = result.get("generated_at") or datetime.now().strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
 
     def generate(self) -> str:
         """Generate the full Markdown report.
@@ -31,334 +43,295 @@ class MarkdownGenerator:
         Returns:
             Complete Markdown report as a string.
         """
-        sections = [
-            self._header(),
-            self._metadata_section(),
-            self._technical_section(),
-            self._news_section(),
-            self._fundamental_section(),
-            self._synthesis_section(),
-            self._cost_section(),
-            self._errors_section(),
-            self._footer(),
-        ]
-        return "\n".join(s for s in sections if s)
-
-    def _header(self) -> str:
-        """Generate report header."""
-        symbol = self.metadata.get("symbol", "UNKNOWN")
-        tier = self.metadata.get("tier_label", self.metadata.get("tier", ""))
-        return (
+        # (data, writer) pairs; sections whose data is empty are skipped
+        # without calling the writer at all
+        sections = (
+            (True, self._header),
+            (True, self._metadata_section),
+            (self.technical, self._technical_section),
+            (self.news, self._news_section),
+            (self.fundamental, self._fundamental_section),
+            (self.synthesis, self._synthesis_section),
+            (self.cost_summary, self._cost_section),
+            (self.errors, self._errors_section),
+            (True, self._footer),
+        )
+        # Every section writes into one buffer, followed by a separator
+        out = io.StringIO()
+        for data, write_section in sections:
+            if data:
+                write_section(out)
+                out.write("\n")
+        # Drop the separator after the last section
+        out.truncate(max(out.tell() - 1, 0))
+        return out.getvalue()
+
+    def _header(self, out: io.StringIO) -> None:
+        """Write report header."""
+        get = self.metadata.get
+        symbol = get("symbol", "UNKNOWN")
+        tier = get("tier_label", get("tier", ""))
+        out.write(
             f"# Trading Analysis: {symbol}\n\n"
             f"**Tier:** {tier}  \n"
-            f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  \n"
+            f"**Generated:** {self._generated_at}  \n"
         )
 
-    def _metadata_section(self) -> str:
-        """Generate metadata section."""
-        lines = ["## Data Summary\n"]
-        bars = self.metadata.get("bars", "N/A")
-        tf = self.metadata.get("timeframe", "N/A")
-        dr = self.metadata.get("date_range", [])
+    def _metadata_section(self, out: io.StringIO) -> None:
+        """Write metadata section."""
+        get = self.metadata.get
+        bars = get("bars", "N/A")
+        tf = get("timeframe", "N/A")
+        dr = get("date_range", [])
         date_range_str = f"{dr[0]} to {dr[1]}" if len(dr) >= 2 else "N/A"
-
-        lines.append(f"| Field | Value |")
-        lines.append(f"|-------|-------|")
-        lines.append(f"| Bars | {bars} |")
-        lines.append(f"| Timeframe | {tf} |")
-        lines.append(f"| Date Range | {date_range_str} |")
+        out.write(
+            f"## Data Summary\n\n"
+            f"| Field | Value |\n"
+            f"|-------|-------|\n"
+            f"| Bars | {bars} |\n"
+            f"| Timeframe | {tf} |\n"
+            f"| Date Range | {date_range_str} |\n"
+        )
         if "quality_score" in self.metadata:
-            lines.append(f"| Quality Score | {self.metadata['quality_score']} |")
-        lines.append("")
-        return "\n".join(lines)
+            out.write(f"| Quality Score | {self.metadata['quality_score']} |\n")
 
-    def _technical_section(self) -> str:
-        """Generate technical analysis section."""
+    def _technical_section(self, out: io.StringIO) -> None:
+        """Write technical analysis section."""
         if not self.technical:
-            return ""
+            return
 
-        lines = ["## Technical Analysis\n"]
+        out.write("## Technical Analysis\n\n")
+        get = self.technical.get
 
         # Current price
-        price = self.technical.get("current_price")
+        price = get("current_price")
         if price:
-            lines.append(f"**Current Price:** ${price:,.2f}\n")
+            out.write(f"**Current Price:** ${price:,.2f}\n\n")
 
         # Gaps
-        gaps = self.technical.get("gaps", {})
+        gaps = get("gaps", {})
         total_gaps = gaps.get("total", 0)
         unfilled = gaps.get("unfilled", 0)
-        lines.append(f"### Gaps\n")
-        lines.append(f"- **Total gaps detected:** {total_gaps}")
-        lines.append(f"- **Unfilled gaps:** {unfilled}")
+        out.write(
+            f"### Gaps\n\n"
+            f"- **Total gaps detected:** {total_gaps}\n"
+            f"- **Unfilled gaps:** {unfilled}"
+        )
 
         gap_list = gaps.get("gaps", [])
         if gap_list:
-            lines.append(f"\n| Date | Type | Size | Gap Range | Filled |")
-            lines.append(f"|------|------|------|-----------|--------|")
-            for g in gap_list[:15]:
-                date = g.get("date", "")
-                gtype = g.get("type", "")
-                size = g.get("gap_pct", 0)
-                low = g.get("gap_low", 0)
-                high = g.get("gap_high", 0)
-                filled = "Yes" if g.get("filled") else "No"
-                lines.append(
-                    f"| {date} | {gtype} | {size:.1f}% | "
-                    f"${low:,.2f} - ${high:,.2f} | {filled} |"
-                )
-        lines.append("")
+            out.write(
+                "\n\n| Date | Type | Size | Gap Range | Filled |\n"
+                "|------|------|------|-----------|--------|"
+            )
+            rows = ([g.get(k, d) for k, d in _GAP_FIELDS] for g in gap_list[:15])
+            out.write("".join(
+                f"\n| {date} | {gtype} | {size:.1f}% | "
+                f"${low:,.2f} - ${high:,.2f} | {'Yes' if filled else 'No'} |"
+                for date, gtype, size, low, high, filled in rows
+            ))
+        out.write("\n\n")
 
         # Support/Resistance
-        sr = self.technical.get("support_resistance", {})
-        lines.append("### Support & Resistance\n")
+        sr = get("support_resistance", {})
+        out.write("### Support & Resistance\n")
         supports = sr.get("supports", [])
         resistances = sr.get("resistances", [])
-
         if supports:
-            lines.append("**Support Levels:**")
-            for s in supports[:5]:
-                level = s.get("level", s.get("price", 0))
-                strength = s.get("strength", "")
-                distance = s.get("distance_pct", 0)
-                lines.append(
-                    f"- ${level:,.2f} (strength: {strength}, "
-                    f"distance: {distance:+.1f}%)"
-                )
-            lines.append("")
-
+            _write_levels(out, "**Support Levels:**", supports[:5])
         if resistances:
-            lines.append("**Resistance Levels:**")
-            for r in resistances[:5]:
-                level = r.get("level", r.get("price", 0))
-                strength = r.get("strength", "")
-                distance = r.get("distance_pct", 0)
-                lines.append(
-                    f"- ${level:,.2f} (strength: {strength}, "
-                    f"distance: {distance:+.1f}%)"
-                )
-            lines.append("")
+            _write_levels(out, "**Resistance Levels:**", resistances[:5])
 
         # Supply/Demand zones
-        sd = self.technical.get("supply_demand", {})
+        sd = get("supply_demand", {})
         zones = sd.get("zones", [])
         if zones:
-            lines.append("### Supply/Demand Zones\n")
-            for z in zones[:10]:
-                ztype = z.get("type", "")
-                low = z.get("low", 0)
-                high = z.get("high", 0)
-                strength = z.get("strength", "")
-                lines.append(
-                    f"- **{ztype.title()}:** ${low:,.2f} - ${high:,.2f} "
-                    f"(strength: {strength})"
-                )
-            lines.append("")
-
-        return "\n".join(lines)
-
-    def _news_section(self) -> str:
-        """Generate news analysis section."""
+            out.write("\n### Supply/Demand Zones\n\n")
+            rows = ([z.get(k, d) for k, d in _ZONE_FIELDS] for z in zones[:10])
+            out.write("".join(
+                f"- **{ztype.title()}:** ${low:,.2f} - ${high:,.2f} "
+                f"(strength: {strength})\n"
+                for ztype, low, high, strength in rows
+            ))
+
+    def _news_section(self, out: io.StringIO) -> None:
+        """Write news analysis section."""
         if not self.news:
-            return ""
+            return
 
-        lines = ["## News Sentiment\n"]
+        out.write("## News Sentiment\n")
+        get = self.news.get
 
-        score = self.news.get("sentiment_score")
-        ns = self.news.get("news_sentiment", {})
+        score = get("sentiment_score")
+        ns = get("news_sentiment", {})
         interpretation = ns.get("interpretation", "")
         if score is not None:
-            lines.append(f"**Sentiment Score:** {score}/10 ({interpretation})\n")
-
-        articles = self.news.get("article_count", 0)
-        lines.append(f"**Articles Analyzed:** {articles}\n")
-
-        # Catalysts
-        catalysts = self.news.get("catalysts", [])
-        if catalysts:
-            lines.append("### Catalysts")
-            for c in catalysts:
-                lines.append(f"- {c}")
-            lines.append("")
-
-        # Key themes
-        themes = self.news.get("key_themes", [])
-        if themes:
-            lines.append("### Key Themes")
-            for t in themes:
-                lines.append(f"- {t}")
-            lines.append("")
-
-        # Summary
-        summary = self.news.get("summary", "")
-        if summary:
-            lines.append("### Summary\n")
-            lines.append(f"{summary}\n")
-
-        return "\n".join(lines)
-
-    def _fundamental_section(self) -> str:
-        """Generate fundamental analysis section."""
+            out.write(f"\n**Sentiment Score:** {score}/10 ({interpretation})\n")
+
+        articles = get("article_count", 0)
+        out.write(f"\n**Articles Analyzed:** {articles}\n")
+
+        _write_bullets(out, "### Catalysts", get("catalysts", []))
+        _write_bullets(out, "### Key Themes", get("key_themes", []))
+        _write_text(out, "### Summary", get("summary", ""))
+
+    def _fundamental_section(self, out: io.StringIO) -> None:
+        """Write fundamental analysis section."""
         if not self.fundamental:
-            return ""
+            return
 
-        lines = ["## Fundamental Analysis\n"]
+        get = self.fundamental.get
 
         # Financial health
-        fh = self.fundamental.get("financial_health", {})
+        fh = get("financial_health", {})
         grade = fh.get("overall_grade", "N/A")
-        lines.append(f"**Overall Grade:** {grade}\n")
+        out.write(f"## Fundamental Analysis\n\n**Overall Grade:** {grade}\n")
 
         if fh.get("revenue_trend"):
-            lines.append(f"- Revenue Trend: {fh['revenue_trend']}")
+            out.write(f"\n- Revenue Trend: {fh['revenue_trend']}")
         if fh.get("profit_margin_trend"):
-            lines.append(f"- Profit Margin Trend: {fh['profit_margin_trend']}")
+            out.write(f"\n- Profit Margin Trend: {fh['profit_margin_trend']}")
         if fh.get("debt_level"):
-            lines.append(f"- Debt Level: {fh['debt_level']}")
+            out.write(f"\n- Debt Level: {fh['debt_level']}")
         if fh.get("cash_position"):
-            lines.append(f"- Cash Position: {fh['cash_position']}")
-        lines.append("")
-
-        # Key risks
-        risks = self.fundamental.get("key_risks", [])
-        if risks:
-            lines.append("### Key Risks")
-            for r in risks:
-                lines.append(f"- {r}")
-            lines.append("")
-
-        # Opportunities
-        opps = self.fundamental.get("opportunities", [])
-        if opps:
-            lines.append("### Opportunities")
-            for o in opps:
-                lines.append(f"- {o}")
-            lines.append("")
-
-        # Management commentary
-        commentary = self.fundamental.get("management_commentary", "")
-        if commentary:
-            lines.append("### Management Commentary\n")
-            lines.append(f"{commentary}\n")
-
-        return "\n".join(lines)
-
-    def _synthesis_section(self) -> str:
-        """Generate synthesis section (Opus analysis)."""
+            out.write(f"\n- Cash Position: {fh['cash_position']}")
+        out.write("\n")
+
+        _write_bullets(out, "### Key Risks", get("key_risks", []))
+        _write_bullets(out, "### Opportunities", get("opportunities", []))
+        _write_text(out, "### Management Commentary", get("management_commentary", ""))
+
+    def _synthesis_section(self, out: io.StringIO) -> None:
+        """Write synthesis section (Opus analysis)."""
         if not self.synthesis:
-            return ""
+            return
 
-        lines = ["## Synthesis & Verdict\n"]
+        get = self.synthesis.get
 
-        verdict = self.synthesis.get("verdict", "N/A")
+        verdict = get("verdict", "N/A")
         verdict_display = verdict.replace("_", " ").title()
-        lines.append(f"### Verdict: {verdict_display}\n")
+        out.write(f"## Synthesis & Verdict\n\n### Verdict: {verdict_display}\n")
 
         # Reasoning
-        reasoning = self.synthesis.get("reasoning", "")
+        reasoning = get("reasoning", "")
         if reasoning:
-            lines.append(f"{reasoning}\n")
+            out.write(f"\n{reasoning}\n")
 
-        # Bull case
-        bull = self.synthesis.get("bull_case", {})
+        # Bull and bear cases
+        bull = get("bull_case", {})
         if bull:
-            lines.append("### Bull Case")
-            factors = bull.get("factors", [])
-            evidence = bull.get("evidence", [])
-            for i, f in enumerate(factors):
-                lines.append(f"- **{f}**")
-                if i < len(evidence):
-                    lines.append(f"  - Evidence: {evidence[i]}")
-            lines.append("")
-
-        # Bear case
-        bear = self.synthesis.get("bear_case", {})
+            _write_case(out, "### Bull Case", bull)
+        bear = get("bear_case", {})
         if bear:
-            lines.append("### Bear Case")
-            factors = bear.get("factors", [])
-            evidence = bear.get("evidence", [])
-            for i, f in enumerate(factors):
-                lines.append(f"- **{f}**")
-                if i < len(evidence):
-                    lines.append(f"  - Evidence: {evidence[i]}")
-            lines.append("")
+            _write_case(out, "### Bear Case", bear)
 
         # Risk/Reward
-        rr = self.synthesis.get("risk_reward", {})
+        rr = get("risk_reward", {})
         if rr:
-            lines.append("### Risk/Reward")
+            out.write("\n### Risk/Reward")
             if rr.get("ratio"):
-                lines.append(f"- **Ratio:** {rr['ratio']}")
+                out.write(f"\n- **Ratio:** {rr['ratio']}")
             if rr.get("upside_target"):
-                lines.append(f"- **Upside Target:** {rr['upside_target']}")
+                out.write(f"\n- **Upside Target:** {rr['upside_target']}")
             if rr.get("downside_risk"):
-                lines.append(f"- **Downside Risk:** {rr['downside_risk']}")
-            lines.append("")
+                out.write(f"\n- **Downside Risk:** {rr['downside_risk']}")
+            out.write("\n")
 
         # Confidence
-        conf = self.synthesis.get("confidence_explanation", "")
-        if conf:
-            lines.append("### Confidence Assessment\n")
-            lines.append(f"{conf}\n")
+        _write_text(out, "### Confidence Assessment", get("confidence_explanation", ""))
 
-        return "\n".join(lines)
-
-    def _cost_section(self) -> str:
-        """Generate cost tracking section."""
+    def _cost_section(self, out: io.StringIO) -> None:
+        """Write cost tracking section."""
         if not self.cost_summary:
-            return ""
-
-        lines = ["## Cost Summary\n"]
-        total = self.cost_summary.get("total_cost", 0)
-        budget = self.cost_summary.get("budget", 0)
-        calls = self.cost_summary.get("total_calls", 0)
-        time_ms = self.cost_summary.get("execution_time_ms", 0)
-
-        lines.append(f"| Metric | Value |")
-        lines.append(f"|--------|-------|")
-        lines.append(f"| Total Cost | ${total:.4f} |")
-        lines.append(f"| Budget | ${budget:.2f} |")
-        lines.append(f"| Budget Used | {(total / budget * 100) if budget else 0:.1f}% |")
-        lines.append(f"| API Calls | {calls} |")
-        lines.append(f"| Execution Time | {time_ms}ms |")
-        lines.append("")
+            return
+
+        get = self.cost_summary.get
+        total = get("total_cost", 0)
+        budget = get("budget", 0)
+        calls = get("total_calls", 0)
+        time_ms = get("execution_time_ms", 0)
+        budget_used = (total / budget * 100) if budget else 0
+        out.write(
+            f"## Cost Summary\n\n"
+            f"| Metric | Value |\n"
+            f"|--------|-------|\n"
+            f"| Total Cost | ${total:.4f} |\n"
+            f"| Budget | ${budget:.2f} |\n"
+            f"| Budget Used | {budget_used:.1f}% |\n"
+            f"| API Calls | {calls} |\n"
+            f"| Execution Time | {time_ms}ms |\n"
+        )
 
         # Breakdown
-        breakdown = self.cost_summary.get("breakdown", {})
+        breakdown = get("breakdown", {})
         if breakdown:
-            lines.append("### Per-Model Breakdown\n")
-            lines.append("| Model | Calls | Input Tokens | Output Tokens | Cost |")
-            lines.append("|-------|-------|-------------|---------------|------|")
-            for model, info in sorted(breakdown.items()):
-                lines.append(
-                    f"| {model} | {info['calls']} | "
-                    f"{info['input_tokens']:,} | {info['output_tokens']:,} | "
-                    f"${info['cost']:.4f} |"
-                )
-            lines.append("")
-
-        return "\n".join(lines)
-
-    def _errors_section(self) -> str:
-        """Generate errors/warnings section."""
+            out.write(
+                "\n### Per-Model Breakdown\n\n"
+                "| Model | Calls | Input Tokens | Output Tokens | Cost |\n"
+                "|-------|-------|-------------|---------------|------|\n"
+            )
+            out.write("".join(
+                f"| {model} | {info['calls']} | "
+                f"{info['input_tokens']:,} | {info['output_tokens']:,} | "
+                f"${info['cost']:.4f} |\n"
+                for model, info in sorted(breakdown.items())
+            ))
+
+    def _errors_section(self, out: io.StringIO) -> None:
+        """Write errors/warnings section."""
         if not self.errors:
-            return ""
+            return
 
-        lines = ["## Warnings\n"]
+        out.write("## Warnings\n\n")
         for e in self.errors:
-            lines.append(f"- {e}")
-        lines.append("")
-        return "\n".join(lines)
+            out.write(f"- {e}\n")
 
-    def _footer(self) -> str:
-        """Generate report footer."""
-        return (
+    def _footer(self, out: io.StringIO) -> None:
+        """Write report footer."""
+        out.write(
             "---\n\n"
             "*Generated by Trading Analyzer. "
             "Uses Evidence Scorecard method — no fake percentages.*\n"
         )
 
 
+def _write_levels(out: io.StringIO, heading: str, levels: list[dict]) -> None:
+    """Write support/resistance levels with strength and distance."""
+    out.write(f"\n{heading}\n")
+    for l in levels:
+        level = l.get("level", l.get("price", 0))
+        strength = l.get("strength", "")
+        distance = l.get("distance_pct", 0)
+        out.write(f"- ${level:,.2f} (strength: {strength}, distance: {distance:+.1f}%)\n")
+
+
+def _write_bullets(out: io.StringIO, heading: str, items: list) -> None:
+    """Write a heading plus one bullet per item; nothing when there are no items."""
+    if not items:
+        return
+    out.write(f"\n{heading}\n")
+    for item in items:
+        out.write(f"- {item}\n")
+
+
+def _write_text(out: io.StringIO, heading: str, text: str) -> None:
+    """Write a heading plus a paragraph; nothing when there is no text."""
+    if text:
+        out.write(f"\n{heading}\n\n{text}\n")
+
+
+def _write_case(out: io.StringIO, heading: str, case: dict) -> None:
+    """Write bull/bear case factors, each followed by its evidence if any."""
+    out.write(f"\n{heading}")
+    factors = case.get("factors", [])
+    evidence = case.get("evidence", [])
+    for i, f in enumerate(factors):
+        out.write(f"\n- **{f}**")
+        if i < len(evidence):
+            out.write(f"\n  - Evidence: {evidence[i]}")
+    out.write("\n")
+
+
 def generate_markdown(result: dict) -> str:
     """Convenience function to generate a Markdown report.
 
@@ -6,6 +6,7 @@ pre-calculated indicators (RSI, MACD, Bollinger Bands, SMAs).
 Component 1 per PRD.md specification.
 """
 
+import functools
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -14,24 +15,49 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 
+from src.analyzers._njit import HAS_NUMBA, njit
 from src.utils.logger import get_logger
 
+try:
+    import pyarrow  # noqa: F401
+
+    HAS_PYARROW = True
+except ImportError:  # pragma: no cover - depends on environment
+    HAS_PYARROW = False
+
 logger = get_logger("csv_parser")
 
 # Required columns (case-insensitive matching)
 REQUIRED_COLUMNS = {"time", "open", "high", "low", "close"}
 
-# Known indicator column patterns
-INDICATOR_PATTERNS = {
-    "rsi": re.compile(r"^rsi", re.IGNORECASE),
-    "macd": re.compile(r"^macd", re.IGNORECASE),
-    "bb_upper": re.compile(r"^bb\.?upper|^bollinger.*upper", re.IGNORECASE),
-    "bb_lower": re.compile(r"^bb\.?lower|^bollinger.*lower", re.IGNORECASE),
-    "sma": re.compile(r"^sma", re.IGNORECASE),
-    "ema": re.compile(r"^ema", re.IGNORECASE),
-    "volume": re.compile(r"^volume$", re.IGNORECASE),
+# Lowercased column names (incl. TradingView-specific naming) -> standard OHLCV name
+COLUMN_ALIASES = {
+    "time": "time",
+    "date": "time",
+    "datetime": "time",
+    "timestamp": "time",
+    "open": "open",
+    "o": "open",
+    "high": "high",
+    "h": "high",
+    "low": "low",
+    "l": "low",
+    "close": "close",
+    "c": "close",
+    "adj close": "close",
+    "volume": "volume",
+    "vol": "volume",
+    "v": "volume",
 }
 
+# Common exchange prefixes in TradingView filenames (NYSE_WHR__1M)
+_EXCHANGES = frozenset(
+    {"NYSE", "NASDAQ", "AMEX", "LSE", "TSE", "BINANCE", "COINBASE", "CME"}
+)
+
+# Trailing timeframe suffix left on a symbol, e.g. "_1D"
+_TF_SUFFIX_RE = re.compile(r"__?\d+[mMhHdDwW]$")
+
 # Timeframe detection thresholds (in seconds)
 TIMEFRAME_THRESHOLDS = {
     "1m": 90,         # ~1 minute, with tolerance
@@ -44,6 +70,10 @@ TIMEFRAME_THRESHOLDS = {
     "1M": 2800000,    # ~1 month
 }
 
+# The thresholds above as parallel sorted arrays for binary search
+_TF_NAMES = list(TIMEFRAME_THRESHOLDS)
+_TF_SECONDS = np.array(list(TIMEFRAME_THRESHOLDS.values()), dtype=np.float64)
+
 
 @dataclass
 class DataQuality:
@@ -101,7 +131,7 @@ def load_csv(file_path: str, asset_class: str = "equities") -> ParsedData:
         raise FileNotFoundError(f"CSV file not found: {file_path}")
 
     logger.info(f"Loading CSV: {file_path}")
-    df = pd.read_csv(path)
+    df = _read_csv(path)
     return _parse_dataframe(df, path.stem)
 
 
@@ -124,10 +154,30 @@ def parse_csv_content(content: bytes, filename: str = "upload.csv") -> ParsedDat
     import io
 
     logger.info(f"Parsing CSV content: {filename} ({len(content):,} bytes)")
-    df = pd.read_csv(io.BytesIO(content))
+    df = _read_csv(io.BytesIO(content))
     return _parse_dataframe(df, Path(filename).stem)
 
 
+def _read_csv(source) -> pd.DataFrame:
+    """Read raw CSV data, using pyarrow's multithreaded parser when installed.
+
+    Falls back to pandas' C engine when pyarrow is missing, rejects the
+    file (e.g. ragged rows) or yields duplicate column names, which only
+    the C engine de-duplicates ("Plot", "Plot.1"). File paths are
+    memory-mapped for the C engine so the OS pages the file in directly.
+    """
+    if HAS_PYARROW:
+        try:
+            df = pd.read_csv(source, engine="pyarrow")
+            if df.columns.is_unique:
+                return df
+        except ValueError:
+            pass
+        if hasattr(source, "seek"):
+            source.seek(0)
+    return pd.read_csv(source, engine="c", memory_map=isinstance(source, Path))
+
+
 def _parse_dataframe(df: pd.DataFrame, filename_stem: str) -> ParsedData:
     """Normalize, validate, and wrap a raw DataFrame into ParsedData.
 
@@ -154,14 +204,17 @@ def _parse_dataframe(df: pd.DataFrame, filename_stem: str) -> ParsedData:
     # Extract metadata from filename
     symbol = _extract_symbol(filename_stem)
 
+    # Bar-to-bar intervals, shared by timeframe detection and quality checks
+    intervals = _bar_intervals(df)
+
     # Detect timeframe
-    timeframe = _detect_timeframe(df)
+    timeframe = _detect_timeframe(df, intervals)
 
     # Identify indicators present
     indicators = _identify_indicators(df)
 
     # Run quality checks
-    quality = _assess_quality(df)
+    quality = _assess_quality(df, intervals)
 
     # Date range
     date_range = (
@@ -190,23 +243,8 @@ def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
     rename_map = {}
     for col in df.columns:
         lower = col.strip().lower()
-        # Handle TradingView-specific naming
-        if lower in ("time", "date", "datetime", "timestamp"):
-            rename_map[col] = "time"
-        elif lower in ("open", "o"):
-            rename_map[col] = "open"
-        elif lower in ("high", "h"):
-            rename_map[col] = "high"
-        elif lower in ("low", "l"):
-            rename_map[col] = "low"
-        elif lower in ("close", "c", "adj close"):
-            rename_map[col] = "close"
-        elif lower in ("volume", "vol", "v"):
-            rename_map[col] = "volume"
-        else:
-            # Keep indicator columns with cleaned names
-            cleaned = lower.replace(" ", "_")
-            rename_map[col] = cleaned
+        # Standard OHLCV names; indicator columns keep cleaned names
+        rename_map[col] = COLUMN_ALIASES.get(lower) or lower.replace(" ", "_")
 
     df = df.rename(columns=rename_map)
     return df
@@ -223,8 +261,11 @@ def _validate_required_columns(df: pd.DataFrame) -> None:
 
 
 def _parse_datetime(df: pd.DataFrame) -> pd.DataFrame:
-    """Parse the time column into datetime."""
-    df = df.copy()
+    """Parse the time column into datetime.
+
+    Replaces the column on the frame it is given; callers pass a frame
+    they own, so no defensive copy is made.
+    """
     if df["time"].dtype in ("int64", "int32"):
         df["time"] = pd.to_datetime(df["time"], unit="s")
     else:
@@ -232,28 +273,49 @@ def _parse_datetime(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def _detect_timeframe(df: pd.DataFrame) -> str:
+def _time_values(df: pd.DataFrame) -> np.ndarray:
+    """The time column as a datetime64 array in its own resolution."""
+    times = df["time"].to_numpy()
+    if times.dtype.kind != "M":  # tz-aware columns come back as objects
+        times = df["time"].to_numpy(dtype="datetime64[ns]")
+    return times
+
+
+def _bar_intervals(df: pd.DataFrame) -> np.ndarray:
+    """Timedelta64 gaps between consecutive bars, skipping pairs next to a missing time.
+
+    Kept in the time column's own resolution so gap detection truncates
+    the median exactly like pandas' Timedelta arithmetic does.
+    """
+    intervals = np.diff(_time_values(df))
+    return intervals[~np.isnat(intervals)]
+
+
+def _detect_timeframe(df: pd.DataFrame, intervals: Optional[np.ndarray] = None) -> str:
     """Auto-detect the data timeframe from timestamp intervals.
 
     Calculates the median interval between consecutive bars and matches
-    to the closest known timeframe.
+    to the closest known timeframe. ``intervals`` may be passed in when
+    already computed by _bar_intervals.
     """
     if len(df) < 2:
         return "unknown"
 
-    # Calculate intervals in seconds
-    intervals = df["time"].diff().dropna().dt.total_seconds()
-    median_interval = intervals.median()
+    if intervals is None:
+        intervals = _bar_intervals(df)
+    intervals = intervals / np.timedelta64(1, "s")
+    median_interval = float(np.median(intervals)) if len(intervals) else float("nan")
 
-    # Match to closest timeframe
+    # Match to closest timeframe: one of the two thresholds around the
+    # median, preferring the shorter one on an exact tie
     best_match = "unknown"
-    best_diff = float("inf")
-
-    for tf, threshold in TIMEFRAME_THRESHOLDS.items():
-        diff = abs(median_interval - threshold)
-        if diff < best_diff:
-            best_diff = diff
-            best_match = tf
+    if not np.isnan(median_interval):
+        i = int(np.searchsorted(_TF_SECONDS, median_interval))
+        if i == len(_TF_SECONDS) or (
+            i > 0 and median_interval - _TF_SECONDS[i - 1] <= _TF_SECONDS[i] - median_interval
+        ):
+            i -= 1
+        best_match = _TF_NAMES[i]
 
     logger.debug(
         f"Timeframe detection: median interval = {median_interval:.0f}s -> {best_match}"
@@ -261,6 +323,7 @@ def _detect_timeframe(df: pd.DataFrame) -> str:
     return best_match
 
 
+@functools.lru_cache(maxsize=256)
 def _extract_symbol(filename: str) -> str:
     """Extract trading symbol from filename.
 
@@ -269,43 +332,82 @@ def _extract_symbol(filename: str) -> str:
     # Remove exchange prefix if present (NYSE_, NASDAQ_, etc.)
     parts = filename.split("_")
 
-    # Common exchange prefixes
-    exchanges = {"NYSE", "NASDAQ", "AMEX", "LSE", "TSE", "BINANCE", "COINBASE", "CME"}
-
-    if parts[0].upper() in exchanges and len(parts) > 1:
+    if parts[0].upper() in _EXCHANGES and len(parts) > 1:
         # Skip exchange prefix, take symbol
         symbol = parts[1]
     else:
         symbol = parts[0]
 
     # Clean up: remove trailing timeframe indicators
-    symbol = re.sub(r"__?\d+[mMhHdDwW]$", "", symbol)
+    symbol = _TF_SUFFIX_RE.sub("", symbol)
 
     return symbol.upper()
 
 
 def _identify_indicators(df: pd.DataFrame) -> list[str]:
-    """Identify which pre-calculated indicators are present in the data."""
-    found = []
+    """Identify which pre-calculated indicators are present in the data.
+
+    Every non-OHLCV column counts as an indicator.
+    """
     ohlcv = {"time", "open", "high", "low", "close", "volume"}
+    return [col for col in df.columns if col not in ohlcv]
 
-    for col in df.columns:
-        if col in ohlcv:
-            continue
-        for indicator_name, pattern in INDICATOR_PATTERNS.items():
-            if pattern.match(col):
-                found.append(col)
-                break
-        else:
-            # Column doesn't match known patterns but is still an indicator
-            if col not in ohlcv:
-                found.append(col)
-
-    return found
-
-
-def _assess_quality(df: pd.DataFrame) -> DataQuality:
-    """Assess data quality and return a quality report."""
+
+def _ohlc_quality_counts(ohlc: np.ndarray) -> tuple[list[int], list[int], int]:
+    """Count problems in a float64 (rows, 4) open/high/low/close array.
+
+    Returns (missing per column, zero-or-negative per column, OHLC
+    consistency violations). Each violated comparison counts once, so a
+    bar can contribute several violations.
+    """
+    if HAS_NUMBA:
+        o, h, l, c = np.ascontiguousarray(ohlc.T)
+        missing, nonpositive, violations = _ohlc_quality_kernel(o, h, l, c)
+        return missing.tolist(), nonpositive.tolist(), int(violations)
+
+    high, low = ohlc[:, 1:2], ohlc[:, 2:3]
+    violations = np.count_nonzero(ohlc[:, [2, 0, 3]] > high)  # low/open/close above high
+    violations += np.count_nonzero(ohlc[:, [0, 3]] < low)  # open/close below low
+    return (
+        np.isnan(ohlc).sum(axis=0).tolist(),
+        (ohlc <= 0).sum(axis=0).tolist(),
+        int(violations),
+    )
+
+
+@njit(cache=True, nogil=True)
+def _ohlc_quality_kernel(o, h, l, c):
+    """Fused single pass behind _ohlc_quality_counts."""
+    missing = np.zeros(4, dtype=np.int64)
+    nonpositive = np.zeros(4, dtype=np.int64)
+    violations = 0
+    for i in range(o.shape[0]):
+        oi, hi, li, ci = o[i], h[i], l[i], c[i]
+        if np.isnan(oi):
+            missing[0] += 1
+        if np.isnan(hi):
+            missing[1] += 1
+        if np.isnan(li):
+            missing[2] += 1
+        if np.isnan(ci):
+            missing[3] += 1
+        violations += int(hi < li) + int(hi < oi) + int(hi < ci) + int(li > oi) + int(li > ci)
+        if oi <= 0:
+            nonpositive[0] += 1
+        if hi <= 0:
+            nonpositive[1] += 1
+        if li <= 0:
+            nonpositive[2] += 1
+        if ci <= 0:
+            nonpositive[3] += 1
+    return missing, nonpositive, violations
+
+
+def _assess_quality(df: pd.DataFrame, intervals: Optional[np.ndarray] = None) -> DataQuality:
+    """Assess data quality and return a quality report.
+
+    ``intervals`` may be passed in when already computed by _bar_intervals.
+    """
     errors = []
     warnings = []
     score = 1.0
@@ -316,10 +418,14 @@ def _assess_quality(df: pd.DataFrame) -> DataQuality:
         errors.append(f"Too few rows: {total_rows} (minimum 10)")
         score -= 0.3
 
+    # Every OHLC price check, counted in one pass over the columns
+    ohlc_cols = ["open", "high", "low", "close"]
+    ohlc = df[ohlc_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+    missing_counts, nonpositive_counts, ohlc_errors = _ohlc_quality_counts(ohlc)
+
     # Missing values in OHLC columns
     missing_values = {}
-    for col in ["open", "high", "low", "close"]:
-        missing = int(df[col].isna().sum())
+    for col, missing in zip(ohlc_cols, missing_counts):
         if missing > 0:
             missing_values[col] = missing
             pct = missing / total_rows
@@ -338,7 +444,9 @@ def _assess_quality(df: pd.DataFrame) -> DataQuality:
             score -= 0.02
 
     # Check for duplicates
-    duplicate_rows = int(df["time"].duplicated().sum())
+    # (NaT shares one int64 value, so repeated NaTs count like pandas does)
+    ticks = _time_values(df).view(np.int64)
+    duplicate_rows = len(ticks) - len(np.unique(ticks))
     if duplicate_rows > 0:
         warnings.append(f"{duplicate_rows} duplicate timestamps")
         score -= 0.05
@@ -346,11 +454,14 @@ def _assess_quality(df: pd.DataFrame) -> DataQuality:
     # Check for time gaps (missing bars)
     gaps = 0
     if len(df) > 2:
-        intervals = df["time"].diff().dropna()
-        median_interval = intervals.median()
-        # A gap is when interval > 2x the median
-        gap_threshold = median_interval * 2.5
-        gaps = int((intervals > gap_threshold).sum())
+        if intervals is None:
+            intervals = _bar_intervals(df)
+        if len(intervals):
+            # A gap is when interval > 2x the median (whole time units, as
+            # pandas truncates both the median and the scaled threshold)
+            ticks = intervals.view(np.int64)
+            gap_threshold = int(int(np.median(ticks)) * 2.5)
+            gaps = int(np.count_nonzero(ticks > gap_threshold))
         if gaps > 0:
             gap_pct = gaps / total_rows
             if gap_pct > 0.1:
@@ -360,20 +471,12 @@ def _assess_quality(df: pd.DataFrame) -> DataQuality:
                 warnings.append(f"{gaps} time gaps detected")
 
     # Check OHLC consistency (high >= low, high >= open/close, low <= open/close)
-    ohlc_errors = 0
-    if total_rows > 0:
-        ohlc_errors += int((df["high"] < df["low"]).sum())
-        ohlc_errors += int((df["high"] < df["open"]).sum())
-        ohlc_errors += int((df["high"] < df["close"]).sum())
-        ohlc_errors += int((df["low"] > df["open"]).sum())
-        ohlc_errors += int((df["low"] > df["close"]).sum())
     if ohlc_errors > 0:
         errors.append(f"{ohlc_errors} OHLC consistency violations")
         score -= 0.15
 
     # Check for zero or negative prices
-    for col in ["open", "high", "low", "close"]:
-        bad = int((df[col] <= 0).sum())
+    for col, bad in zip(ohlc_cols, nonpositive_counts):
         if bad > 0:
             errors.append(f"{col}: {bad} zero or negative values")
             score -= 0.1
@@ -9,14 +9,30 @@ TTL: 6 hours (configurable).
 
 import json
 import time
-from datetime import datetime
+from collections import OrderedDict
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
 from src.utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
 logger = get_logger("cache")
 
+# Datetimes and dataclasses still go through default=str, as with json.dumps
+_ORJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
 
 class AnalysisCache:
     """File-based cache for analysis results.
@@ -25,21 +41,37 @@ class AnalysisCache:
         cache_dir: Directory for cache files.
         ttl_hours: Time-to-live in hours. Cached results older than
                    this are treated as expired.
+        pretty: Indent cache files for human inspection. Off by default;
+                compact files are smaller and faster to write and read.
     """
 
     def __init__(
         self,
         cache_dir: str = "data/cache",
         ttl_hours: int = 6,
+        pretty: bool = False,
     ):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl_hours = ttl_hours
+        self.pretty = pretty
+        # Today's date string, reused until local midnight
+        self._date = ""
+        self._date_expires = 0.0
+        # Raw cache file bytes by key, checked against the file's
+        # (mtime_ns, size) on every hit so changes on disk are seen
+        self._mem: OrderedDict[str, tuple[tuple[int, int], bytes]] = OrderedDict()
+        self._mem_max = 128
 
     def _cache_key(self, symbol: str, tier: str) -> str:
         """Build cache key: SYMBOL_tier_YYYY-MM-DD."""
-        date = datetime.now().strftime("%Y-%m-%d")
-        return f"{symbol.upper()}_{tier.lower()}_{date}"
+        now = time.time()
+        if now >= self._date_expires:
+            today = datetime.fromtimestamp(now)
+            midnight = datetime.combine(today.date() + timedelta(days=1), datetime.min.time())
+            self._date = today.strftime("%Y-%m-%d")
+            self._date_expires = midnight.timestamp()
+        return f"{symbol.upper()}_{tier.lower()}_{self._date}"
 
     def _cache_path(self, symbol: str, tier: str) -> Path:
         key = self._cache_key(symbol, tier)
@@ -48,18 +80,23 @@ class AnalysisCache:
     # ── Public API ────────────────────────────────────────────
 
     def get(self, symbol: str, tier: str) -> Optional[dict]:
-        """Return cached result or None if miss/expired.
+        """Return cached result or None if miss/expired/unreadable.
 
         On a hit, injects ``cached``, ``cache_time``, and
-        ``cache_age_hours`` into the returned dict.
+        ``cache_age_hours`` into the returned dict. Repeat hits on an
+        unchanged file are served from memory without re-reading it.
         """
-        path = self._cache_path(symbol, tier)
+        key = self._cache_key(symbol, tier)
+        path = self.cache_dir / f"{key}.json"
 
-        if not path.exists():
+        try:
+            st = path.stat()
+        except OSError:
+            self._mem.pop(key, None)
             logger.info(f"Cache MISS: {symbol.upper()} {tier}")
             return None
 
-        mtime = path.stat().st_mtime
+        mtime = st.st_mtime
         age_hours = (time.time() - mtime) / 3600
 
         if age_hours > self.ttl_hours:
@@ -68,14 +105,30 @@ class AnalysisCache:
                 f"(age: {age_hours:.1f}h > {self.ttl_hours}h)"
             )
             path.unlink(missing_ok=True)
+            self._mem.pop(key, None)
             return None
 
+        version = (st.st_mtime_ns, st.st_size)
+        entry = self._mem.get(key)
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            if entry is not None and entry[0] == version:
+                self._mem.move_to_end(key)
+                raw = entry[1]
+            else:
+                raw = path.read_bytes()
+            # Parsed afresh on every hit, so callers get their own dict
+            # and nested edits never reach the in-memory entry
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         except (json.JSONDecodeError, OSError) as e:
             logger.warning(f"Cache read error for {path.name}: {e}")
             path.unlink(missing_ok=True)
+            self._mem.pop(key, None)
             return None
+        if entry is None or entry[0] != version:
+            self._mem[key] = (version, raw)
+            self._mem.move_to_end(key)
+            if len(self._mem) > self._mem_max:
+                self._mem.popitem(last=False)
 
         cache_time = datetime.fromtimestamp(mtime).isoformat()
         data["cached"] = True
@@ -89,18 +142,26 @@ class AnalysisCache:
 
     def set(self, symbol: str, tier: str, result: dict) -> None:
         """Store an analysis result in the cache."""
-        path = self._cache_path(symbol, tier)
+        key = self._cache_key(symbol, tier)
+        path = self.cache_dir / f"{key}.json"
+        # The file is rewritten below; the next get() re-reads it
+        self._mem.pop(key, None)
 
         # Shallow copy so we don't mutate the caller's dict
         to_store = dict(result)
         to_store["cached"] = False
         to_store["cache_time"] = datetime.now().isoformat()
 
+        if orjson is not None:
+            option = _ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if self.pretty else 0)
+            payload = orjson.dumps(to_store, default=str, option=option)
+        elif self.pretty:
+            payload = json.dumps(to_store, indent=2, default=str).encode("utf-8")
+        else:
+            payload = json.dumps(to_store, separators=(",", ":"), default=str).encode("utf-8")
+
         try:
-            path.write_text(
-                json.dumps(to_store, indent=2, default=str),
-                encoding="utf-8",
-            )
+            path.write_bytes(payload)
             logger.info(f"Cache SET: {symbol.upper()} {tier} → {path.name}")
         except OSError as e:
             logger.warning(f"Cache write error: {e}")
@@ -111,6 +172,12 @@ class AnalysisCache:
         files = list(self.cache_dir.glob(pattern))
         for f in files:
             f.unlink(missing_ok=True)
+        if symbol:
+            prefix = f"{symbol.upper()}_"
+            for key in [k for k in self._mem if k.startswith(prefix)]:
+                del self._mem[key]
+        else:
+            self._mem.clear()
         logger.info(f"Cache cleared: {len(files)} file(s)")
         return len(files)
 
@@ -3,11 +3,20 @@
 Loads and validates config from YAML files. Provides defaults for missing values.
 """
 
+import copy
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover - depends on libyaml being built
+    from yaml import SafeLoader as _Loader
+
+# Parsed YAML files keyed by resolved path, stored with their mtime in ns
+_CONFIG_CACHE: dict[str, tuple[int, Any]] = {}
+
 
 # Default configuration values
 DEFAULTS = {
@@ -62,6 +71,21 @@ DEFAULTS = {
 }
 
 
+def _load_yaml(path: Path) -> Any:
+    """Parse a YAML file, reusing the previous parse if it is unchanged.
+
+    Returns a deep copy so callers can mutate the result freely.
+    """
+    key = str(path.resolve())
+    mtime = path.stat().st_mtime_ns
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None or cached[0] != mtime:
+        with open(path) as f:
+            cached = (mtime, yaml.load(f, Loader=_Loader))
+        _CONFIG_CACHE[key] = cached
+    return copy.deepcopy(cached[1])
+
+
 class Config:
     """Configuration manager that loads from YAML with defaults."""
 
@@ -75,15 +99,13 @@ class Config:
 
         config_file = Path(config_path)
         if config_file.exists():
-            with open(config_file) as f:
-                user_config = yaml.safe_load(f) or {}
+            user_config = _load_yaml(config_file) or {}
             self._config = self._deep_merge(DEFAULTS, user_config)
 
         if api_keys_path:
             keys_file = Path(api_keys_path)
             if keys_file.exists():
-                with open(keys_file) as f:
-                    self._api_keys = yaml.safe_load(f) or {}
+                self._api_keys = _load_yaml(keys_file) or {}
 
     def _deep_merge(self, base: dict, override: dict) -> dict:
         """Recursively merge override into base, preferring override values."""
@@ -9,7 +9,20 @@ Tiers:
   - Premium:  Same agents but Opus for synthesis. Maximum depth.
 """
 
-from typing import Any
+import functools
+import json
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
 
 TIER_CONFIGS: dict[str, dict[str, Any]] = {
     "lite": {
@@ -108,15 +121,22 @@ TIER_CONFIGS: dict[str, dict[str, Any]] = {
     },
 }
 
+# Read-only snapshots handed out by get_tier_config; callers share them
+_FROZEN_TIERS: Mapping[str, Mapping[str, Any]] = _freeze(TIER_CONFIGS)
 
-def get_tier_config(tier: str) -> dict:
+
+@functools.lru_cache(maxsize=8)
+def get_tier_config(tier: str) -> Mapping[str, Any]:
     """Get the configuration for a given tier.
 
+    Memoized per spelling of *tier*; the result is a shared, read-only
+    snapshot of the TIER_CONFIGS entry (lists in it are tuples).
+
     Args:
         tier: Tier name (lite, standard, premium).
 
     Returns:
-        Tier configuration dict.
+        Read-only tier configuration mapping.
 
     Raises:
         ValueError: If tier name is not recognized.
@@ -125,15 +145,39 @@ def get_tier_config(tier: str) -> dict:
     if tier_lower not in TIER_CONFIGS:
         valid = list(TIER_CONFIGS.keys())
         raise ValueError(f"Unknown tier '{tier}'. Choose from: {valid}")
-    return TIER_CONFIGS[tier_lower]
+    return _FROZEN_TIERS[tier_lower]
 
 
-def list_tiers() -> list[dict]:
+def list_tiers() -> list[Mapping[str, Any]]:
     """List all available tiers (summary format for GET /tiers).
 
     Returns:
-        List of tier summary dicts.
+        List of read-only tier summary mappings, built once at import.
+    """
+    return list(_TIERS_SUMMARY)
+
+
+def list_tiers_detailed() -> list[Mapping[str, Any]]:
+    """Full tier config for frontend consumption (GET /config/tiers).
+
+    Returns a frontend-friendly list with all display metadata,
+    feature lists, pricing, and agent info. Entries are read-only
+    mappings built once at import, since TIER_CONFIGS never changes.
     """
+    return list(_TIERS_DETAILED)
+
+
+def get_tiers_detailed_json() -> bytes:
+    """list_tiers_detailed() pre-serialized as a compact UTF-8 JSON body.
+
+    Encoded once at import with the same settings as FastAPI's
+    JSONResponse, so GET /config/tiers can return it as-is.
+    """
+    return _TIERS_DETAILED_JSON
+
+
+def _build_tiers_summary() -> list[dict]:
+    """Build the GET /tiers entries from TIER_CONFIGS."""
     return [
         {
             "name": name,
@@ -145,12 +189,8 @@ def list_tiers() -> list[dict]:
     ]
 
 
-def list_tiers_detailed() -> list[dict]:
-    """Full tier config for frontend consumption (GET /config/tiers).
-
-    Returns a frontend-friendly list with all display metadata,
-    feature lists, pricing, and agent info.
-    """
+def _build_tiers_detailed() -> list[dict]:
+    """Build the GET /config/tiers entries from TIER_CONFIGS."""
     tiers = []
     for tier_id, cfg in TIER_CONFIGS.items():
         tiers.append({
@@ -170,7 +210,15 @@ def list_tiers_detailed() -> list[dict]:
                 "fundamental": cfg["agents"]["fundamental"],
                 "synthesis": cfg["agents"]["synthesis"],
             },
-            "feature_list": cfg["features"],
-            "models": cfg["agent_models"],
+            "feature_list": list(cfg["features"]),
+            "models": dict(cfg["agent_models"]),
         })
     return tiers
+
+
+# TIER_CONFIGS is static, so the endpoint payloads are built once
+_TIERS_SUMMARY = tuple(MappingProxyType(t) for t in _build_tiers_summary())
+_TIERS_DETAILED = tuple(MappingProxyType(t) for t in _build_tiers_detailed())
+_TIERS_DETAILED_JSON = json.dumps(
+    _build_tiers_detailed(), ensure_ascii=False, separators=(",", ":")
+).encode("utf-8")
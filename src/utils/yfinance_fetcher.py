@@ -5,14 +5,46 @@ ParsedData format used by the CSV parser, enabling ticker-based
 analysis through the same orchestrator pipeline.
 """
 
+import dataclasses
+import functools
+import os
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
 import pandas as pd
-import yfinance as yf
 
-from src.parsers.csv_parser import DataQuality, ParsedData, _assess_quality
+from src.parsers.csv_parser import HAS_PYARROW, DataQuality, ParsedData, _assess_quality
 from src.utils.logger import get_logger
 
 logger = get_logger("yfinance_fetcher")
 
+
+# Number of times yfinance itself retries a transient network error
+# (1s, 2s, ... backoff). Off by default: fetch_sr_timeframes runs on every
+# analysis and must fail fast when Yahoo is unreachable. Opt in with the
+# YF_RETRIES environment variable, read when yfinance is first imported.
+YF_RETRIES = 0
+
+
+@functools.cache
+def _yfinance():
+    """Import yfinance on first use and apply the YF_RETRIES setting.
+
+    yfinance already keeps one shared, pooled HTTP session for all calls;
+    its own curl_cffi session is kept rather than a requests.Session,
+    which Yahoo tends to reject.
+    """
+    import yfinance as yf
+
+    network = getattr(getattr(yf, "config", None), "network", None)
+    if network is not None:  # yfinance >= 1.0
+        network.retries = int(os.environ.get("YF_RETRIES", YF_RETRIES))
+    return yf
+
+
 # Maps user-facing timeframe strings to yfinance download params.
 # period controls how far back to fetch; interval is the bar size.
 TIMEFRAME_MAP: dict[str, dict[str, str]] = {
@@ -25,10 +57,56 @@ TIMEFRAME_MAP: dict[str, dict[str, str]] = {
     "1mo": {"interval": "1mo", "period": "max"},
 }
 
+# Listed in the unsupported-timeframe error message
+_SUPPORTED_TIMEFRAMES_STR = ", ".join(sorted(TIMEFRAME_MAP.keys()))
+
+# How long a fetched (ticker, timeframe) result is reused, in seconds.
+# Roughly one bar, so a cached result is never more than a bar behind.
+FETCH_TTL_SECONDS: dict[str, int] = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "1h": 3600,
+    "1d": 3600,
+    "1wk": 21600,
+    "1mo": 86400,
+}
+
+# Upper bound on cached fetches; the oldest entry is evicted first
+_FETCH_CACHE_MAX = 256
+
+# (TICKER, timeframe) -> (fetched_at monotonic seconds, ParsedData)
+_FETCH_CACHE: dict[tuple[str, str], tuple[float, ParsedData]] = {}
+
+# With YF_DISK_CACHE=true, normalized fetches are also kept on disk as
+# parquet (needs pyarrow), so a new process can reuse them within the same
+# TTL. Files from earlier days are pruned on write. YF_CACHE_DIR moves the
+# directory. Off by default (DISK_CACHE_DIR None): fetches stay in memory.
+DISK_CACHE_DIR: Optional[Path] = (
+    Path(os.environ.get("YF_CACHE_DIR") or Path.home() / ".cache" / "trading-analyzer")
+    if os.environ.get("YF_DISK_CACHE", "false").lower() == "true"
+    else None
+)
+
+# yfinance column names -> CSV parser names
+_YF_RENAME = {
+    "Open": "open",
+    "High": "high",
+    "Low": "low",
+    "Close": "close",
+    "Volume": "volume",
+}
+
+# Adjusted-close spellings, dropped during normalization
+_ADJ_CLOSE_COLUMNS = ("Adj Close", "adj close", "adj_close")
+
 
 def fetch_stock_data(ticker: str, timeframe: str = "1d") -> ParsedData:
     """Fetch stock data from Yahoo Finance and return as ParsedData.
 
+    Results are reused for FETCH_TTL_SECONDS[timeframe] per ticker and
+    timeframe, so repeated requests skip the network round-trip.
+
     Args:
         ticker: Stock ticker symbol (e.g., "AAPL", "MSFT").
         timeframe: Data interval. One of: 1m, 5m, 15m, 1h, 1d, 1wk, 1mo.
@@ -41,17 +119,23 @@ def fetch_stock_data(ticker: str, timeframe: str = "1d") -> ParsedData:
                     or no data is returned.
     """
     if timeframe not in TIMEFRAME_MAP:
-        supported = ", ".join(sorted(TIMEFRAME_MAP.keys()))
         raise ValueError(
-            f"Unsupported timeframe '{timeframe}'. Choose from: {supported}"
+            f"Unsupported timeframe '{timeframe}'. Choose from: {_SUPPORTED_TIMEFRAMES_STR}"
         )
 
+    key = (ticker.upper(), timeframe)
+    cached = _cached_fetch(key)
+    if cached is not None:
+        return cached
+
     params = TIMEFRAME_MAP[timeframe]
     logger.info(
         f"Fetching {ticker} data: interval={params['interval']}, "
         f"period={params['period']}"
     )
 
+    yf = _yfinance()
+
     try:
         df = yf.download(
             ticker,
@@ -68,31 +152,30 @@ def fetch_stock_data(ticker: str, timeframe: str = "1d") -> ParsedData:
             f"'{timeframe}'. Verify the ticker symbol is valid."
         )
 
-    df = _normalize_yfinance_df(df)
+    return _store_fetch(key, _to_parsed_data(_normalize_yfinance_df(df), key[0], timeframe))
 
-    # Quality check
-    quality = _assess_quality(df)
 
-    # Date range
-    date_range = (
-        df["time"].iloc[0].strftime("%Y-%m-%d"),
-        df["time"].iloc[-1].strftime("%Y-%m-%d"),
-    )
+def clear_fetch_cache() -> None:
+    """Forget all cached fetch_stock_data results."""
+    _FETCH_CACHE.clear()
 
-    symbol = ticker.upper()
-    logger.info(
-        f"Fetched: {symbol} | {timeframe} | {date_range[0]} to "
-        f"{date_range[1]} | {len(df)} bars | Quality: {quality.score:.0%}"
-    )
 
-    return ParsedData(
-        df=df,
-        symbol=symbol,
-        timeframe=timeframe,
-        date_range=date_range,
-        quality=quality,
-        indicators=[],
-    )
+def clear_disk_cache() -> int:
+    """Delete every parquet file in DISK_CACHE_DIR.
+
+    Returns:
+        Number of files removed.
+    """
+    if DISK_CACHE_DIR is None:
+        return 0
+    removed = 0
+    for path in DISK_CACHE_DIR.glob("*.parquet"):
+        try:
+            path.unlink()
+            removed += 1
+        except OSError as e:
+            logger.warning(f"Fetch cache delete error for {path.name}: {e}")
+    return removed
 
 
 def fetch_sr_timeframes(ticker: str) -> dict[str, pd.DataFrame]:
@@ -108,6 +191,8 @@ def fetch_sr_timeframes(ticker: str) -> dict[str, pd.DataFrame]:
         {"daily": daily_df, "weekly": weekly_df} — normalized DataFrames
         with 'time' column. Empty DataFrame for any timeframe that fails.
     """
+    yf = _yfinance()
+
     ticker = ticker.strip().upper()
     result: dict[str, pd.DataFrame] = {}
 
@@ -137,51 +222,161 @@ def fetch_sr_timeframes(ticker: str) -> dict[str, pd.DataFrame]:
     return result
 
 
+def _cached_fetch(key: tuple[str, str]) -> Optional[ParsedData]:
+    """Return a fresh cached fetch for (TICKER, timeframe), or None.
+
+    Checks memory first, then the parquet file for today.
+    """
+    ttl = FETCH_TTL_SECONDS[key[1]]
+    cached = _FETCH_CACHE.get(key)
+    if cached is None or time.monotonic() - cached[0] >= ttl:
+        cached = _read_disk_cache(key, ttl)
+        if cached is None:
+            return None
+        _remember_fetch(key, *cached)
+    logger.info(f"Fetch cache hit: {key[0]} {key[1]}")
+    # Deep copy so callers' edits never reach the cache, with or without
+    # pandas copy-on-write
+    return dataclasses.replace(cached[1], df=cached[1].df.copy())
+
+
+def _store_fetch(key: tuple[str, str], parsed: ParsedData) -> ParsedData:
+    """Cache a fetch result and return a copy safe to hand to the caller."""
+    _remember_fetch(key, time.monotonic(), parsed)
+    cache_dir = DISK_CACHE_DIR
+    if HAS_PYARROW and cache_dir is not None:
+        path = _disk_cache_path(cache_dir, key)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            parsed.df.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Fetch cache write error for {path.name}: {e}")
+        else:
+            _prune_disk_cache(cache_dir, path.stem[-10:])
+    return dataclasses.replace(parsed, df=parsed.df.copy())
+
+
+def _remember_fetch(key: tuple[str, str], fetched_at: float, parsed: ParsedData) -> None:
+    """Put a fetch result in the in-memory cache, evicting the oldest."""
+    if key not in _FETCH_CACHE and len(_FETCH_CACHE) >= _FETCH_CACHE_MAX:
+        _FETCH_CACHE.pop(next(iter(_FETCH_CACHE)))
+    _FETCH_CACHE[key] = (fetched_at, parsed)
+
+
+def _prune_disk_cache(cache_dir: Path, today: str) -> None:
+    """Delete parquet files in *cache_dir* dated before *today* (YYYY-MM-DD)."""
+    for path in cache_dir.glob("*_????-??-??.parquet"):
+        if path.stem[-10:] < today:
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.warning(f"Fetch cache prune error for {path.name}: {e}")
+
+
+def _disk_cache_path(cache_dir: Path, key: tuple[str, str]) -> Path:
+    """Parquet path in *cache_dir* for (TICKER, timeframe) fetched today."""
+    symbol = re.sub(r"[^\w.^=-]", "_", key[0])
+    today = datetime.now().strftime("%Y-%m-%d")
+    return cache_dir / f"{symbol}_{key[1]}_{today}.parquet"
+
+
+def _read_disk_cache(
+    key: tuple[str, str], ttl: float
+) -> Optional[tuple[float, ParsedData]]:
+    """Load today's parquet file for *key* if younger than *ttl* seconds.
+
+    Returns (fetched_at on the monotonic clock, ParsedData) or None.
+    """
+    cache_dir = DISK_CACHE_DIR
+    if not HAS_PYARROW or cache_dir is None:
+        return None
+    path = _disk_cache_path(cache_dir, key)
+    try:
+        age = time.time() - path.stat().st_mtime
+    except OSError:
+        return None
+    if age >= ttl:
+        return None
+    try:
+        df = pd.read_parquet(path, engine="pyarrow", use_threads=True)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Fetch cache read error for {path.name}: {e}")
+        return None
+    return time.monotonic() - age, _to_parsed_data(df, key[0], key[1])
+
+
+def _to_parsed_data(df: pd.DataFrame, symbol: str, timeframe: str) -> ParsedData:
+    """Wrap one ticker's normalized frame as ParsedData."""
+    # Quality check
+    quality = _assess_quality(df)
+
+    # Date range
+    times = df["time"]
+    date_range = (
+        times.iat[0].strftime("%Y-%m-%d"),
+        times.iat[-1].strftime("%Y-%m-%d"),
+    )
+
+    logger.info(
+        f"Fetched: {symbol} | {timeframe} | {date_range[0]} to "
+        f"{date_range[1]} | {len(df)} bars | Quality: {quality.score:.0%}"
+    )
+
+    return ParsedData(
+        df=df,
+        symbol=symbol,
+        timeframe=timeframe,
+        date_range=date_range,
+        quality=quality,
+        indicators=[],
+    )
+
+
 def _normalize_yfinance_df(df: pd.DataFrame) -> pd.DataFrame:
     """Normalize yfinance DataFrame to match CSV parser format.
 
     Converts DatetimeIndex to 'time' column, renames columns to
-    lowercase, drops Adj Close, and strips timezone info.
+    lowercase, drops Adj Close, and strips timezone info. Every step
+    returns a new frame, so the input is left untouched without copying it.
     """
-    df = df.copy()
-
     # Handle MultiIndex columns (yfinance single-ticker quirk)
     if isinstance(df.columns, pd.MultiIndex):
-        df.columns = df.columns.droplevel(1)
+        df = df.droplevel(1, axis=1)
 
     # Move index to 'time' column, strip timezone
     if df.index.tz is not None:
-        df.index = df.index.tz_localize(None)
+        df = df.set_axis(df.index.tz_localize(None), axis=0)
     df = df.reset_index()
-    df = df.rename(columns={df.columns[0]: "time"})
-
-    # Rename columns to lowercase
-    rename = {
-        "Open": "open",
-        "High": "high",
-        "Low": "low",
-        "Close": "close",
-        "Volume": "volume",
-    }
-    df = df.rename(columns=rename)
-
-    # Drop Adj Close if present
-    for col in ("Adj Close", "adj close", "adj_close"):
-        if col in df.columns:
-            df = df.drop(columns=[col])
+
+    # Index column becomes 'time', the rest lowercase; Adj Close dropped
+    df = df.rename(columns={**_YF_RENAME, df.columns[0]: "time"})
+    df = df.drop(columns=[c for c in _ADJ_CLOSE_COLUMNS if c in df.columns])
 
     # Drop rows where all OHLC values are NaN
     ohlc = ["open", "high", "low", "close"]
     df = df.dropna(subset=ohlc, how="all").reset_index(drop=True)
 
-    # Ensure correct dtypes
-    for col in ohlc + ["volume"]:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+    # Ensure correct dtypes; yfinance columns are normally numeric already
+    need_coerce = [
+        col
+        for col in ohlc + ["volume"]
+        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col])
+    ]
+    if need_coerce:
+        df[need_coerce] = df[need_coerce].apply(pd.to_numeric, errors="coerce")
+
+    # yfinance already returns parsed, ascending timestamps; only
+    # convert and sort when that does not hold
+    if not pd.api.types.is_datetime64_any_dtype(df["time"]):
+        df["time"] = pd.to_datetime(df["time"])
+    if not df["time"].is_monotonic_increasing:
+        df = df.sort_values("time", kind="mergesort").reset_index(drop=True)
 
-    df["time"] = pd.to_datetime(df["time"])
+    return df
 
-    # Sort by time
-    df = df.sort_values("time").reset_index(drop=True)
 
-    return df
+def __getattr__(name: str):
+    """Expose ``yf`` lazily; yfinance is only imported once data is fetched."""
+    if name == "yf":
+        return _yfinance()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,18 @@
 """Tests for analyzer modules: Gap Analyzer, S/R Calculator, Supply/Demand."""
 
+import functools
+from datetime import datetime
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import pytest
 
+from src.analyzers import _njit, gap_analyzer, sr_calculator, supply_demand
 from src.analyzers.gap_analyzer import (
     Gap,
+    GapTable,
+    detect_gap_table,
     detect_gaps,
     get_unfilled_gaps,
     prioritize_gaps,
@@ -26,6 +31,7 @@ from src.analyzers.supply_demand import (
     identify_zones,
     summarize_zones,
 )
+from src.parsers import csv_parser
 from src.parsers.csv_parser import load_csv
 
 # Path to sample data
@@ -33,10 +39,17 @@ SAMPLE_DIR = Path(__file__).parent.parent / "data" / "samples"
 WHR_CSV = SAMPLE_DIR / "NYSE_WHR__1M.csv"
 
 
+@functools.lru_cache(maxsize=1)
+def _parse_whr() -> pd.DataFrame:
+    return load_csv(str(WHR_CSV)).df
+
+
 def get_whr_data() -> pd.DataFrame:
-    """Load WHR sample data for testing."""
-    parsed = load_csv(str(WHR_CSV))
-    return parsed.df
+    """Load WHR sample data for testing.
+
+    The CSV is parsed once per session; each caller gets its own copy.
+    """
+    return _parse_whr().copy()
 
 
 # ============================================================
@@ -183,6 +196,39 @@ class TestGapPrioritization:
         assert summary["unfilled"] == 0
 
 
+class TestGapTable:
+    """Tests for columnar gap storage."""
+
+    def test_table_matches_gap_list(self):
+        """to_gaps() should reproduce detect_gaps() row for row."""
+        df = get_whr_data()
+        table = detect_gap_table(df, min_gap_pct=1.0)
+        assert isinstance(table, GapTable)
+        assert table.to_gaps() == detect_gaps(df, min_gap_pct=1.0)
+
+    def test_table_prioritize_and_filter(self):
+        """Sorting and filtering agree with the list implementation."""
+        df = get_whr_data()
+        table = detect_gap_table(df, min_gap_pct=1.0)
+        gaps = table.to_gaps()
+        assert prioritize_gaps(table).to_gaps() == prioritize_gaps(gaps)
+        assert get_unfilled_gaps(table).to_gaps() == get_unfilled_gaps(gaps)
+
+    def test_table_summary_matches_list(self):
+        """summarize_gaps gives the same result for either input."""
+        df = get_whr_data()
+        table = detect_gap_table(df, min_gap_pct=1.0)
+        assert summarize_gaps(table) == summarize_gaps(table.to_gaps())
+
+    def test_empty_table(self):
+        """Short input yields an empty table and an empty summary."""
+        df = get_whr_data().head(1)
+        table = detect_gap_table(df)
+        assert len(table) == 0
+        assert table.to_gaps() == []
+        assert summarize_gaps(table)["total"] == 0
+
+
 # ============================================================
 # Support/Resistance Calculator Tests
 # ============================================================
@@ -234,6 +280,13 @@ class TestSRCalculator:
         scores = [l.strength_score for l in levels]
         assert scores == sorted(scores, reverse=True)
 
+    def test_calculate_levels_top_k(self):
+        """top_k keeps only the strongest levels, in the same order."""
+        df = get_whr_data()
+        levels = calculate_levels(df)
+        top = calculate_levels(df, top_k=3)
+        assert [l.price for l in top] == [l.price for l in levels[:3]]
+
     def test_summarize_levels(self):
         """Summary should contain key fields."""
         df = get_whr_data()
@@ -485,6 +538,83 @@ class TestSupplyDemand:
         assert "fresh_zones" in summary
 
 
+# ============================================================
+# Numba kernels vs NumPy fallbacks
+# ============================================================
+
+def _random_walk_bars(n: int = 600, seed: int = 7) -> pd.DataFrame:
+    """Daily bars with gaps, flat stretches and volume spikes."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    jumps = rng.random(n) < 0.05
+    close[jumps] *= rng.choice([0.9, 1.1], jumps.sum())
+    open_ = np.roll(close, 1) * (1 + rng.normal(0, 0.01, n))
+    open_[0] = close[0]
+    high = np.maximum(open_, close) * (1 + rng.random(n) * 0.02)
+    low = np.minimum(open_, close) * (1 - rng.random(n) * 0.02)
+    volume = rng.integers(1_000, 5_000, n) * np.where(rng.random(n) < 0.1, 4, 1)
+    return pd.DataFrame({
+        "time": pd.date_range("2020-01-01", periods=n, freq="D"),
+        "open": open_,
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": volume.astype(float),
+    })
+
+
+@pytest.mark.skipif(not _njit.HAS_NUMBA, reason="numba not installed")
+class TestNumbaFallbackParity:
+    """The NumPy fallbacks must match the Numba kernels exactly."""
+
+    MODULES = (gap_analyzer, sr_calculator, supply_demand, csv_parser)
+
+    @pytest.fixture(params=["whr", "random_walk"])
+    def df(self, request):
+        return get_whr_data() if request.param == "whr" else _random_walk_bars()
+
+    def _both(self, monkeypatch, func):
+        """Run *func* with the kernels, then with HAS_NUMBA patched off."""
+        kernel = func()
+        with monkeypatch.context() as m:
+            for module in self.MODULES:
+                m.setattr(module, "HAS_NUMBA", False)
+            fallback = func()
+        return kernel, fallback
+
+    def test_detect_gap_table(self, monkeypatch, df):
+        now = datetime(2030, 1, 1)
+        kernel, fallback = self._both(
+            monkeypatch, lambda: detect_gap_table(df, min_gap_pct=0.5).to_dicts(now)
+        )
+        assert kernel == fallback
+
+    def test_calculate_levels(self, monkeypatch, df):
+        kernel, fallback = self._both(
+            monkeypatch,
+            lambda: [level.to_dict() for level in calculate_levels(df, lookback_bars=300)],
+        )
+        assert kernel
+        assert kernel == fallback
+
+    def test_identify_zones(self, monkeypatch, df):
+        kernel, fallback = self._both(
+            monkeypatch,
+            lambda: [z.to_dict() for z in identify_zones(df, min_move_pct=2.0)],
+        )
+        assert kernel == fallback
+
+    def test_ohlc_quality_counts(self, monkeypatch, df):
+        ohlc = df[["open", "high", "low", "close"]].to_numpy(dtype=np.float64, copy=True)
+        ohlc[::17, 0] = np.nan
+        ohlc[::23, 2] = -1.0
+        ohlc[::29, 1] = 0.0
+        kernel, fallback = self._both(
+            monkeypatch, lambda: csv_parser._ohlc_quality_counts(ohlc)
+        )
+        assert kernel == fallback
+
+
 # ============================================================
 # Integration: All analyzers together on WHR data
 # ============================================================
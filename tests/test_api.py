@@ -12,7 +12,9 @@ from httpx import ASGITransport, AsyncClient
 # Disable rate limiting during tests
 os.environ["RATE_LIMIT_ENABLED"] = "false"
 
+import api
 from api import app
+from src.utils.cache import AnalysisCache
 
 SAMPLE_CSV = Path(__file__).parent.parent / "data" / "samples" / "NYSE_WHR__1M.csv"
 
@@ -23,7 +25,9 @@ def csv_bytes() -> bytes:
 
 
 @pytest_asyncio.fixture
-async def client():
+async def client(tmp_path, monkeypatch):
+    # Per-test result cache, so runs never share or leave data/cache files
+    monkeypatch.setattr(api, "cache", AnalysisCache(cache_dir=str(tmp_path / "cache")))
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
@@ -50,6 +54,16 @@ async def test_health(client):
     assert "anthropic_key_set" in data
 
 
+@pytest.mark.asyncio
+async def test_config_tiers(client):
+    resp = await client.get("/config/tiers")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+    tiers = resp.json()
+    assert [t["id"] for t in tiers] == ["lite", "standard", "premium"]
+    assert tiers[2]["models"]["synthesis"] == "opus"
+
+
 @pytest.mark.asyncio
 async def test_analyze_full(client, csv_bytes):
     resp = await client.post(
@@ -63,6 +63,17 @@ class TestGetSet:
         cache.set("WHR", "standard", original)
         assert "cached" not in SAMPLE_RESULT  # Original not touched
 
+    def test_compact_by_default_pretty_on_request(self, cache, cache_dir, tmp_path):
+        cache.set("WHR", "standard", SAMPLE_RESULT)
+        compact = next(cache_dir.glob("*.json")).read_text()
+        assert "\n" not in compact
+
+        pretty_dir = tmp_path / "pretty"
+        AnalysisCache(cache_dir=str(pretty_dir), pretty=True).set("WHR", "standard", SAMPLE_RESULT)
+        pretty = next(pretty_dir.glob("*.json")).read_text()
+        assert "\n  " in pretty
+        assert json.loads(pretty)["metadata"] == json.loads(compact)["metadata"]
+
 
 # ── Cache key logic ───────────────────────────────────────────
 
@@ -176,6 +187,23 @@ class TestEdgeCases:
         assert cache.get("WHR", "standard") is None
         assert not files[0].exists()
 
+    def test_repeat_hit_sees_file_changes(self, cache, cache_dir):
+        cache.set("WHR", "standard", SAMPLE_RESULT)
+        first = cache.get("WHR", "standard")
+        first["synthesis"] = "mutated"
+        assert cache.get("WHR", "standard")["synthesis"]["verdict"] == "NEUTRAL"
+        # Rewritten file must not be masked by the in-memory copy
+        path = next(cache_dir.glob("*.json"))
+        path.write_text(json.dumps({"synthesis": {"verdict": "BULLISH"}}))
+        assert cache.get("WHR", "standard")["synthesis"]["verdict"] == "BULLISH"
+        path.unlink()
+        assert cache.get("WHR", "standard") is None
+
+    def test_nested_edit_does_not_leak_into_next_hit(self, cache):
+        cache.set("WHR", "standard", SAMPLE_RESULT)
+        cache.get("WHR", "standard")["synthesis"]["verdict"] = "HACKED"
+        assert cache.get("WHR", "standard")["synthesis"]["verdict"] == "NEUTRAL"
+
     def test_cache_dir_created_automatically(self, tmp_path):
         new_dir = tmp_path / "nested" / "deep" / "cache"
         c = AnalysisCache(cache_dir=str(new_dir))
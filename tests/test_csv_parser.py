@@ -16,6 +16,7 @@ from src.parsers.csv_parser import (
     _identify_indicators,
     _normalize_columns,
     load_csv,
+    parse_csv_content,
 )
 
 # Path to sample data
@@ -79,6 +80,17 @@ class TestLoadCSV:
             finally:
                 os.unlink(f.name)
 
+    def test_load_duplicate_column_names(self):
+        """Repeated headers (e.g. several "Plot" columns) stay distinct."""
+        content = (
+            b"time,open,high,low,close,Plot,Plot\n"
+            b"2024-01-01,100,105,99,104,1,2\n"
+            b"2024-01-02,104,106,101,102,3,4\n"
+        )
+        result = parse_csv_content(content, "NYSE_TEST, 1D.csv")
+        assert result.bar_count == 2
+        assert result.df.columns.is_unique
+
 
 class TestNormalizeColumns:
     """Tests for column normalization."""
@@ -0,0 +1,103 @@
+"""Tests for the CLI entry point (argument handling and --symbols batches)."""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from src import main as cli
+
+
+def _parse(monkeypatch, *argv):
+    monkeypatch.setattr(sys, "argv", ["trading-analyzer", *argv])
+    return cli.parse_args()
+
+
+def _thread_pool(**kwargs):
+    """Stand-in for ProcessPoolExecutor that keeps workers in-process."""
+    return ThreadPoolExecutor(max_workers=kwargs["max_workers"])
+
+
+class TestParseArgs:
+    def test_single_symbol(self, monkeypatch):
+        args = _parse(monkeypatch, "--symbol", "WHR", "--csv", "whr.csv")
+        assert args.symbol == "WHR"
+        assert args.csv == ["whr.csv"]
+
+    def test_csv_count_must_match_symbols(self, monkeypatch, capsys):
+        with pytest.raises(SystemExit) as exc:
+            _parse(monkeypatch, "--symbols", "WHR,AAPL", "--csv", "whr.csv")
+        assert exc.value.code == 2
+        assert "expected 2 CSV file(s) for 2 symbol(s), got 1" in capsys.readouterr().err
+
+    def test_single_symbol_rejects_extra_csv(self, monkeypatch):
+        with pytest.raises(SystemExit):
+            _parse(monkeypatch, "--symbol", "WHR", "--csv", "a.csv", "b.csv")
+
+    def test_empty_symbols_rejected(self, monkeypatch):
+        with pytest.raises(SystemExit):
+            _parse(monkeypatch, "--symbols", ",", "--csv", "a.csv")
+
+    def test_duplicate_symbols_deduped_in_order(self, monkeypatch):
+        args = _parse(
+            monkeypatch,
+            "--symbols", "WHR,AAPL,whr,MSFT,AAPL",
+            "--csv", "w1.csv", "a1.csv", "w2.csv", "m.csv", "a2.csv",
+        )
+        assert args.symbols == ["WHR", "AAPL", "MSFT"]
+        assert args.csv == ["w1.csv", "a1.csv", "m.csv"]
+
+
+class TestBatchOutputPath:
+    @pytest.mark.parametrize("fmt,ext", sorted(cli.REPORT_EXTENSIONS.items()))
+    def test_extension_per_format(self, monkeypatch, tmp_path, fmt, ext):
+        args = _parse(
+            monkeypatch,
+            "--symbols", "WHR", "--csv", "whr.csv",
+            "--format", fmt, "--output", str(tmp_path),
+        )
+        assert cli._batch_output_path(args, "WHR") == str(tmp_path / f"WHR_report.{ext}")
+
+    def test_no_output_dir(self, monkeypatch):
+        args = _parse(monkeypatch, "--symbols", "WHR", "--csv", "whr.csv")
+        assert cli._batch_output_path(args, "WHR") is None
+
+
+class TestMainBatch:
+    def test_one_failed_symbol_gives_nonzero_exit(self, monkeypatch, capsys):
+        args = _parse(
+            monkeypatch,
+            "--symbols", "WHR,BAD", "--csv", "whr.csv", "bad.csv", "--quiet",
+        )
+
+        def fake_analyze(symbol, csv_file, args, output_path):
+            if symbol == "BAD":
+                raise ValueError("no data")
+            return f"report for {symbol}", {"total_cost": 0.0}, []
+
+        with patch.object(cli, "ProcessPoolExecutor", _thread_pool), \
+                patch.object(cli, "_analyze_symbol", fake_analyze):
+            code = cli._main_batch(args)
+
+        out, err = capsys.readouterr()
+        assert code == 1
+        assert "report for WHR" in out
+        assert "Error (BAD): no data" in err
+
+    def test_all_symbols_succeed(self, monkeypatch, capsys):
+        args = _parse(
+            monkeypatch,
+            "--symbols", "WHR,AAPL", "--csv", "whr.csv", "aapl.csv", "--quiet",
+        )
+
+        def fake_analyze(symbol, csv_file, args, output_path):
+            return f"report for {symbol}", {}, []
+
+        with patch.object(cli, "ProcessPoolExecutor", _thread_pool), \
+                patch.object(cli, "_analyze_symbol", fake_analyze):
+            code = cli._main_batch(args)
+
+        out = capsys.readouterr().out
+        assert code == 0
+        assert out.index("report for WHR") < out.index("report for AAPL")
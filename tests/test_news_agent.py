@@ -5,6 +5,7 @@ All API calls are mocked — no real API spend in tests.
 
 import json
 import os
+from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -16,7 +17,7 @@ from src.utils.cost_tracker import CostTracker
 # ── Fixtures ─────────────────────────────────────────────────
 
 
-SAMPLE_ANALYSIS_JSON = json.dumps({
+SAMPLE_ANALYSIS_DICT = {
     "sentiment_score": 6.2,
     "sentiment_label": "slightly_bullish",
     "catalysts": ["Q4 earnings beat", "cost restructuring program"],
@@ -50,120 +51,124 @@ SAMPLE_ANALYSIS_JSON = json.dumps({
         "Zacks downgrades to Hold",
         "Target price set at $85.43",
     ],
-})
+}
 
+SAMPLE_ANALYSIS_JSON = json.dumps(SAMPLE_ANALYSIS_DICT)
 
-def _make_mock_response(text=SAMPLE_ANALYSIS_JSON, input_tokens=800, output_tokens=400):
-    """Create a mock anthropic Message response with web search results."""
-    text_block = MagicMock()
-    text_block.type = "text"
-    text_block.text = text
-
-    # Mock web search result
-    search_result = MagicMock()
-    search_result.type = "web_search_result"
-    search_result.title = "WHR Earnings Report"
-    search_result.url = "https://example.com/whr-earnings"
+FENCED_SAMPLE = f"```json\n{SAMPLE_ANALYSIS_JSON}\n```"
 
-    search_block = MagicMock()
-    search_block.type = "web_search_tool_result"
-    search_block.content = [search_result]
 
-    usage = MagicMock()
-    usage.input_tokens = input_tokens
-    usage.output_tokens = output_tokens
+# Plain stand-ins for the anthropic SDK blocks NewsAgent reads. Only
+# messages.create itself stays a MagicMock, for call-arg introspection.
 
-    response = MagicMock()
-    response.content = [search_block, text_block]
-    response.usage = usage
-    return response
 
-
-# ── Tests ────────────────────────────────────────────────────
+@dataclass(slots=True)
+class _TextBlock:
+    text: str
+    type: str = "text"
 
 
-class TestNewsAgent:
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_analyze_returns_expected_keys(self):
-        agent = NewsAgent()
-        agent.client.messages.create = MagicMock(return_value=_make_mock_response())
+@dataclass(slots=True)
+class _SearchResult:
+    title: str
+    url: str
+    type: str = "web_search_result"
 
-        result = agent.analyze("WHR")
 
-        assert "headlines" in result
-        assert "sentiment_score" in result
-        assert "catalysts" in result
-        assert "key_themes" in result
-        assert "summary" in result
-        assert "cost" in result
-        assert "sources" in result
-        assert "provider" in result
-        assert result["provider"] == "claude_web_search"
-
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_sentiment_score_range(self):
-        agent = NewsAgent()
-        agent.client.messages.create = MagicMock(return_value=_make_mock_response())
+@dataclass(slots=True)
+class _SearchBlock:
+    content: list
+    type: str = "web_search_tool_result"
 
-        result = agent.analyze("WHR")
 
-        assert 1.0 <= result["sentiment_score"] <= 10.0
-        assert result["sentiment_score"] == 6.2
+@dataclass(slots=True)
+class _Usage:
+    input_tokens: int
+    output_tokens: int
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_catalysts_are_list(self):
-        agent = NewsAgent()
-        agent.client.messages.create = MagicMock(return_value=_make_mock_response())
 
-        result = agent.analyze("WHR")
+@dataclass(slots=True)
+class _Response:
+    content: list
+    usage: _Usage
 
-        assert isinstance(result["catalysts"], list)
-        assert len(result["catalysts"]) == 2
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_key_themes_are_list(self):
-        agent = NewsAgent()
-        agent.client.messages.create = MagicMock(return_value=_make_mock_response())
+# NewsAgent only reads search results, so one block serves every response
+_SAMPLE_SEARCH = _SearchBlock(
+    content=[
+        _SearchResult(
+            title="WHR Earnings Report",
+            url="https://example.com/whr-earnings",
+        )
+    ]
+)
 
-        result = agent.analyze("WHR")
 
-        assert isinstance(result["key_themes"], list)
-        assert len(result["key_themes"]) == 3
+def _make_mock_response(text=SAMPLE_ANALYSIS_JSON, input_tokens=800, output_tokens=400):
+    """Create a mock anthropic Message response with web search results."""
+    return _Response(
+        content=[_SAMPLE_SEARCH, _TextBlock(text=text)],
+        usage=_Usage(input_tokens=input_tokens, output_tokens=output_tokens),
+    )
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_key_developments(self):
-        agent = NewsAgent()
-        agent.client.messages.create = MagicMock(return_value=_make_mock_response())
 
-        result = agent.analyze("WHR")
+# The agent only reads the response, so tests using the default payload
+# can share one mock instead of building a new tree each time
+_TEMPLATE_RESPONSE = _make_mock_response()
 
-        assert isinstance(result["key_developments"], list)
-        assert len(result["key_developments"]) == 2
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_analyst_actions(self):
-        agent = NewsAgent()
-        agent.client.messages.create = MagicMock(return_value=_make_mock_response())
+@pytest.fixture(scope="class")
+def agent():
+    """One agent per test class; each test rebinds messages.create."""
+    with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"}):
+        yield NewsAgent()
 
-        result = agent.analyze("WHR")
 
-        assert isinstance(result["analyst_actions"], list)
-        assert len(result["analyst_actions"]) == 2
+@pytest.fixture(scope="class")
+def analysis(agent):
+    """Result of one analyze() call on the default payload, shared read-only."""
+    agent.client.messages.create = MagicMock(return_value=_TEMPLATE_RESPONSE)
+    return agent.analyze("WHR")
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_sources_extracted(self):
-        agent = NewsAgent()
-        agent.client.messages.create = MagicMock(return_value=_make_mock_response())
 
-        result = agent.analyze("WHR")
+# ── Tests ────────────────────────────────────────────────────
 
-        assert isinstance(result["sources"], list)
-        assert len(result["sources"]) == 1
-        assert result["sources"][0]["url"] == "https://example.com/whr-earnings"
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_cost_includes_web_search(self):
-        agent = NewsAgent()
+class TestNewsAgent:
+    def test_analyze_returns_expected_keys(self, analysis):
+        assert "headlines" in analysis
+        assert "sentiment_score" in analysis
+        assert "catalysts" in analysis
+        assert "key_themes" in analysis
+        assert "summary" in analysis
+        assert "cost" in analysis
+        assert "sources" in analysis
+        assert "provider" in analysis
+        assert analysis["provider"] == "claude_web_search"
+
+    def test_sentiment_score_range(self, analysis):
+        assert 1.0 <= analysis["sentiment_score"] <= 10.0
+        assert analysis["sentiment_score"] == 6.2
+
+    @pytest.mark.parametrize(
+        "key,length",
+        [
+            ("catalysts", 2),
+            ("key_themes", 3),
+            ("key_developments", 2),
+            ("analyst_actions", 2),
+        ],
+    )
+    def test_list_fields(self, analysis, key, length):
+        assert isinstance(analysis[key], list)
+        assert len(analysis[key]) == length
+
+    def test_sources_extracted(self, analysis):
+        assert isinstance(analysis["sources"], list)
+        assert len(analysis["sources"]) == 1
+        assert analysis["sources"][0]["url"] == "https://example.com/whr-earnings"
+
+    def test_cost_includes_web_search(self, agent):
         agent.client.messages.create = MagicMock(
             return_value=_make_mock_response(input_tokens=1000, output_tokens=500)
         )
@@ -175,11 +180,10 @@ class TestNewsAgent:
         assert result["input_tokens"] == 1000
         assert result["output_tokens"] == 500
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_cost_tracking_integration(self):
+    def test_cost_tracking_integration(self, agent, monkeypatch):
         tracker = CostTracker()
-        agent = NewsAgent(cost_tracker=tracker)
-        agent.client.messages.create = MagicMock(return_value=_make_mock_response())
+        monkeypatch.setattr(agent, "cost_tracker", tracker)
+        agent.client.messages.create = MagicMock(return_value=_TEMPLATE_RESPONSE)
 
         agent.analyze("WHR")
 
@@ -187,9 +191,7 @@ class TestNewsAgent:
         assert tracker.calls[0].component == "news_agent"
         assert tracker.total_cost > 0
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_api_error_returns_empty(self):
-        agent = NewsAgent()
+    def test_api_error_returns_empty(self, agent):
         agent.client.messages.create = MagicMock(
             side_effect=Exception("API error")
         )
@@ -200,9 +202,7 @@ class TestNewsAgent:
         assert result["catalysts"] == []
         assert "API error" in result["summary"]
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_handles_malformed_json(self):
-        agent = NewsAgent()
+    def test_handles_malformed_json(self, agent):
         agent.client.messages.create = MagicMock(
             return_value=_make_mock_response(text="Not valid JSON at all")
         )
@@ -213,23 +213,19 @@ class TestNewsAgent:
         assert result["sentiment_score"] == 5.0
         assert result["catalysts"] == []
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_handles_json_with_code_fences(self):
-        agent = NewsAgent()
-        fenced = f"```json\n{SAMPLE_ANALYSIS_JSON}\n```"
+    def test_handles_json_with_code_fences(self, agent):
         agent.client.messages.create = MagicMock(
-            return_value=_make_mock_response(text=fenced)
+            return_value=_make_mock_response(text=FENCED_SAMPLE)
         )
 
         result = agent.analyze("WHR")
 
         assert result["sentiment_score"] == 6.2
         assert len(result["catalysts"]) == 2
+        assert result["key_themes"] == SAMPLE_ANALYSIS_DICT["key_themes"]
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_web_search_tool_passed(self):
-        agent = NewsAgent()
-        agent.client.messages.create = MagicMock(return_value=_make_mock_response())
+    def test_web_search_tool_passed(self, agent):
+        agent.client.messages.create = MagicMock(return_value=_TEMPLATE_RESPONSE)
 
         agent.analyze("WHR")
 
@@ -238,10 +234,8 @@ class TestNewsAgent:
         assert any(t.get("type") == "web_search_20250305" for t in tools)
         assert any(t.get("name") == "web_search" for t in tools)
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_symbol_in_prompt(self):
-        agent = NewsAgent()
-        agent.client.messages.create = MagicMock(return_value=_make_mock_response())
+    def test_symbol_in_prompt(self, agent):
+        agent.client.messages.create = MagicMock(return_value=_TEMPLATE_RESPONSE)
 
         agent.analyze("AAPL")
 
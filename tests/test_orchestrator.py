@@ -12,6 +12,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.orchestrator import TradingAnalysisOrchestrator
+from src.parsers.csv_parser import load_csv
 from src.utils.tier_config import TIER_CONFIGS, get_tier_config, list_tiers
 
 
@@ -73,16 +74,20 @@ MOCK_SYNTHESIS_RESULT = {
 
 
 def _patch_agents(orchestrator):
-    """Patch all AI agents on an orchestrator to return mock data."""
+    """Patch all AI agents on an orchestrator to return mock data.
+
+    Plain stubs are enough here since no test inspects these calls;
+    failure tests swap in a MagicMock with a side_effect.
+    """
     if orchestrator._news_agent:
-        orchestrator._news_agent.analyze = MagicMock(return_value=MOCK_NEWS_RESULT)
+        orchestrator._news_agent.analyze = lambda *args, **kwargs: MOCK_NEWS_RESULT
     if orchestrator._fundamental_agent:
-        orchestrator._fundamental_agent.analyze = MagicMock(
-            return_value=MOCK_FUNDAMENTAL_RESULT
+        orchestrator._fundamental_agent.analyze = (
+            lambda *args, **kwargs: MOCK_FUNDAMENTAL_RESULT
         )
     if orchestrator._synthesis_agent:
-        orchestrator._synthesis_agent.synthesize = MagicMock(
-            return_value=MOCK_SYNTHESIS_RESULT
+        orchestrator._synthesis_agent.synthesize = (
+            lambda *args, **kwargs: MOCK_SYNTHESIS_RESULT
         )
 
 
@@ -94,6 +99,50 @@ _MOCK_SR_TF_PATCH = patch(
 )
 
 
+@pytest.fixture(scope="module")
+def whr_parsed():
+    """WHR sample parsed once; the pipeline only reads it."""
+    return load_csv(WHR_CSV)
+
+
+@pytest.fixture(scope="module")
+def _shared_lite_orch():
+    """One lite orchestrator per module; agents are built once."""
+    with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"}):
+        yield TradingAnalysisOrchestrator(tier="lite")
+
+
+@pytest.fixture(scope="module")
+def _shared_standard_orch():
+    """One standard orchestrator per module; agents are built once."""
+    with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"}):
+        yield TradingAnalysisOrchestrator(tier="standard")
+
+
+@pytest.fixture
+def lite_orch(_shared_lite_orch):
+    """Shared lite orchestrator with its agents reset to the mock results."""
+    _patch_agents(_shared_lite_orch)
+    return _shared_lite_orch
+
+
+@pytest.fixture
+def standard_orch(_shared_standard_orch):
+    """Shared standard orchestrator with its agents reset to the mock results."""
+    _patch_agents(_shared_standard_orch)
+    return _shared_standard_orch
+
+
+@pytest.fixture(scope="module")
+def whr_technical(_shared_lite_orch, whr_parsed):
+    """Technical section of one lite run, shared by tests that only read it."""
+    _patch_agents(_shared_lite_orch)
+    with _MOCK_SR_TF_PATCH:
+        result = _shared_lite_orch.analyze_from_parsed("WHR", whr_parsed)
+    assert result["errors"] == []
+    return result["technical"]
+
+
 @pytest.fixture(autouse=True)
 def _mock_sr_timeframes():
     """Auto-mock fetch_sr_timeframes for all orchestrator tests."""
@@ -105,24 +154,47 @@ def _mock_sr_timeframes():
 
 
 class TestTierConfig:
-    def test_lite_config(self):
-        cfg = get_tier_config("lite")
-        assert cfg["include_news"] is True
-        assert cfg["include_sec"] is False
-        assert cfg["include_synthesis"] is False
-        assert cfg["max_cost"] == 0.50
-
-    def test_standard_config(self):
-        cfg = get_tier_config("standard")
-        assert cfg["include_news"] is True
-        assert cfg["include_sec"] is True
-        assert cfg["include_synthesis"] is True
-        assert cfg["max_cost"] == 3.00
-
-    def test_premium_config(self):
-        cfg = get_tier_config("premium")
-        assert cfg["extended_thinking"] is True
-        assert cfg["max_cost"] == 7.00
+    @pytest.mark.parametrize(
+        "tier,expected",
+        [
+            (
+                "lite",
+                {
+                    "include_news": True,
+                    "include_sec": False,
+                    "include_synthesis": False,
+                    "max_cost": 0.50,
+                },
+            ),
+            (
+                "standard",
+                {
+                    "include_news": True,
+                    "include_sec": True,
+                    "include_synthesis": True,
+                    "max_cost": 3.00,
+                },
+            ),
+            ("premium", {"extended_thinking": True, "max_cost": 7.00}),
+        ],
+    )
+    def test_tier_config(self, tier, expected):
+        cfg = get_tier_config(tier)
+        for key, value in expected.items():
+            if isinstance(value, bool):
+                assert cfg[key] is value, key
+            else:
+                assert cfg[key] == value, key
+
+    def test_tier_config_read_only(self):
+        cfg = get_tier_config("Lite")
+        assert cfg is get_tier_config("Lite")
+        with pytest.raises(TypeError):
+            cfg["max_cost"] = 100.0
+        with pytest.raises(TypeError):
+            cfg["agents"]["news"] = False
+        assert cfg["models"] == ("haiku",)
+        assert TIER_CONFIGS["lite"]["max_cost"] == 0.50
 
     def test_invalid_tier(self):
         with pytest.raises(ValueError, match="Unknown tier"):
@@ -136,31 +208,34 @@ class TestTierConfig:
         assert "standard" in names
         assert "premium" in names
 
+    def test_list_tiers_entries_read_only(self):
+        tiers = list_tiers()
+        with pytest.raises(TypeError):
+            tiers[0]["label"] = "Changed"
+        assert list_tiers()[0]["label"] == TIER_CONFIGS["lite"]["label"]
+
 
 # ── Orchestrator initialization ──────────────────────────────
 
 
+@patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
 class TestOrchestratorInit:
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
     def test_lite_no_sec_no_synthesis(self):
         orch = TradingAnalysisOrchestrator(tier="lite")
         assert orch._news_agent is not None
         assert orch._fundamental_agent is None
         assert orch._synthesis_agent is None
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
     def test_standard_all_agents(self):
         orch = TradingAnalysisOrchestrator(tier="standard")
         assert orch._news_agent is not None
         assert orch._fundamental_agent is not None
         assert orch._synthesis_agent is not None
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
     def test_budget_from_tier(self):
         orch = TradingAnalysisOrchestrator(tier="standard")
         assert orch.cost_tracker.budget == 3.00
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
     def test_budget_override(self):
         orch = TradingAnalysisOrchestrator(tier="standard", budget=10.0)
         assert orch.cost_tracker.budget == 10.0
@@ -169,13 +244,10 @@ class TestOrchestratorInit:
 # ── Lite tier analysis ───────────────────────────────────────
 
 
+@pytest.mark.slow
 class TestLiteTier:
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_lite_runs_technical_and_news(self):
-        orch = TradingAnalysisOrchestrator(tier="lite")
-        _patch_agents(orch)
-
-        result = orch.analyze("WHR", WHR_CSV)
+    def test_lite_runs_technical_and_news(self, lite_orch):
+        result = lite_orch.analyze("WHR", WHR_CSV)
 
         # Technical should be populated (real analysis, no mock needed)
         assert result["technical"]["current_price"] > 0
@@ -185,12 +257,8 @@ class TestLiteTier:
         assert result["fundamental"] == {}
         assert result["synthesis"] == {}
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_lite_metadata(self):
-        orch = TradingAnalysisOrchestrator(tier="lite")
-        _patch_agents(orch)
-
-        result = orch.analyze("WHR", WHR_CSV)
+    def test_lite_metadata(self, lite_orch, whr_parsed):
+        result = lite_orch.analyze_from_parsed("WHR", whr_parsed)
 
         assert result["metadata"]["symbol"] == "WHR"
         assert result["metadata"]["tier"] == "lite"
@@ -200,25 +268,18 @@ class TestLiteTier:
 # ── Standard tier analysis ───────────────────────────────────
 
 
+@pytest.mark.slow
 class TestStandardTier:
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_standard_all_sections_populated(self):
-        orch = TradingAnalysisOrchestrator(tier="standard")
-        _patch_agents(orch)
-
-        result = orch.analyze("WHR", WHR_CSV)
+    def test_standard_all_sections_populated(self, standard_orch, whr_parsed):
+        result = standard_orch.analyze_from_parsed("WHR", whr_parsed)
 
         assert result["technical"]["current_price"] > 0
         assert result["news"]["sentiment_score"] > 0
         assert result["fundamental"]["financial_health"]["overall_grade"] == "C"
         assert result["synthesis"]["verdict"] == "MODERATE_BULL"
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_standard_cost_summary(self):
-        orch = TradingAnalysisOrchestrator(tier="standard")
-        _patch_agents(orch)
-
-        result = orch.analyze("WHR", WHR_CSV)
+    def test_standard_cost_summary(self, standard_orch, whr_parsed):
+        result = standard_orch.analyze_from_parsed("WHR", whr_parsed)
 
         cs = result["cost_summary"]
         assert "total_cost" in cs
@@ -227,12 +288,8 @@ class TestStandardTier:
         assert "execution_time_ms" in cs
         assert cs["execution_time_ms"] > 0
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_standard_no_errors(self):
-        orch = TradingAnalysisOrchestrator(tier="standard")
-        _patch_agents(orch)
-
-        result = orch.analyze("WHR", WHR_CSV)
+    def test_standard_no_errors(self, standard_orch, whr_parsed):
+        result = standard_orch.analyze_from_parsed("WHR", whr_parsed)
 
         assert result["errors"] == []
 
@@ -240,25 +297,20 @@ class TestStandardTier:
 # ── Error handling ───────────────────────────────────────────
 
 
+@pytest.mark.slow
 class TestErrorHandling:
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_bad_csv_records_error(self):
-        orch = TradingAnalysisOrchestrator(tier="lite")
-        _patch_agents(orch)
-
-        result = orch.analyze("WHR", "/nonexistent/file.csv")
+    def test_bad_csv_records_error(self, lite_orch, tmp_path):
+        result = lite_orch.analyze("WHR", str(tmp_path / "missing.csv"))
 
         assert len(result["errors"]) > 0
         assert "CSV parse failed" in result["errors"][0]
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_news_failure_continues(self):
-        orch = TradingAnalysisOrchestrator(tier="standard")
-        _patch_agents(orch)
+    def test_news_failure_continues(self, standard_orch, whr_parsed):
+        orch = standard_orch
         # Make news fail
         orch._news_agent.analyze = MagicMock(side_effect=Exception("News API down"))
 
-        result = orch.analyze("WHR", WHR_CSV)
+        result = orch.analyze_from_parsed("WHR", whr_parsed)
 
         # Should still have technical and other sections
         assert result["technical"]["current_price"] > 0
@@ -266,44 +318,38 @@ class TestErrorHandling:
         # Fundamental and synthesis should still run
         assert result["fundamental"]["financial_health"]["overall_grade"] == "C"
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_sec_failure_continues(self):
-        orch = TradingAnalysisOrchestrator(tier="standard")
-        _patch_agents(orch)
+    def test_sec_failure_continues(self, standard_orch, whr_parsed):
+        orch = standard_orch
         orch._fundamental_agent.analyze = MagicMock(
             side_effect=Exception("EDGAR down")
         )
 
-        result = orch.analyze("WHR", WHR_CSV)
+        result = orch.analyze_from_parsed("WHR", whr_parsed)
 
         assert result["technical"]["current_price"] > 0
         assert result["news"]["sentiment_score"] > 0
         assert "Fundamental analysis failed" in result["errors"][0]
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_synthesis_failure_continues(self):
-        orch = TradingAnalysisOrchestrator(tier="standard")
-        _patch_agents(orch)
+    def test_synthesis_failure_continues(self, standard_orch, whr_parsed):
+        orch = standard_orch
         orch._synthesis_agent.synthesize = MagicMock(
             side_effect=Exception("Opus rate limited")
         )
 
-        result = orch.analyze("WHR", WHR_CSV)
+        result = orch.analyze_from_parsed("WHR", whr_parsed)
 
         assert result["technical"]["current_price"] > 0
         assert result["news"]["sentiment_score"] > 0
         assert result["fundamental"]["financial_health"]["overall_grade"] == "C"
         assert "Synthesis failed" in result["errors"][0]
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_all_agents_fail_still_returns_technical(self):
-        orch = TradingAnalysisOrchestrator(tier="standard")
-        _patch_agents(orch)
+    def test_all_agents_fail_still_returns_technical(self, standard_orch, whr_parsed):
+        orch = standard_orch
         orch._news_agent.analyze = MagicMock(side_effect=Exception("fail"))
         orch._fundamental_agent.analyze = MagicMock(side_effect=Exception("fail"))
         orch._synthesis_agent.synthesize = MagicMock(side_effect=Exception("fail"))
 
-        result = orch.analyze("WHR", WHR_CSV)
+        result = orch.analyze_from_parsed("WHR", whr_parsed)
 
         # Technical should still work (no API calls)
         assert result["technical"]["current_price"] > 0
@@ -313,82 +359,60 @@ class TestErrorHandling:
 # ── Technical analysis (real WHR data) ───────────────────────
 
 
+@pytest.mark.slow
 class TestTechnicalAnalysis:
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_gaps_detected(self):
-        orch = TradingAnalysisOrchestrator(tier="lite")
-        _patch_agents(orch)
-
-        result = orch.analyze("WHR", WHR_CSV)
-
-        assert "gaps" in result["technical"]
-        assert "total" in result["technical"]["gaps"]
-
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_sr_levels_detected(self):
-        orch = TradingAnalysisOrchestrator(tier="lite")
-        _patch_agents(orch)
-
-        result = orch.analyze("WHR", WHR_CSV)
-
-        assert "support_resistance" in result["technical"]
-
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_sr_has_key_and_minor_levels(self):
-        orch = TradingAnalysisOrchestrator(tier="lite")
-        _patch_agents(orch)
+    def test_gaps_detected(self, whr_technical):
+        assert "gaps" in whr_technical
+        assert "total" in whr_technical["gaps"]
 
-        result = orch.analyze("WHR", WHR_CSV)
+    def test_sr_levels_detected(self, whr_technical):
+        assert "support_resistance" in whr_technical
 
-        sr = result["technical"]["support_resistance"]
+    def test_sr_has_key_and_minor_levels(self, whr_technical):
+        sr = whr_technical["support_resistance"]
         assert "key_levels" in sr
         assert "minor_levels" in sr
         assert "timeframes_analyzed" in sr
         assert isinstance(sr["timeframes_analyzed"], list)
         assert "lookback_periods" in sr
 
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_zones_detected(self):
-        orch = TradingAnalysisOrchestrator(tier="lite")
-        _patch_agents(orch)
-
-        result = orch.analyze("WHR", WHR_CSV)
-
-        assert "supply_demand" in result["technical"]
+    def test_zones_detected(self, whr_technical):
+        assert "supply_demand" in whr_technical
 
 
 # ── analyze_from_parsed ──────────────────────────────────────
 
 
+@pytest.mark.slow
 class TestAnalyzeFromParsed:
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_works_with_preparsed_data(self):
-        from src.parsers.csv_parser import load_csv
-
-        parsed = load_csv(WHR_CSV)
-        orch = TradingAnalysisOrchestrator(tier="lite")
-        _patch_agents(orch)
-
-        result = orch.analyze_from_parsed("WHR", parsed)
+    def test_works_with_preparsed_data(self, lite_orch, whr_parsed):
+        result = lite_orch.analyze_from_parsed("WHR", whr_parsed)
 
         assert result["technical"]["current_price"] > 0
         assert result["metadata"]["symbol"] == "WHR"
         assert result["metadata"]["tier"] == "lite"
 
+    def test_analyze_from_parsed_benchmark(self, request, lite_orch, whr_parsed):
+        """Time the cheapest end-to-end path (needs pytest-benchmark)."""
+        pytest.importorskip("pytest_benchmark")
+        benchmark = request.getfixturevalue("benchmark")
+
+        result = benchmark(lite_orch.analyze_from_parsed, "WHR", whr_parsed)
+
+        assert result["errors"] == []
+        assert result["technical"]["current_price"] > 0
+
 
 # ── JSON serialization ───────────────────────────────────────
 
 
+@pytest.mark.slow
 class TestSerialization:
-    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"})
-    def test_result_is_json_serializable(self):
-        orch = TradingAnalysisOrchestrator(tier="standard")
-        _patch_agents(orch)
-
-        result = orch.analyze("WHR", WHR_CSV)
+    def test_result_is_json_serializable(self, standard_orch, whr_parsed):
+        result = standard_orch.analyze_from_parsed("WHR", whr_parsed)
 
         # This should not raise
-        json_str = json.dumps(result, default=str)
+        json_str = json.dumps(result)
         assert len(json_str) > 100
 
         # Should round-trip
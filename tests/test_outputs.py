@@ -235,6 +235,12 @@ class TestMarkdownGenerator:
         md = generate_markdown(sample_result_full)
         assert "Standard" in md
 
+    def test_header_uses_passed_timestamp(self, sample_result_full):
+        """A generated_at value in the result is used as the report timestamp."""
+        sample_result_full["generated_at"] = "2024-01-02 03:04:05"
+        md = generate_markdown(sample_result_full)
+        assert "**Generated:** 2024-01-02 03:04:05" in md
+
     def test_metadata_section(self, sample_result_full):
         """Metadata section has bars and timeframe."""
         md = generate_markdown(sample_result_full)
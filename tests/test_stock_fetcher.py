@@ -1,11 +1,13 @@
 """Tests for the yfinance stock data fetchers."""
 
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
 
 from src.utils.stock_fetcher import VALID_INTERVALS, VALID_PERIODS, fetch_stock_data
+from src.utils import yfinance_fetcher
 from src.utils.yfinance_fetcher import fetch_sr_timeframes
 
 
@@ -252,3 +254,106 @@ class TestFetchSRTimeframes:
 
         for call in mock_download.call_args_list:
             assert call.args[0] == "AAPL"
+
+
+class TestYFinanceFetchCache:
+    """Tests for the TTL cache in front of yfinance_fetcher.fetch_stock_data()."""
+
+    @pytest.fixture(autouse=True)
+    def _disk_cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(yfinance_fetcher, "DISK_CACHE_DIR", tmp_path)
+
+    def setup_method(self):
+        yfinance_fetcher.clear_fetch_cache()
+
+    def teardown_method(self):
+        yfinance_fetcher.clear_fetch_cache()
+
+    @patch("src.utils.yfinance_fetcher.yf.download")
+    def test_repeat_fetch_served_from_cache(self, mock_download):
+        mock_download.return_value = _make_yf_download_df()
+
+        first = yfinance_fetcher.fetch_stock_data("aapl", "1d")
+        first.df.loc[0, "close"] = -1.0
+        second = yfinance_fetcher.fetch_stock_data("AAPL", "1d")
+
+        assert mock_download.call_count == 1
+        assert second.df.loc[0, "close"] == 102
+
+    @patch("src.utils.yfinance_fetcher.time.time")
+    @patch("src.utils.yfinance_fetcher.time.monotonic")
+    @patch("src.utils.yfinance_fetcher.yf.download")
+    def test_expired_entry_refetched(self, mock_download, mock_monotonic, mock_time):
+        mock_download.return_value = _make_yf_download_df()
+        mock_monotonic.return_value = 1000.0
+        yfinance_fetcher.fetch_stock_data("AAPL", "1m")
+
+        # Expired both in memory and on disk
+        ttl = yfinance_fetcher.FETCH_TTL_SECONDS["1m"]
+        mock_monotonic.return_value = 1000.0 + ttl
+        mock_time.return_value = datetime.now().timestamp() + ttl
+        yfinance_fetcher.fetch_stock_data("AAPL", "1m")
+
+        assert mock_download.call_count == 2
+
+    @pytest.mark.skipif(not yfinance_fetcher.HAS_PYARROW, reason="pyarrow not installed")
+    @patch("src.utils.yfinance_fetcher.yf.download")
+    def test_disk_cache_survives_memory_clear(self, mock_download, tmp_path):
+        mock_download.return_value = _make_yf_download_df()
+        first = yfinance_fetcher.fetch_stock_data("AAPL", "1d")
+        assert list(tmp_path.glob("AAPL_1d_*.parquet"))
+
+        yfinance_fetcher.clear_fetch_cache()
+        second = yfinance_fetcher.fetch_stock_data("AAPL", "1d")
+
+        assert mock_download.call_count == 1
+        pd.testing.assert_frame_equal(first.df, second.df)
+        assert second.quality == first.quality
+
+    @pytest.mark.skipif(not yfinance_fetcher.HAS_PYARROW, reason="pyarrow not installed")
+    @patch("src.utils.yfinance_fetcher.yf.download")
+    def test_write_prunes_earlier_days(self, mock_download, tmp_path):
+        stale = tmp_path / "AAPL_1d_2000-01-01.parquet"
+        stale.write_bytes(b"old")
+        mock_download.return_value = _make_yf_download_df()
+
+        yfinance_fetcher.fetch_stock_data("MSFT", "1d")
+
+        assert not stale.exists()
+        assert list(tmp_path.glob("MSFT_1d_*.parquet"))
+
+    @patch("src.utils.yfinance_fetcher.yf.download")
+    def test_failed_write_skips_prune(self, mock_download, tmp_path, monkeypatch):
+        monkeypatch.setattr(yfinance_fetcher, "HAS_PYARROW", True)
+        monkeypatch.setattr(
+            pd.DataFrame, "to_parquet", MagicMock(side_effect=OSError("disk full"))
+        )
+        stale = tmp_path / "AAPL_1d_2000-01-01.parquet"
+        stale.write_bytes(b"old")
+        mock_download.return_value = _make_yf_download_df()
+
+        result = yfinance_fetcher.fetch_stock_data("MSFT", "1d")
+
+        assert len(result.df) == 20
+        assert stale.exists()
+
+    @patch("src.utils.yfinance_fetcher.yf.download")
+    def test_disk_cache_disabled(self, mock_download, tmp_path, monkeypatch):
+        monkeypatch.setattr(yfinance_fetcher, "DISK_CACHE_DIR", None)
+        mock_download.return_value = _make_yf_download_df()
+
+        yfinance_fetcher.fetch_stock_data("AAPL", "1d")
+        yfinance_fetcher.clear_fetch_cache()
+        yfinance_fetcher.fetch_stock_data("AAPL", "1d")
+
+        assert mock_download.call_count == 2
+        assert not list(tmp_path.iterdir())
+        assert yfinance_fetcher.clear_disk_cache() == 0
+
+    def test_clear_disk_cache(self, tmp_path):
+        (tmp_path / "AAPL_1d_2026-01-02.parquet").write_bytes(b"x")
+        (tmp_path / "MSFT_1h_2026-01-02.parquet").write_bytes(b"x")
+        (tmp_path / "notes.txt").write_text("keep")
+
+        assert yfinance_fetcher.clear_disk_cache() == 2
+        assert [p.name for p in tmp_path.iterdir()] == ["notes.txt"]
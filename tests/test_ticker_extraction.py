@@ -10,14 +10,18 @@ from httpx import ASGITransport, AsyncClient
 
 os.environ["RATE_LIMIT_ENABLED"] = "false"
 
+import api
 from api import app
 from src.parsers.csv_parser import _extract_symbol
+from src.utils.cache import AnalysisCache
 
 SAMPLE_CSV = Path(__file__).parent.parent / "data" / "samples" / "NYSE_WHR__1M.csv"
 
 
 @pytest_asyncio.fixture
-async def client():
+async def client(tmp_path, monkeypatch):
+    # Per-test result cache, so runs never share or leave data/cache files
+    monkeypatch.setattr(api, "cache", AnalysisCache(cache_dir=str(tmp_path / "cache")))
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac